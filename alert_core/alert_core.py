@@ -6,13 +6,15 @@ from alert_core.alert_enrichment_service import AlertEnrichmentService
 from alert_core.alert_evaluation_service import AlertEvaluationService
 from alert_core.threshold_service import ThresholdService
 from alert_core.alert_store import AlertStore
+from alert_core.alert_rules import AlertRuleService
 from core.core_imports import log
+from core.cancellation import StepCancelled, check_cancelled
 
 class AlertCore:
     def __init__(self, data_locker, config_loader=None):
         self.data_locker = data_locker
         self.config_loader = config_loader or (
-            lambda: self.data_locker.system.get_var("alert_limits") or {}
+            lambda: self.data_locker.system.get_var("alert_limits", readonly=True) or {}
         )
         self.repo = AlertStore(data_locker, self.config_loader)
         self.enricher = AlertEnrichmentService(data_locker)
@@ -20,6 +22,7 @@ class AlertCore:
         self.evaluator = AlertEvaluationService(threshold_service)
         self.alert_store = AlertStore(data_locker, self.config_loader)
         self.evaluator.inject_repo(self.repo)  # ⚡️ enable DB updates
+        self.rules = AlertRuleService(data_locker)
 
     async def create_alert(self, alert_dict: dict) -> bool:
         try:
@@ -40,7 +43,7 @@ class AlertCore:
             enriched = await self.enricher.enrich(alert)
             evaluated = self.evaluator.evaluate(enriched)
 
-            self.evaluator.update_alert_level(evaluated.id, evaluated.level)
+            self.evaluator.update_alert_level(evaluated.id, evaluated.level, evaluated.evaluated_value)
             self.evaluator.update_alert_evaluated_value(evaluated.id, evaluated.evaluated_value)
 
             log.success(
@@ -104,9 +107,10 @@ class AlertCore:
         results = []
 
         for alert in enriched:
+            check_cancelled()
             try:
                 evaluated = self.evaluator.evaluate(alert)
-                self.evaluator.update_alert_level(evaluated.id, evaluated.level)
+                self.evaluator.update_alert_level(evaluated.id, evaluated.level, evaluated.evaluated_value)
                 self.evaluator.update_alert_evaluated_value(evaluated.id, evaluated.evaluated_value)
 
                 results.append(evaluated)
@@ -127,17 +131,36 @@ class AlertCore:
         log.success(f"✅ Completed enrich+evaluate for {len(results)} alerts", source="AlertCore")
         return results
 
-    async def process_alerts(self):
+    async def process_alerts(self, assets=None):
+        """
+        Enrich and evaluate active alerts. ``assets`` limits evaluation to
+        alerts on those assets plus alerts with no asset (portfolio-wide).
+        """
         log.banner("🔍 Processing Alerts: Enrich + Evaluate")
 
         alerts = self.repo.get_active_alerts()
+        if alerts and assets is not None:
+            wanted = {str(a).upper() for a in assets}
+            alerts = [a for a in alerts if not _alert_asset(a) or _alert_asset(a) in wanted]
         if not alerts:
             log.warning("⚠️ No active alerts found", source="AlertCore")
             return []
 
         evaluated_alerts = await self.enrich_and_evaluate_alerts(alerts)
+        self.evaluate_rules()
         return evaluated_alerts
 
+    def evaluate_rules(self) -> list:
+        """
+        Runs user-defined rule expressions (``alert_rules`` system var) in batch
+        across all active positions. Compiled rules are cached between cycles.
+        """
+        try:
+            return self.rules.run()
+        except Exception as e:
+            log.error(f"❌ Rule evaluation failed: {e}", source="AlertCore")
+            return []
+
     def create_position_alerts(self):
         self.alert_store.create_position_alerts()
 
@@ -201,6 +224,7 @@ class AlertCore:
 
             enriched = await self.enricher.enrich_all(alerts)
             for alert in enriched:
+                check_cancelled()
                 try:
                     evaluated = self.evaluator.evaluate(alert)
                     self.evaluator.update_alert_evaluated_value(evaluated.id, evaluated.evaluated_value)
@@ -213,5 +237,14 @@ class AlertCore:
 
             log.success("✅ Completed evaluated value update", source="AlertCore")
 
+        except StepCancelled as e:
+            log.warning(f"⏹️ update_evaluated_values() cancelled: {e}", source="AlertCore")
         except Exception as e:
             log.error(f"💥 update_evaluated_values() failed: {e}", source="AlertCore")
+
+
+def _alert_asset(alert) -> str:
+    value = alert.get("asset") if isinstance(alert, dict) else getattr(alert, "asset", None)
+    if not value:
+        value = alert.get("asset_type") if isinstance(alert, dict) else getattr(alert, "asset_type", None)
+    return str(value).upper() if value else ""
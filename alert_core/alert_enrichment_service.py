@@ -10,10 +10,19 @@ import asyncio
 import re
 from utils.travel_percent_logger import log_travel_percent_comparison
 from calc_core.calculation_core import CalculationCore
-from alert_core.alert_utils import normalize_alert_fields
+from alert_core.alert_utils import normalize_alert_fields, normalize_alert_type
 from data.alert import AlertType
 from core.logging import log
 
+# Portfolio alert type → key in DLPositionManager.get_portfolio_totals()
+PORTFOLIO_METRIC_KEYS = {
+    AlertType.TotalValue: "total_value",
+    AlertType.TotalSize: "total_size",
+    AlertType.AvgLeverage: "avg_leverage",
+    AlertType.AvgTravelPercent: "avg_travel_percent",
+    AlertType.ValueToCollateralRatio: "value_to_collateral_ratio",
+    AlertType.TotalHeat: "avg_heat_index",
+}
 
 
 class AlertEnrichmentService:
@@ -63,9 +72,19 @@ class AlertEnrichmentService:
 
     async def _enrich_portfolio(self, alert):
         try:
-            # Simplified enrichment for test environment
-            alert.evaluated_value = 0.0
-            log.debug("Portfolio enrichment stub", source="AlertEnrichment")
+            alert_type = normalize_alert_type(alert.alert_type)
+            metric_key = PORTFOLIO_METRIC_KEYS.get(alert_type)
+            if not metric_key:
+                log.warning(f"⚠️ Unsupported portfolio alert type: {alert.alert_type}", source="AlertEnrichment")
+                return alert
+
+            # O(1) read from the incremental totals cache kept by DLPositionManager
+            totals = self.data_locker.positions.get_portfolio_totals() or {}
+            alert.evaluated_value = float(totals.get(metric_key) or 0.0)
+            log.success(
+                f"✅ Enriched Portfolio Alert {alert.id} {metric_key}={alert.evaluated_value}",
+                source="AlertEnrichment",
+            )
             return alert
 
         except Exception as e:
@@ -124,19 +124,29 @@ class AlertEvaluationService:
                 "alert_id": alert_id, "error": str(e)
             })
 
-    def update_alert_level(self, alert_id: str, level):
+    def update_alert_level(self, alert_id: str, level, evaluated_value=None):
+        """Persist ``level`` and append to the level history when it changed."""
         if not self.repo:
             log.error("❌ Alert repository not injected", source="AlertEvaluation")
             return
         try:
             level_str = level.value if hasattr(level, "value") else str(level).capitalize()
-            cursor = self.repo.data_locker.db.get_cursor()
+            db = self.repo.data_locker.db
+            cursor = db.get_cursor()
+            row = cursor.execute("SELECT level FROM alerts WHERE id = ?", (alert_id,)).fetchone()
+            previous = row["level"] if row else None
+            if row is not None and previous == level_str:
+                return
+
             cursor.execute(
                 "UPDATE alerts SET level = ? WHERE id = ?", (level_str, alert_id)
             )
-            self.repo.data_locker.db.commit()
+            history = getattr(self.repo.data_locker, "alert_history", None)
+            if history is not None and row is not None:
+                history.record_transition(alert_id, previous, level_str, evaluated_value, commit=False)
+            db.commit()
             log.success("🧪 Updated alert level", source="AlertEvaluation", payload={
-                "alert_id": alert_id, "level": level_str
+                "alert_id": alert_id, "level": level_str, "previous_level": previous
             })
         except Exception as e:
             log.error("❌ Failed to update alert level", source="AlertEvaluation", payload={
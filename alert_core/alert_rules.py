@@ -0,0 +1,359 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import ast
+import hashlib
+import operator
+
+from core.logging import log
+
+
+class RuleSyntaxError(ValueError):
+    """Raised when a rule expression uses syntax outside the rule language."""
+
+
+_COMPARE_OPS = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+}
+
+_FUNCTIONS = {"abs": abs, "min": min, "max": max}
+
+# Dotted roots resolve against a nested mapping in the evaluation context,
+# e.g. ``portfolio.total_value`` or ``prices.BTC``.
+NAMESPACES = ("portfolio", "prices")
+
+
+def _safe_compare(op, left, right):
+    if left is None or right is None:
+        if op is operator.eq:
+            return left is right
+        if op is operator.ne:
+            return left is not right
+        return False
+    try:
+        return op(left, right)
+    except TypeError:
+        return False
+
+
+def _safe_arith(op, left, right):
+    # Numbers only: ``"a" * 10**9`` and friends must not allocate.
+    if not isinstance(left, (int, float)) or not isinstance(right, (int, float)):
+        return None
+    try:
+        return op(left, right)
+    except (TypeError, ZeroDivisionError):
+        return None
+
+
+class CompiledRule:
+    """A rule expression compiled once into a tree of closures."""
+
+    __slots__ = ("expression", "rule_hash", "fields", "_fn")
+
+    def __init__(self, expression: str, rule_hash: str, fields: frozenset, fn):
+        self.expression = expression
+        self.rule_hash = rule_hash
+        self.fields = fields
+        self._fn = fn
+
+    def __call__(self, context: dict) -> bool:
+        try:
+            return bool(self._fn(context))
+        except Exception:
+            return False
+
+    def matches(self, contexts) -> list:
+        """Evaluate against many contexts; returns the matching contexts."""
+        fn = self._fn
+        hits = []
+        for ctx in contexts:
+            try:
+                if fn(ctx):
+                    hits.append(ctx)
+            except Exception:
+                continue
+        return hits
+
+    def __repr__(self):
+        return f"CompiledRule({self.expression!r})"
+
+
+class RuleCompiler:
+    """
+    Parses rule expressions such as ``travel_percent < -40 and heat_index > 50``
+    into closures. Only comparisons, boolean logic, arithmetic (on numbers
+    only), numeric/string literals, field names and ``abs``/``min``/``max`` are accepted; anything
+    else raises :class:`RuleSyntaxError`. Compiled rules are cached by hash so
+    each distinct expression is parsed once per process.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    @staticmethod
+    def rule_hash(expression: str) -> str:
+        normalized = " ".join(str(expression).split())
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def compile(self, expression: str) -> CompiledRule:
+        key = self.rule_hash(expression)
+        rule = self._cache.get(key)
+        if rule is not None:
+            return rule
+
+        try:
+            tree = ast.parse(str(expression).strip(), mode="eval")
+        except SyntaxError as e:
+            raise RuleSyntaxError(f"Invalid rule '{expression}': {e.msg}") from e
+
+        fields = set()
+        fn = self._build(tree.body, fields)
+        rule = CompiledRule(expression, key, frozenset(fields), fn)
+        self._cache[key] = rule
+        log.debug(f"🧩 Compiled alert rule {key[:8]}: {expression}", source="RuleCompiler")
+        return rule
+
+    def clear(self):
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+    # --------------------------------------------------------------
+    def _build(self, node, fields):
+        if isinstance(node, ast.BoolOp):
+            parts = [self._build(v, fields) for v in node.values]
+            if isinstance(node.op, ast.And):
+                return lambda ctx: all(p(ctx) for p in parts)
+            return lambda ctx: any(p(ctx) for p in parts)
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._build(node.operand, fields)
+            if isinstance(node.op, ast.Not):
+                return lambda ctx: not operand(ctx)
+            if isinstance(node.op, ast.USub):
+                if isinstance(node.operand, ast.Constant) and isinstance(node.operand.value, (int, float)):
+                    value = -node.operand.value
+                    return lambda ctx: value
+
+                def neg(ctx):
+                    v = operand(ctx)
+                    return None if v is None else -v
+                return neg
+            if isinstance(node.op, ast.UAdd):
+                return operand
+
+        if isinstance(node, ast.Compare):
+            left = self._build(node.left, fields)
+            links = []
+            for op_node, comparator in zip(node.ops, node.comparators):
+                op = _COMPARE_OPS.get(type(op_node))
+                if op is None:
+                    raise RuleSyntaxError(f"Unsupported comparison: {type(op_node).__name__}")
+                links.append((op, self._build(comparator, fields)))
+
+            if len(links) == 1:
+                op, right = links[0]
+                return lambda ctx: _safe_compare(op, left(ctx), right(ctx))
+
+            def chained(ctx):
+                current = left(ctx)
+                for op, right in links:
+                    nxt = right(ctx)
+                    if not _safe_compare(op, current, nxt):
+                        return False
+                    current = nxt
+                return True
+            return chained
+
+        if isinstance(node, ast.BinOp):
+            op = _BIN_OPS.get(type(node.op))
+            if op is None:
+                raise RuleSyntaxError(f"Unsupported operator: {type(node.op).__name__}")
+            left = self._build(node.left, fields)
+            right = self._build(node.right, fields)
+            return lambda ctx: _safe_arith(op, left(ctx), right(ctx))
+
+        if isinstance(node, ast.Constant):
+            if not isinstance(node.value, (int, float, str, bool, type(None))):
+                raise RuleSyntaxError(f"Unsupported literal: {node.value!r}")
+            value = node.value
+            return lambda ctx: value
+
+        if isinstance(node, ast.Name):
+            name = node.id
+            if name in NAMESPACES:
+                raise RuleSyntaxError(f"'{name}' needs a field, e.g. {name}.<field>")
+            fields.add(name)
+            return lambda ctx: ctx.get(name)
+
+        if isinstance(node, ast.Attribute):
+            if not isinstance(node.value, ast.Name) or node.value.id not in NAMESPACES:
+                raise RuleSyntaxError("Dotted names must start with " + " or ".join(NAMESPACES))
+            root, attr = node.value.id, node.attr
+            fields.add(f"{root}.{attr}")
+            return lambda ctx: (ctx.get(root) or {}).get(attr)
+
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in _FUNCTIONS or node.keywords:
+                raise RuleSyntaxError("Only abs(), min() and max() calls are allowed")
+            func = _FUNCTIONS[node.func.id]
+            args = [self._build(a, fields) for a in node.args]
+
+            def call(ctx):
+                values = [a(ctx) for a in args]
+                if any(v is None for v in values):
+                    return None
+                return func(*values)
+            return call
+
+        raise RuleSyntaxError(f"Unsupported expression element: {type(node).__name__}")
+
+
+class AlertRuleService:
+    """
+    Evaluates user-defined rules stored in the ``alert_rules`` system var
+    across all active positions in one pass per rule.
+
+    Each rule is a dict: ``{"id", "name", "expression", "level", "enabled"}``.
+    Position columns are available by name; portfolio totals under
+    ``portfolio.<key>`` and latest prices under ``prices.<ASSET>``. ``price``
+    is the current price of the position's own asset.
+
+    :meth:`run` keeps one level per (rule, position) in the alert level
+    history under ``rule:<rule_id>:<position_id>``: a match moves it to the
+    rule's ``level`` and a cleared match back to ``Normal``, so rule hits
+    show up beside regular alert transitions and are recorded once per change.
+    """
+
+    RULES_VAR = "alert_rules"
+    HISTORY_PREFIX = "rule:"
+    CLEARED_LEVEL = "Normal"
+
+    def __init__(self, data_locker, compiler: RuleCompiler = None):
+        self.data_locker = data_locker
+        self.compiler = compiler or RuleCompiler()
+
+    def load_rules(self) -> list:
+        try:
+            rules = self.data_locker.system.get_var(self.RULES_VAR, readonly=True)
+        except Exception as e:
+            log.error(f"❌ Failed to load alert rules: {e}", source="AlertRuleService")
+            return []
+        return rules if isinstance(rules, list) else []
+
+    def compile_rules(self, rules: list) -> list:
+        compiled = []
+        for rule in rules:
+            if not isinstance(rule, dict) or not rule.get("expression"):
+                continue
+            if rule.get("enabled") is False:
+                continue
+            try:
+                compiled.append((rule, self.compiler.compile(rule["expression"])))
+            except RuleSyntaxError as e:
+                log.warning(f"⚠️ Skipping rule {rule.get('id') or rule.get('name')}: {e}",
+                            source="AlertRuleService")
+        return compiled
+
+    def build_contexts(self, positions: list, portfolio: dict = None, prices: dict = None) -> list:
+        portfolio = portfolio or {}
+        prices = prices or {}
+        contexts = []
+        for pos in positions:
+            ctx = dict(pos)
+            ctx["portfolio"] = portfolio
+            ctx["prices"] = prices
+            ctx.setdefault("price", prices.get(pos.get("asset_type")) or pos.get("current_price"))
+            contexts.append(ctx)
+        return contexts
+
+    def evaluate(self, positions: list, portfolio: dict = None, prices: dict = None,
+                 rules: list = None) -> list:
+        """Return one hit dict per (rule, position) match."""
+        compiled = self.compile_rules(self.load_rules() if rules is None else rules)
+        if not compiled or not positions:
+            return []
+
+        contexts = self.build_contexts(positions, portfolio, prices)
+        hits = []
+        for rule, fn in compiled:
+            for ctx in fn.matches(contexts):
+                hits.append({
+                    "rule_id": rule.get("id") or fn.rule_hash[:12],
+                    "rule_name": rule.get("name"),
+                    "expression": fn.expression,
+                    "level": self.normalize_level(rule.get("level")),
+                    "position_id": ctx.get("id"),
+                    "asset_type": ctx.get("asset_type"),
+                })
+        return hits
+
+    @staticmethod
+    def normalize_level(level) -> str:
+        level = str(level or "High").strip().capitalize()
+        return level if level in ("Low", "Medium", "High") else "High"
+
+    @classmethod
+    def history_id(cls, rule_id, position_id) -> str:
+        return f"{cls.HISTORY_PREFIX}{rule_id}:{position_id}"
+
+    def record_hits(self, hits: list) -> list:
+        """Write level transitions for new, changed and cleared hits; returns the transitions."""
+        history = getattr(self.data_locker, "alert_history", None)
+        if history is None:
+            return []
+        previous = history.get_latest_levels(self.HISTORY_PREFIX)
+        current = {self.history_id(h["rule_id"], h["position_id"]): h["level"] for h in hits}
+        for alert_id, level in previous.items():
+            if level != self.CLEARED_LEVEL:
+                current.setdefault(alert_id, self.CLEARED_LEVEL)
+
+        transitions = []
+        for alert_id, level in current.items():
+            before = previous.get(alert_id)
+            if level == (before or self.CLEARED_LEVEL):
+                continue
+            history.record_transition(alert_id, before, level, commit=False)
+            transitions.append({"alert_id": alert_id, "previous_level": before, "level": level})
+        if transitions:
+            self.data_locker.db.commit()
+        return transitions
+
+    def run(self) -> list:
+        """Load rules, positions, totals and prices from the DataLocker, evaluate and record hits."""
+        rules = self.load_rules()
+        if not rules:
+            return []
+        dl = self.data_locker
+        positions = dl.positions.get_active_positions()
+        portfolio = dl.positions.get_portfolio_totals()
+        prices = {asset: row.get("current_price") for asset, row in dl.prices.get_latest_prices().items()}
+
+        hits = self.evaluate(positions, portfolio, prices, rules=rules)
+        for hit in hits:
+            log.warning(
+                f"🚩 Rule '{hit['rule_name'] or hit['rule_id']}' matched position {hit['position_id']}",
+                source="AlertRuleService",
+                payload=hit,
+            )
+        transitions = self.record_hits(hits)
+        log.info(f"🧩 Evaluated {len(rules)} rules over {len(positions)} positions → {len(hits)} hits, "
+                 f"{len(transitions)} level changes",
+                 source="AlertRuleService")
+        return hits
@@ -19,7 +19,7 @@ from alert_core.alert_utils import log_alert_summary
 from uuid import uuid4
 from core.logging import log
 from datetime import datetime
-from data.alert import Alert, AlertLevel
+from data.alert import Alert, AlertLevel, AlertRecord
 import sqlite3
 
 PORTFOLIO_POSITION_ID = "619"
@@ -58,7 +58,7 @@ class AlertStore:
             self.config_loader = config_loader
         else:
             self.config_loader = (
-                lambda: self.data_locker.system.get_var("alert_limits") or {}
+                lambda: self.data_locker.system.get_var("alert_limits", readonly=True) or {}
             )
 
     @staticmethod
@@ -178,31 +178,34 @@ class AlertStore:
     def get_all_alerts(self) -> list:
         return self.get_alerts()
 
-    def get_active_alerts(self) -> list[Alert]:
-        alerts_raw = self.get_alerts()
+    def get_alert_records(self, status: str = None) -> list[AlertRecord]:
+        """Return alerts as slotted :class:`AlertRecord` objects.
 
-        if not alerts_raw:
-            log.warning("⚠️ No alerts found in DB", source="AlertStore")
+        Rows come from our own table, so they skip Pydantic validation. When
+        ``status`` is given the filter runs in SQL rather than in Python.
+        """
+        try:
+            cursor = self.data_locker.db.get_cursor()
+            if status is None:
+                cursor.execute("SELECT * FROM alerts ORDER BY created_at DESC")
+            else:
+                cursor.execute(
+                    "SELECT * FROM alerts WHERE status = ? ORDER BY created_at DESC",
+                    (status,),
+                )
+            rows = cursor.fetchall()
+        except Exception as e:
+            log.error(f"❌ Failed to fetch alert records", source="AlertStore", payload={"error": str(e)})
             return []
 
-        active_alerts = []
-        for a in alerts_raw:
-            try:
-                if a.get("status") != "Active":
-                    continue
-
-                level = a.get("level", "Normal").strip().capitalize()
-                if level not in {"Normal", "Low", "Medium", "High"}:
-                    a["level"] = "Normal"
-                else:
-                    a["level"] = level
+        return AlertRecord.from_rows(rows)
 
-                if "starting_value" not in a:
-                    a["starting_value"] = a.get("trigger_value", 0)
+    def get_active_alerts(self) -> list[AlertRecord]:
+        active_alerts = self.get_alert_records(status=Status.ACTIVE.value)
 
-                active_alerts.append(Alert(**a))  # ✅ convert dict → Alert model
-            except Exception as e:
-                log.warning(f"⚠️ Failed to parse alert {a.get('id', '?')} — {e}", source="AlertStore")
+        if not active_alerts:
+            log.warning("⚠️ No active alerts found in DB", source="AlertStore")
+            return []
 
         log.info(f"✅ Loaded {len(active_alerts)} active alerts", source="AlertStore")
         return active_alerts
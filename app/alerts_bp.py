@@ -256,6 +256,42 @@ def monitor_data():
         logger.error(f"Failed to load alerts for monitor: {e}", exc_info=True)
         return jsonify({"alerts": [], "error": str(e)}), 500
 
+@alerts_bp.route('/history/<alert_id>', methods=['GET'])
+def alert_level_history(alert_id):
+    """
+    API endpoint returning level transitions for one alert (trend view).
+    Optional ``since``/``until`` ISO timestamps and ``limit`` query params.
+    """
+    try:
+        dl = current_app.data_locker
+        history = dl.alert_history.get_history(
+            alert_id,
+            since=request.args.get('since'),
+            until=request.args.get('until'),
+            limit=request.args.get('limit', type=int),
+        )
+        return jsonify({"alert_id": alert_id, "history": history})
+    except Exception as e:
+        logger.error(f"Failed to load history for alert {alert_id}: {e}", exc_info=True)
+        return jsonify({"alert_id": alert_id, "history": [], "error": str(e)}), 500
+
+
+@alerts_bp.route('/history', methods=['GET'])
+def recent_alert_transitions():
+    """
+    API endpoint returning the newest level transitions across all alerts.
+    """
+    try:
+        dl = current_app.data_locker
+        transitions = dl.alert_history.get_recent_transitions(
+            since=request.args.get('since'),
+            limit=request.args.get('limit', 100, type=int),
+        )
+        return jsonify({"transitions": transitions})
+    except Exception as e:
+        logger.error(f"Failed to load alert transitions: {e}", exc_info=True)
+        return jsonify({"transitions": [], "error": str(e)}), 500
+
 @alerts_bp.route('/update_config', methods=['POST'])
 def update_config():
     """Update alert limits configuration."""
@@ -1,7 +1,6 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import asyncio
 from flask import Blueprint, render_template, jsonify, request, current_app
 from typing import Optional
 from data.models import AlertThreshold
@@ -9,6 +8,7 @@ from data.data_locker import DataLocker
 from positions.position_core import PositionCore
 from core.core_imports import DB_PATH
 from cyclone.cyclone_engine import Cyclone
+from cyclone.cyclone_bp import accepted, run_in_background
 
 from datetime import datetime
 from zoneinfo import ZoneInfo
@@ -242,39 +242,37 @@ def api_dashboard_cards():
     rendered_cards = render_template("dashboard_top.html", **context)
     return jsonify({"success": True, "html": rendered_cards})
 
+# Cyclone runs go to the shared worker (see cyclone_bp) and return 202 with a
+# job to poll at /cyclone/jobs/<id>; a full cycle can take minutes.
 @dashboard_bp.route('/cyclone_market_update', methods=['POST'])
 def cyclone_market_update():
     try:
-        asyncio.run(current_app.cyclone.run_market_updates())
-        # Refresh the main DataLocker connection so new data is visible
-        current_app.data_locker.db.close()
-        return jsonify({"success": True})
+        job = run_in_background(current_app.cyclone.run_market_updates, name="MarketUpdate")
+        return accepted("Market Updates Started.", job)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
 @dashboard_bp.route('/cyclone_sync', methods=['POST'])
 def cyclone_sync():
     try:
-        asyncio.run(current_app.cyclone.run_composite_position_pipeline())
-        current_app.data_locker.db.close()
-        return jsonify({"success": True})
+        job = run_in_background(current_app.cyclone.run_composite_position_pipeline, name="PositionSync")
+        return accepted("Position Sync Started.", job)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
 @dashboard_bp.route('/cyclone_full_cycle', methods=['POST'])
 def cyclone_full_cycle():
     try:
-        asyncio.run(current_app.cyclone.run_cycle())
-        current_app.data_locker.db.close()
-        return jsonify({"success": True})
+        cyclone = current_app.cyclone
+        job = run_in_background(lambda: cyclone.run_exclusive_cycle(owner="sonic_app"), name="FullCycle")
+        return accepted("Full Cycle Started.", job)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
 
 @dashboard_bp.route('/cyclone_wipe_all', methods=['POST'])
 def cyclone_wipe_all():
     try:
-        asyncio.run(current_app.cyclone.run_clear_all_data())
-        current_app.data_locker.db.close()
-        return jsonify({"success": True})
+        job = run_in_background(current_app.cyclone.run_clear_all_data, name="ClearAllData")
+        return accepted("Clear All Data Started.", job)
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
@@ -7,7 +7,7 @@ Description:
     This module handles:
       - Rendering price charts for assets (BTC, ETH, SOL, SP500) over a specified timeframe.
       - Displaying a price list and manual price updates.
-      - Triggering asynchronous price updates via PriceMonitor.
+      - Triggering price updates via PriceSyncService (shared quote cache).
 
     It is structured similarly to our positions and alerts blueprints for consistent
     separation of concerns.
@@ -15,14 +15,15 @@ Description:
 
 import logging
 import sqlite3
-import asyncio
 from datetime import datetime, timedelta
 
 from flask import Blueprint, request, jsonify, render_template, redirect, url_for, flash, current_app
 
 # Import configuration constants and modules
 from data.data_locker import DataLocker
-from monitor.price_monitor import PriceMonitor
+from prices.price_sync_service import PriceSyncService
+from core.response_cache import get_response_cache
+from core.asset_registry import get_asset_registry
 from core.core_imports import CONFIG_PATH, DB_PATH, retry_on_locked
 
 
@@ -35,12 +36,8 @@ def _get_top_prices_for_assets(db_path, assets):
     Retrieve the latest price for each asset.
     """
     dl = current_app.data_locker
-    top_prices = []
-    for asset in assets:
-        row = dl.prices.get_latest_price(asset)
-        if row:
-            top_prices.append(row)
-    return top_prices
+    latest = dl.prices.get_latest_prices(assets)
+    return [latest[asset] for asset in assets if asset in latest]
 
 
 def _get_recent_prices(db_path, limit=15):
@@ -63,8 +60,10 @@ logger.setLevel(logging.DEBUG)
 # ---------------------------------------------------------------------------
 prices_bp = Blueprint("prices", __name__, template_folder="templates")
 
-# Define the asset list to include S&P500 as well as crypto assets.
-ASSETS_LIST = ["BTC", "ETH", "SOL", "SP500"]
+
+def _tracked_assets():
+    """Dashboard assets from the asset registry (config/assets.json)."""
+    return get_asset_registry().symbols()
 
 
 # ---------------------------------------------------------------------------
@@ -73,7 +72,7 @@ ASSETS_LIST = ["BTC", "ETH", "SOL", "SP500"]
 @prices_bp.route("/charts", methods=["GET"])
 def price_charts():
     """
-    Render price charts for BTC, ETH, SOL, and SP500 over a specified timeframe.
+    Render price charts for every tracked asset over a specified timeframe.
     URL Params:
       - hours: (optional, default=6) Number of hours to look back.
     """
@@ -84,24 +83,24 @@ def price_charts():
         conn = sqlite3.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
-        chart_data = {asset: [] for asset in ASSETS_LIST}
-        for asset in ASSETS_LIST:
-            cur.execute(
-                """
-                SELECT current_price, last_update_time
-                FROM prices
-                WHERE asset_type = ? AND last_update_time >= ?
-                ORDER BY last_update_time ASC
-                """,
-                (asset, cutoff_iso)
-            )
-            rows = cur.fetchall()
-            for row in rows:
-                iso_str = row["last_update_time"]
-                price = float(row["current_price"])
-                dt_obj = datetime.fromisoformat(iso_str)
-                epoch_ms = int(dt_obj.timestamp() * 1000)
-                chart_data[asset].append([epoch_ms, price])
+        assets = _tracked_assets()
+        chart_data = {asset: [] for asset in assets}
+        marks = ",".join("?" for _ in assets)
+        cur.execute(
+            f"""
+            SELECT asset_type, current_price, last_update_time
+            FROM prices
+            WHERE asset_type IN ({marks}) AND last_update_time >= ?
+            ORDER BY last_update_time ASC
+            """,
+            (*assets, cutoff_iso)
+        )
+        for row in cur.fetchall():
+            iso_str = row["last_update_time"]
+            price = float(row["current_price"])
+            dt_obj = datetime.fromisoformat(iso_str)
+            epoch_ms = int(dt_obj.timestamp() * 1000)
+            chart_data[row["asset_type"]].append([epoch_ms, price])
         conn.close()
         return render_template("price_charts.html", chart_data=chart_data, timeframe=hours)
     except Exception as e:
@@ -149,7 +148,7 @@ def price_list():
             return redirect(url_for("prices.price_list"))
     else:
         try:
-            top_prices = _get_top_prices_for_assets(DB_PATH, ASSETS_LIST)
+            top_prices = _get_top_prices_for_assets(DB_PATH, _tracked_assets())
             recent_prices = _get_recent_prices(DB_PATH, limit=15)
             api_counters = dl.read_api_counters()
             return render_template("prices.html", prices=top_prices, recent_prices=recent_prices,
@@ -165,14 +164,17 @@ def price_list():
 @prices_bp.route("/update", methods=["POST"])
 def update_prices_route():
     """
-    Triggers an asynchronous update of price data using PriceMonitor.
+    Triggers a price sync through PriceSyncService. Quotes come from the
+    shared response cache, so repeated clicks inside the TTL do not hit the
+    providers again.
     Expects an optional query/form parameter 'source' to indicate the origin.
     """
     try:
         source = request.args.get("source") or request.form.get("source") or "API"
-        pm = PriceMonitor(db_path=DB_PATH, config_path=CONFIG_PATH)
-        asyncio.run(pm.update_prices())
         dl = get_locker()
+        sync = PriceSyncService(dl).run_full_price_sync(source=source)
+        if not sync.get("success"):
+            return jsonify({"status": "error", "message": sync.get("error", "Price sync failed")}), 502
         now = datetime.now()
         dl.set_last_update_times(
             prices_dt=now,
@@ -181,7 +183,8 @@ def update_prices_route():
         return jsonify({
             "status": "ok",
             "message": "Prices updated successfully",
-            "last_update": now.isoformat()
+            "last_update": now.isoformat(),
+            "cache": get_response_cache().snapshot()
         })
     except Exception as e:
         logger.exception("Error updating prices: %s", e)
@@ -196,20 +199,15 @@ def update_prices_route():
 def prices_data_api():
     """
     Provides an API endpoint that returns:
-      - Mini price data for each asset (BTC, ETH, SOL, SP500)
+      - Mini price data for each tracked asset
       - Full price list (top prices)
     """
     try:
-        dl = current_app.data_locker
-        mini_prices = []
-        for asset in ASSETS_LIST:
-            row = dl.prices.get_latest_price(asset)
-            if row:
-                mini_prices.append({
-                    "asset_type": row["asset_type"],
-                    "current_price": float(row["current_price"])
-                })
-        prices_list = _get_top_prices_for_assets(DB_PATH, ASSETS_LIST)
+        prices_list = _get_top_prices_for_assets(DB_PATH, _tracked_assets())
+        mini_prices = [
+            {"asset_type": row["asset_type"], "current_price": float(row["current_price"])}
+            for row in prices_list
+        ]
         return jsonify({
             "mini_prices": mini_prices,
             "prices": prices_list
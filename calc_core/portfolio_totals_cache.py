@@ -0,0 +1,120 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from core.logging import log
+
+
+class PortfolioTotalsCache:
+    """
+    Running portfolio totals kept in step with position writes.
+
+    Each ACTIVE position contributes a fixed set of terms to the running sums
+    (size, value, collateral, size-weighted leverage and travel percent, heat).
+    Upserting or closing a position swaps its contribution in O(1), so
+    :meth:`totals` never has to walk every position. The output keys match
+    :meth:`CalcServices.calculate_totals` with ratio/heat extras added.
+    """
+
+    ACTIVE_STATUS = "ACTIVE"
+
+    def __init__(self):
+        self._contributions = {}
+        self.is_loaded = False
+        self._reset_sums()
+
+    def _reset_sums(self):
+        self._size = 0.0
+        self._value = 0.0
+        self._collateral = 0.0
+        self._leverage_weighted = 0.0
+        self._travel_weighted = 0.0
+        self._heat = 0.0
+        self._heat_count = 0
+
+    @staticmethod
+    def _contribution(position: dict) -> tuple:
+        size = float(position.get("size") or 0.0)
+        leverage = float(position.get("leverage") or 0.0)
+        travel_percent = float(position.get("travel_percent") or 0.0)
+        heat_index = float(position.get("heat_index") or 0.0)
+        return (
+            size,
+            float(position.get("value") or 0.0),
+            float(position.get("collateral") or 0.0),
+            leverage * size,
+            travel_percent * size,
+            heat_index,
+            1 if heat_index else 0,
+        )
+
+    def _apply(self, contrib: tuple, sign: int):
+        size, value, collateral, lev_w, travel_w, heat, heat_count = contrib
+        self._size += sign * size
+        self._value += sign * value
+        self._collateral += sign * collateral
+        self._leverage_weighted += sign * lev_w
+        self._travel_weighted += sign * travel_w
+        self._heat += sign * heat
+        self._heat_count += sign * heat_count
+
+    # --------------------------------------------------------------
+    def load(self, positions: list):
+        """Rebuild the cache from a full list of positions."""
+        self._contributions = {}
+        self._reset_sums()
+        for pos in positions:
+            self.upsert(pos)
+        self.is_loaded = True
+        log.debug(
+            f"Portfolio totals cache loaded ({len(self._contributions)} active)",
+            source="PortfolioTotalsCache",
+        )
+
+    def upsert(self, position: dict):
+        """Add or replace a position's contribution (drops it if not ACTIVE)."""
+        pos_id = position.get("id")
+        if pos_id is None:
+            return
+        old = self._contributions.pop(pos_id, None)
+        if old is not None:
+            self._apply(old, -1)
+
+        status = str(position.get("status") or self.ACTIVE_STATUS).upper()
+        if status != self.ACTIVE_STATUS:
+            return
+        contrib = self._contribution(position)
+        self._contributions[pos_id] = contrib
+        self._apply(contrib, 1)
+
+    def remove(self, pos_id: str):
+        """Drop a closed or deleted position."""
+        old = self._contributions.pop(pos_id, None)
+        if old is not None:
+            self._apply(old, -1)
+
+    def clear(self):
+        self._contributions = {}
+        self._reset_sums()
+        self.is_loaded = True
+
+    def invalidate(self):
+        """Force the next reader to rebuild from the database."""
+        self.is_loaded = False
+
+    def __len__(self):
+        return len(self._contributions)
+
+    def totals(self) -> dict:
+        size = self._size
+        collateral = self._collateral
+        return {
+            "total_size": size,
+            "total_value": self._value,
+            "total_collateral": collateral,
+            "avg_leverage": self._leverage_weighted / size if size > 0 else 0.0,
+            "avg_travel_percent": self._travel_weighted / size if size > 0 else 0.0,
+            "avg_heat_index": self._heat / self._heat_count if self._heat_count > 0 else 0.0,
+            "total_heat_index": self._heat,
+            "value_to_collateral_ratio": self._value / collateral if collateral > 0 else 0.0,
+            "position_count": len(self._contributions),
+        }
@@ -0,0 +1,125 @@
+"""
+Author: BubbaDiego
+Module: asset_registry.py
+Description:
+    The asset universe Sonic tracks, loaded from ``config/assets.json``
+    (``ASSETS_CONFIG_PATH``). Each entry maps a symbol to its provider ids:
+
+        {"symbol": "BTC", "name": "Bitcoin",
+         "coingecko_id": "bitcoin", "jupiter_mint": "3NZ9..."}
+
+    ``"priced": false`` keeps an asset on the dashboards without fetching
+    it (e.g. SP500, entered manually). Adding an asset is a config edit;
+    price sources batch every priced asset into a few chunked requests.
+"""
+
+import json
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+from core.logging import log
+from core.constants import ASSETS_CONFIG_PATH
+
+DEFAULT_ASSETS = [
+    {"symbol": "BTC", "name": "Bitcoin", "coingecko_id": "bitcoin",
+     "jupiter_mint": "3NZ9JMVBmGAqocybic2c7LQCJScmgsAZ6vQqTDzcqmJh"},
+    {"symbol": "ETH", "name": "Ethereum", "coingecko_id": "ethereum",
+     "jupiter_mint": "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs"},
+    {"symbol": "SOL", "name": "Solana", "coingecko_id": "solana",
+     "jupiter_mint": "So11111111111111111111111111111111111111112"},
+    {"symbol": "SP500", "name": "S&P 500", "priced": False},
+]
+
+
+@dataclass(frozen=True)
+class Asset:
+    symbol: str
+    name: str = ""
+    coingecko_id: Optional[str] = None
+    jupiter_mint: Optional[str] = None
+    priced: bool = True
+
+
+class AssetRegistry:
+    def __init__(self, assets: list):
+        self._assets = {}
+        for raw in assets:
+            if isinstance(raw, Asset):
+                asset = raw
+            else:
+                symbol = str(raw.get("symbol", "")).strip().upper()
+                if not symbol:
+                    log.warning(f"⚠️ Asset entry without symbol ignored: {raw}", source="AssetRegistry")
+                    continue
+                asset = Asset(
+                    symbol=symbol,
+                    name=raw.get("name") or symbol,
+                    coingecko_id=raw.get("coingecko_id"),
+                    jupiter_mint=raw.get("jupiter_mint"),
+                    priced=bool(raw.get("priced", True)),
+                )
+            self._assets[asset.symbol] = asset
+        self._by_mint = {a.jupiter_mint: a.symbol for a in self._assets.values() if a.jupiter_mint}
+        self._by_coingecko = {a.coingecko_id: a.symbol for a in self._assets.values() if a.coingecko_id}
+
+    @classmethod
+    def load(cls, path=ASSETS_CONFIG_PATH) -> "AssetRegistry":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                assets = json.load(f).get("assets") or []
+        except (OSError, ValueError) as e:
+            log.warning(f"⚠️ Asset config unavailable ({e}); using defaults", source="AssetRegistry")
+            assets = DEFAULT_ASSETS
+        return cls(assets)
+
+    def __contains__(self, symbol) -> bool:
+        return str(symbol).upper() in self._assets
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def get(self, symbol: str) -> Optional[Asset]:
+        return self._assets.get(str(symbol).upper())
+
+    def symbols(self) -> list:
+        """Every tracked symbol, in config order (dashboards)."""
+        return list(self._assets)
+
+    def priced_symbols(self) -> list:
+        """Symbols that price sources should fetch."""
+        return [a.symbol for a in self._assets.values() if a.priced]
+
+    def coingecko_ids(self, symbols=None) -> dict:
+        """``{coingecko_id: symbol}`` for ``symbols`` (default: every asset)."""
+        wanted = None if symbols is None else {str(s).upper() for s in symbols}
+        return {cid: sym for cid, sym in self._by_coingecko.items() if wanted is None or sym in wanted}
+
+    def jupiter_mints(self, symbols=None) -> dict:
+        """``{mint: symbol}`` for ``symbols`` (default: every asset)."""
+        wanted = None if symbols is None else {str(s).upper() for s in symbols}
+        return {mint: sym for mint, sym in self._by_mint.items() if wanted is None or sym in wanted}
+
+    def asset_for_mint(self, mint: str, default: str = None) -> Optional[str]:
+        return self._by_mint.get(mint, default)
+
+
+_REGISTRY = None
+_LOCK = threading.Lock()
+
+
+def get_asset_registry() -> AssetRegistry:
+    """Process-wide registry, loaded from config on first use."""
+    global _REGISTRY
+    with _LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = AssetRegistry.load()
+        return _REGISTRY
+
+
+def set_asset_registry(registry: AssetRegistry) -> AssetRegistry:
+    """Swap the process-wide registry (tests, hot reload); returns the previous one."""
+    global _REGISTRY
+    with _LOCK:
+        previous, _REGISTRY = _REGISTRY, registry
+        return previous
@@ -0,0 +1,91 @@
+"""
+Author: BubbaDiego
+Module: cancellation.py
+Description:
+    Cooperative cancellation for work that runs in threads (``asyncio.to_thread``,
+    worker pools). ``asyncio.wait_for`` can stop awaiting a thread but cannot
+    stop the thread, so the caller installs a :class:`CancelToken` in a context
+    variable. ``asyncio.to_thread`` copies context into the thread; code on the
+    far side calls :func:`check_cancelled` at safe points, and the shared HTTP
+    client uses the token's deadline and checks it before every attempt.
+
+    Thread pools do not copy context on their own; submit through
+    :func:`submit_with_context` to carry the token into pooled workers.
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StepCancelled(RuntimeError):
+    """Raised at a cancellation point once the surrounding step is cancelled or past its deadline."""
+
+
+class CancelToken:
+    def __init__(self, name: str, deadline: float = None, clock=time.monotonic):
+        self.name = name
+        self.deadline = deadline
+        self.clock = clock
+        self.reason = None
+        self._event = threading.Event()
+
+    @classmethod
+    def with_timeout(cls, name: str, seconds: float = None, clock=time.monotonic) -> "CancelToken":
+        return cls(name, None if seconds is None else clock() + seconds, clock)
+
+    def cancel(self, reason: str = "cancelled"):
+        self.reason = reason
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and self.clock() >= self.deadline:
+            self.cancel("deadline exceeded")
+            return True
+        return False
+
+    def remaining(self):
+        return None if self.deadline is None else max(0.0, self.deadline - self.clock())
+
+    def check(self):
+        if self.cancelled:
+            raise StepCancelled(f"{self.name}: {self.reason}")
+
+
+_CURRENT = contextvars.ContextVar("sonic_cancel_token", default=None)
+
+
+def current_token():
+    return _CURRENT.get()
+
+
+@contextmanager
+def cancel_scope(token: CancelToken):
+    """Make ``token`` the current token for code (and threads) started inside the block."""
+    handle = _CURRENT.set(token)
+    try:
+        yield token
+    finally:
+        _CURRENT.reset(handle)
+
+
+def check_cancelled():
+    """Cancellation point: raise :class:`StepCancelled` if the current step was cancelled."""
+    token = _CURRENT.get()
+    if token is not None:
+        token.check()
+
+
+def current_deadline():
+    """Absolute ``time.monotonic()`` deadline of the current step, if any."""
+    token = _CURRENT.get()
+    return token.deadline if token is not None else None
+
+
+def submit_with_context(pool, fn, *args, **kwargs):
+    """``pool.submit`` that carries the caller's context (and cancel token) into the worker."""
+    return pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
@@ -0,0 +1,239 @@
+"""
+Author: BubbaDiego
+Module: circuit_breaker.py
+Description:
+    Shared circuit breakers for outbound integrations (CoinGecko, Jupiter,
+    Solana/Ethereum RPC, SMTP, Twilio).
+
+    CLOSED     calls flow; consecutive failures are counted.
+    OPEN       after ``failure_threshold`` failures calls are rejected at once
+               with :class:`CircuitOpenError` until ``cooldown`` passes.
+    HALF_OPEN  after the cooldown up to ``half_open_max`` trial calls go
+               through; a success closes the breaker, a failure re-opens it.
+
+    Thresholds and cooldowns are per dependency: :data:`BREAKER_DEFAULTS`,
+    overridden by the ``circuit_breakers`` section of ``sonic_config.json``
+    or :func:`configure_breakers`. :func:`breaker_snapshot` feeds the
+    monitor ledger.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+from core.logging import log
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+BREAKER_DEFAULTS = {
+    "default": {"failure_threshold": 5, "cooldown": 30.0},
+    "coingecko": {"failure_threshold": 3, "cooldown": 60.0},
+    "jupiter_perps": {"failure_threshold": 3, "cooldown": 30.0},
+    "jupiter_price": {"failure_threshold": 3, "cooldown": 30.0},
+    "solana_rpc": {"failure_threshold": 3, "cooldown": 30.0},
+    "eth_rpc": {"failure_threshold": 3, "cooldown": 60.0},
+    "smtp": {"failure_threshold": 3, "cooldown": 120.0},
+    "twilio": {"failure_threshold": 2, "cooldown": 300.0},
+}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a dependency whose breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"circuit '{name}' is open; retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown: float = 30.0,
+                 half_open_max: int = 1, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = float(cooldown)
+        self.half_open_max = max(1, int(half_open_max))
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._opened_wall = None
+        self._trials = 0
+        self.last_error = None
+        self.trips = 0
+        self.rejected = 0
+
+    # --------------------------------------------------------------
+    def _refresh(self):
+        if self._state == OPEN and self.clock() - self._opened_at >= self.cooldown:
+            self._state = HALF_OPEN
+            self._trials = 0
+            log.info(f"🟡 Circuit '{self.name}' half-open; allowing a trial call", source="CircuitBreaker")
+
+    def _trip(self):
+        self._state = OPEN
+        self._opened_at = self.clock()
+        self._opened_wall = datetime.now(timezone.utc).isoformat()
+        self._trials = 0
+        self.trips += 1
+        log.warning(
+            f"🔴 Circuit '{self.name}' opened after {self._failures} failures; cooling down {self.cooldown:.0f}s",
+            source="CircuitBreaker",
+            payload={"error": self.last_error},
+        )
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def retry_in(self) -> float:
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (self.clock() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Reserve a call; every ``True`` must be followed by a success or failure record."""
+        with self._lock:
+            self._refresh()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._trials < self.half_open_max:
+                self._trials += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self._state != CLOSED:
+                log.success(f"🟢 Circuit '{self.name}' closed", source="CircuitBreaker")
+            self._state = CLOSED
+            self._failures = 0
+            self._trials = 0
+
+    def record_failure(self, error: str = None):
+        with self._lock:
+            self._failures += 1
+            self.last_error = error
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._trip()
+
+    def release(self):
+        """Hand back an :meth:`allow` reservation for a call that never reached the dependency."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def check(self):
+        """:meth:`allow` or raise :class:`CircuitOpenError`."""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+
+    def call(self, fn, *args, **kwargs):
+        """Run ``fn`` through the breaker; any exception counts as a failure."""
+        self.check()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(str(e) or e.__class__.__name__)
+            raise
+        self.record_success()
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trials = 0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            self._refresh()
+            retry_in = 0.0
+            if self._state == OPEN:
+                retry_in = max(0.0, self.cooldown - (self.clock() - self._opened_at))
+            return {
+                "state": self._state,
+                "failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "cooldown": self.cooldown,
+                "opened_at": self._opened_wall if self._state != CLOSED else None,
+                "retry_in": round(retry_in, 1),
+                "trips": self.trips,
+                "rejected": self.rejected,
+                "last_error": self.last_error,
+            }
+
+
+_BREAKERS = {}
+_SETTINGS = None
+_LOCK = threading.Lock()
+
+
+def _load_settings() -> dict:
+    settings = {name: dict(cfg) for name, cfg in BREAKER_DEFAULTS.items()}
+    try:
+        from core.constants import CONFIG_PATH
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            overrides = json.load(f).get("circuit_breakers") or {}
+        for name, cfg in overrides.items():
+            settings.setdefault(name, {}).update(cfg or {})
+    except (OSError, ValueError):
+        pass
+    return settings
+
+
+def configure_breakers(settings: dict):
+    """Override per-dependency settings; existing breakers are updated in place."""
+    global _SETTINGS
+    with _LOCK:
+        if _SETTINGS is None:
+            _SETTINGS = _load_settings()
+        for name, cfg in (settings or {}).items():
+            _SETTINGS.setdefault(name, {}).update(cfg or {})
+            breaker = _BREAKERS.get(name)
+            if breaker is not None:
+                breaker.failure_threshold = max(1, int(cfg.get("failure_threshold", breaker.failure_threshold)))
+                breaker.cooldown = float(cfg.get("cooldown", breaker.cooldown))
+                breaker.half_open_max = max(1, int(cfg.get("half_open_max", breaker.half_open_max)))
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Process-wide breaker for dependency ``name``."""
+    global _SETTINGS
+    with _LOCK:
+        breaker = _BREAKERS.get(name)
+        if breaker is None:
+            if _SETTINGS is None:
+                _SETTINGS = _load_settings()
+            cfg = {**_SETTINGS.get("default", {}), **_SETTINGS.get(name, {})}
+            breaker = CircuitBreaker(
+                name,
+                failure_threshold=cfg.get("failure_threshold", 5),
+                cooldown=cfg.get("cooldown", 30.0),
+                half_open_max=cfg.get("half_open_max", 1),
+            )
+            _BREAKERS[name] = breaker
+        return breaker
+
+
+def breaker_snapshot() -> dict:
+    """State of every breaker used so far, keyed by dependency."""
+    with _LOCK:
+        breakers = list(_BREAKERS.values())
+    return {b.name: b.snapshot() for b in breakers}
+
+
+def reset_breakers():
+    """Forget every breaker and reload settings on next use."""
+    global _SETTINGS
+    with _LOCK:
+        _BREAKERS.clear()
+        _SETTINGS = None
@@ -38,6 +38,7 @@ ALERT_LIMITS_PATH = CONFIG_DIR / os.getenv("ALERT_LIMITS_FILENAME", "alert_limit
 SONIC_SAUCE_PATH = CONFIG_DIR / os.getenv("SONIC_SAUCE_FILENAME", "sonic_sauce.json")
 COM_CONFIG_PATH = CONFIG_DIR / os.getenv("COM_CONFIG_FILENAME", "com_config.json")
 THEME_CONFIG_PATH = CONFIG_DIR / os.getenv("THEME_CONFIG_FILENAME", "theme_config.json")
+ASSETS_CONFIG_PATH = CONFIG_DIR / os.getenv("ASSETS_CONFIG_FILENAME", "assets.json")
 
 # Optional heartbeat file location
 HEARTBEAT_FILE = Path(os.getenv("HEARTBEAT_FILE", MONITOR_DIR / "sonic_ledger.json"))
@@ -59,6 +60,8 @@ VADERVAULT_IMAGE = IMAGE_DIR / "vadervault.jpg"
 # 🧠 Blockchain & RPC
 # -----------------------------
 POLYGON_RPC_URL = "https://polygon-rpc.com"
+SOLANA_RPC_URL = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
+ETH_RPC_URL = os.getenv("ETH_RPC_URL", "https://cloudflare-eth.com")
 
 POOL_ADDRESS = "0x794a61358D6845594F94dc1DB02A252b5b4814aD"
 POOL_PROVIDER_ADDR = "0xa97684ead0e402DC232d5A977953DF7ECBaB3CDb"
@@ -69,6 +72,35 @@ LIQUIDATION_DATA_ADDR = "0xABCDEFabcdefABCDEFabcdefABCDEFabcdefABCD"
 # ☄️ Jupiter API
 # -----------------------------
 JUPITER_API_BASE = os.getenv("JUPITER_API_BASE", "https://perps-api.jup.ag")
+JUPITER_QUOTE_API_BASE = os.getenv("JUPITER_QUOTE_API_BASE", "https://quote-api.jup.ag")
+JUPITER_PRICE_API_BASE = os.getenv("JUPITER_PRICE_API_BASE", "https://lite-api.jup.ag/price/v2")
+
+# -----------------------------
+# 🦎 CoinGecko API
+# -----------------------------
+COINGECKO_API_BASE = os.getenv("COINGECKO_API_BASE", "https://api.coingecko.com/api/v3")
+
+# -----------------------------
+# 📈 Price aggregation
+# -----------------------------
+# Comma-separated, in priority order (see prices/price_sources.py)
+PRICE_SOURCES = [s.strip() for s in os.getenv("PRICE_SOURCES", "coingecko,jupiter").split(",") if s.strip()]
+PRICE_QUORUM = int(os.getenv("PRICE_QUORUM", "2"))
+PRICE_DEADLINE_SECONDS = float(os.getenv("PRICE_DEADLINE_SECONDS", "4.0"))
+# Quote responses are reused for this long unless the provider's Cache-Control says otherwise
+PRICE_CACHE_TTL = float(os.getenv("PRICE_CACHE_TTL", "10"))
+# A cached quote may still be served this long past expiry when the provider is failing or throttling us
+PRICE_CACHE_STALE_SECONDS = float(os.getenv("PRICE_CACHE_STALE_SECONDS", "120"))
+# Price ticker: how often quotes are polled between full cycles, and the move
+# (percent) that makes tick subscribers re-enrich positions and re-check alerts
+PRICE_TICK_INTERVAL = float(os.getenv("PRICE_TICK_INTERVAL", "5"))
+TICK_MIN_CHANGE_PCT = float(os.getenv("TICK_MIN_CHANGE_PCT", "0.25"))
+TICK_HEDGE_INTERVAL = float(os.getenv("TICK_HEDGE_INTERVAL", "30"))
+# Cross-process Cyclone cycle lease: how long a holder owns it between
+# renewals (keep above the largest step deadline plus TTL / 3), and how
+# long a second process waits for that cycle's result
+CYCLE_LEASE_TTL = float(os.getenv("CYCLE_LEASE_TTL", "120"))
+CYCLE_LEASE_WAIT = float(os.getenv("CYCLE_LEASE_WAIT", "600"))
 
 # -----------------------------
 # 🧪 Contract ABIs
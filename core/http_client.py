@@ -0,0 +1,304 @@
+"""
+Author: BubbaDiego
+Module: http_client.py
+Description:
+    Shared outbound HTTP layer for CoinGecko, Jupiter and other integrations.
+    One keep-alive ``requests.Session`` per host, default timeouts, jittered
+    exponential retry on connection errors and 429/5xx, and per-endpoint
+    latency metrics. Optional per-provider request budgets
+    (``core.request_budget``) space calls out across the provider's rate
+    window and honour ``Retry-After`` for every caller at once.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # pragma: no cover - optional dependency
+    requests = None
+    HTTPAdapter = None
+
+from core.logging import log
+from core.cancellation import StepCancelled, current_token
+from core.circuit_breaker import CircuitOpenError, get_breaker
+from core.request_budget import get_budget
+
+RequestException = requests.RequestException if requests else Exception
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class DeadlineExceeded(RequestException):
+    """Raised when a request's overall deadline passes before it succeeds."""
+
+
+class RateLimited(RequestException):
+    """Raised when a provider's request budget has no slot before the deadline."""
+
+    def __init__(self, message, retry_in: float = 0.0):
+        super().__init__(message)
+        self.retry_in = retry_in
+
+
+class EndpointStats:
+    __slots__ = ("count", "errors", "total_ms", "max_ms", "last_ms", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.samples = deque(maxlen=200)
+
+    def record(self, elapsed_ms: float, ok: bool):
+        self.count += 1
+        if not ok:
+            self.errors += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.last_ms = elapsed_ms
+        self.samples.append(elapsed_ms)
+
+    def snapshot(self) -> dict:
+        ordered = sorted(self.samples)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "p95_ms": round(p95, 2),
+            "max_ms": round(self.max_ms, 2),
+            "last_ms": round(self.last_ms, 2),
+        }
+
+
+class HttpClient:
+    """
+    Pooled HTTP client. ``timeout`` is ``(connect, read)`` seconds; ``retries``
+    is the number of extra attempts after the first. Backoff uses full jitter:
+    ``uniform(0, min(backoff_max, backoff_base * 2**n))``, or the server's
+    ``Retry-After`` when present. ``budgets=False`` ignores request budgets
+    (for clients that never reach a real provider, e.g. traffic replay).
+    """
+
+    def __init__(self, timeout=(3.05, 10), retries: int = 2, backoff_base: float = 0.5,
+                 backoff_max: float = 8.0, pool_maxsize: int = 16,
+                 user_agent: str = "Cyclone/SonicHttp", session_factory=None, sleep=time.sleep,
+                 budgets: bool = True):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_maxsize = pool_maxsize
+        self.user_agent = user_agent
+        self.session_factory = session_factory or self._default_session
+        self.sleep = sleep
+        self.budgets = budgets
+        self._sessions = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return requests is not None or self.session_factory is not self._default_session
+
+    def _default_session(self):
+        if requests is None:
+            raise RuntimeError("requests is not installed")
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = self.user_agent
+        return session
+
+    def session_for(self, url: str):
+        host = urlsplit(url).netloc
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self.session_factory()
+                self._sessions[host] = session
+            return session
+
+    # --------------------------------------------------------------
+    @staticmethod
+    def retry_after(response) -> float:
+        """``Retry-After`` in seconds (delta form only), or ``None``."""
+        if response is None:
+            return None
+        value = (getattr(response, "headers", None) or {}).get("Retry-After")
+        try:
+            return max(0.0, float(value)) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def backoff(self, attempt: int, response=None, base: float = None) -> float:
+        retry_after = self.retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        base = self.backoff_base if base is None else base
+        return random.uniform(0, min(self.backoff_max, base * (2 ** attempt)))
+
+    def _record(self, endpoint: str, elapsed_ms: float, ok: bool):
+        with self._lock:
+            stats = self._stats.get(endpoint)
+            if stats is None:
+                stats = self._stats[endpoint] = EndpointStats()
+            stats.record(elapsed_ms, ok)
+
+    @staticmethod
+    def _cap_timeout(timeout, remaining: float):
+        if isinstance(timeout, tuple):
+            return tuple(min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+    def request(self, method: str, url: str, endpoint: str = None, retries: int = None,
+                timeout=None, backoff_base: float = None, deadline: float = None,
+                breaker: str = None, budget: str = None, **kwargs):
+        """
+        Issue a request with retry. Returns the final response (callers still
+        ``raise_for_status()``); re-raises the last transport error.
+
+        ``deadline`` is an absolute ``time.monotonic()`` bound for the whole
+        call including retries; attempt timeouts shrink to fit and
+        :class:`DeadlineExceeded` is raised once it passes.
+
+        ``breaker`` names a shared circuit breaker for the dependency. While
+        it is open the call fails at once with :class:`CircuitOpenError`;
+        transport errors and a final 429/5xx count as failures.
+
+        ``budget`` names a shared :class:`~core.request_budget.RequestBudget`.
+        Every attempt waits for its slot (within ``deadline``, else
+        :class:`RateLimited`) and a 429's ``Retry-After`` blocks the budget
+        for all callers.
+
+        When called under a :mod:`core.cancellation` token, the token's
+        deadline caps ``deadline`` and a cancelled token raises
+        :class:`~core.cancellation.StepCancelled` before the next attempt.
+        """
+        if breaker is None:
+            return self._request(method, url, endpoint, retries, timeout, backoff_base, deadline, budget, **kwargs)
+
+        guard = get_breaker(breaker)
+        guard.check()
+        try:
+            response = self._request(method, url, endpoint, retries, timeout, backoff_base, deadline, budget,
+                                     **kwargs)
+        except (RateLimited, StepCancelled):
+            # Throttled or cancelled locally before reaching the dependency; not its failure.
+            guard.release()
+            raise
+        except Exception as e:
+            guard.record_failure(str(e) or e.__class__.__name__)
+            raise
+        status = getattr(response, "status_code", 200)
+        if status in RETRY_STATUSES or status >= 500:
+            guard.record_failure(f"HTTP {status}")
+        else:
+            guard.record_success()
+        return response
+
+    def _wait_for_slot(self, budget, endpoint: str, deadline: float):
+        max_wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+        wait = budget.reserve(max_wait)
+        if wait is None:
+            retry_in = budget.blocked_for() or budget.interval
+            raise RateLimited(f"{endpoint} has no {budget.name} budget before its deadline", retry_in)
+        if wait > 0:
+            self.sleep(wait)
+
+    def _request(self, method, url, endpoint, retries, timeout, backoff_base, deadline, budget=None, **kwargs):
+        endpoint = endpoint or f"{method.upper()} {urlsplit(url).netloc}{urlsplit(url).path}"
+        retries = self.retries if retries is None else retries
+        timeout = timeout or self.timeout
+        session = self.session_for(url)
+        budget = get_budget(budget) if budget and self.budgets else None
+
+        # Inside a Cyclone step, the step's cancel token bounds the call too.
+        token = current_token()
+        if token is not None and token.deadline is not None:
+            deadline = token.deadline if deadline is None else min(deadline, token.deadline)
+
+        for attempt in range(retries + 1):
+            if token is not None:
+                token.check()
+            if budget is not None:
+                self._wait_for_slot(budget, endpoint, deadline)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceeded(f"{endpoint} deadline exceeded after {attempt} attempts")
+                kwargs["timeout"] = self._cap_timeout(timeout, remaining)
+            else:
+                kwargs["timeout"] = timeout
+            start = time.perf_counter()
+            response = None
+            try:
+                response = getattr(session, method.lower())(url, **kwargs)
+            except RequestException as e:
+                self._record(endpoint, (time.perf_counter() - start) * 1000, False)
+                log.warning(f"[{attempt + 1}/{retries + 1}] {endpoint} failed: {e}", source="HttpClient")
+                if attempt == retries:
+                    raise
+            else:
+                status = getattr(response, "status_code", 200)
+                ok = status not in RETRY_STATUSES
+                if status == 429 and budget is not None:
+                    budget.block(self.retry_after(response) or budget.interval)
+                self._record(endpoint, (time.perf_counter() - start) * 1000, ok and status < 400)
+                if ok or attempt == retries:
+                    return response
+                log.warning(f"[{attempt + 1}/{retries + 1}] {endpoint} → HTTP {status}", source="HttpClient")
+
+            delay = self.backoff(attempt, response, backoff_base)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise DeadlineExceeded(f"{endpoint} deadline exceeded after {attempt + 1} attempts")
+            self.sleep(delay)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def metrics(self) -> dict:
+        """Per-endpoint latency snapshot: count, errors, avg/p95/max/last ms."""
+        with self._lock:
+            return {name: stats.snapshot() for name, stats in self._stats.items()}
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                try:
+                    session.close()
+                except Exception:
+                    pass
+            self._sessions.clear()
+
+
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Process-wide client so every integration shares the same pools."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = HttpClient()
+        return _CLIENT
+
+
+def set_http_client(client: HttpClient):
+    """Swap the process-wide client (e.g. for record/replay); returns the previous one."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        previous, _CLIENT = _CLIENT, client
+        return previous
@@ -0,0 +1,111 @@
+"""
+Author: BubbaDiego
+Module: request_budget.py
+Description:
+    Per-provider request budgets. A budget allows ``limit`` calls per
+    ``window`` seconds and hands out evenly spaced slots
+    (``window / limit`` apart) instead of letting callers burst, so
+    independent callers (price sync, latency pings, manual refreshes) share
+    one provider quota without tripping its rate limiter. A ``Retry-After``
+    from the provider blocks the whole budget until it passes.
+"""
+
+import threading
+import time
+
+from core.logging import log
+
+BUDGET_DEFAULTS = {
+    # CoinGecko's public tier allows ~30 calls/min; leave headroom.
+    "coingecko": {"limit": 25, "window": 60.0},
+    "jupiter_price": {"limit": 300, "window": 60.0},
+}
+
+
+class RequestBudget:
+    def __init__(self, name: str, limit: int, window: float, clock=time.monotonic):
+        self.name = name
+        self.limit = max(1, int(limit))
+        self.window = float(window)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self.granted = 0
+        self.denied = 0
+
+    @property
+    def interval(self) -> float:
+        return self.window / self.limit
+
+    def blocked_for(self) -> float:
+        with self._lock:
+            return max(0.0, self._blocked_until - self.clock())
+
+    def block(self, seconds: float):
+        """Stop handing out slots for ``seconds`` (provider said Retry-After)."""
+        with self._lock:
+            until = self.clock() + max(0.0, float(seconds))
+            if until > self._blocked_until:
+                self._blocked_until = until
+                self._next_slot = max(self._next_slot, until)
+                log.warning(f"⏳ {self.name} budget blocked for {seconds:.0f}s", source="RequestBudget")
+
+    def reserve(self, max_wait: float = None):
+        """
+        Claim the next slot. Returns seconds to wait before calling, or
+        ``None`` (nothing claimed) when that would exceed ``max_wait``.
+        """
+        with self._lock:
+            now = self.clock()
+            slot = max(now, self._next_slot, self._blocked_until)
+            wait = slot - now
+            if max_wait is not None and wait > max_wait:
+                self.denied += 1
+                return None
+            self._next_slot = slot + self.interval
+            self.granted += 1
+            return wait
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            now = self.clock()
+            return {
+                "limit": self.limit,
+                "window": self.window,
+                "next_slot_in": round(max(0.0, self._next_slot - now), 2),
+                "blocked_for": round(max(0.0, self._blocked_until - now), 2),
+                "granted": self.granted,
+                "denied": self.denied,
+            }
+
+
+_BUDGETS = {}
+_LOCK = threading.Lock()
+
+
+def get_budget(name: str) -> RequestBudget:
+    """Process-wide budget for provider ``name`` (unknown names are unlimited-ish)."""
+    with _LOCK:
+        budget = _BUDGETS.get(name)
+        if budget is None:
+            cfg = BUDGET_DEFAULTS.get(name, {"limit": 600, "window": 60.0})
+            budget = _BUDGETS[name] = RequestBudget(name, cfg["limit"], cfg["window"])
+        return budget
+
+
+def configure_budget(name: str, limit: int, window: float) -> RequestBudget:
+    with _LOCK:
+        budget = _BUDGETS[name] = RequestBudget(name, limit, window)
+        return budget
+
+
+def budget_snapshot() -> dict:
+    with _LOCK:
+        budgets = list(_BUDGETS.values())
+    return {b.name: b.snapshot() for b in budgets}
+
+
+def reset_budgets():
+    with _LOCK:
+        _BUDGETS.clear()
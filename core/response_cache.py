@@ -0,0 +1,182 @@
+"""
+Author: BubbaDiego
+Module: response_cache.py
+Description:
+    Small TTL cache for JSON GETs (price quotes) with single-flight
+    coalescing. Concurrent callers asking for the same URL and params share
+    one upstream request; later callers within the TTL get the cached body.
+
+    * TTL comes from the response's ``Cache-Control: max-age`` (less
+      ``Age``), ``no-store``/``no-cache`` disable caching, otherwise the
+      ``default_ttl`` (``PRICE_CACHE_TTL``) applies.
+    * While the provider's budget is blocked by ``Retry-After`` or the
+      request fails, an expired entry up to ``stale_ttl`` seconds old is
+      served instead of raising.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from core.logging import log
+from core.http_client import DeadlineExceeded
+from core.constants import PRICE_CACHE_STALE_SECONDS, PRICE_CACHE_TTL
+from core.request_budget import get_budget
+
+_MAX_AGE = re.compile(r"(?:s-)?max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def cache_ttl(headers, default: float) -> float:
+    """Seconds a response may be reused according to its headers."""
+    headers = headers or {}
+    control = headers.get("Cache-Control") or ""
+    lowered = control.lower()
+    if "no-store" in lowered or "no-cache" in lowered:
+        return 0.0
+    match = _MAX_AGE.search(control)
+    if not match:
+        return default
+    try:
+        age = float(headers.get("Age") or 0)
+    except (TypeError, ValueError):
+        age = 0.0
+    return max(0.0, float(match.group(1)) - age)
+
+
+class _Entry:
+    __slots__ = ("value", "stored_at", "expires_at")
+
+    def __init__(self, value, stored_at: float, expires_at: float):
+        self.value = value
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+
+
+class _Flight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ResponseCache:
+    def __init__(self, default_ttl: float = PRICE_CACHE_TTL, stale_ttl: float = PRICE_CACHE_STALE_SECONDS,
+                 max_entries: int = 256, clock=time.monotonic):
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "stale": 0}
+
+    @staticmethod
+    def key(url: str, params=None) -> str:
+        items = sorted((str(k), str(v)) for k, v in (dict(params or {})).items())
+        return json.dumps([url, items])
+
+    def _stale(self, key: str):
+        entry = self._entries.get(key)
+        if entry is not None and self.clock() - entry.expires_at <= self.stale_ttl:
+            return entry
+        return None
+
+    def _store(self, key: str, value, ttl: float):
+        now = self.clock()
+        self._entries[key] = _Entry(value, now, now + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get_json(self, client, url: str, params: dict = None, budget: str = None, deadline: float = None,
+                 **request_kwargs):
+        """
+        Return the JSON body for ``GET url?params`` from cache or one shared
+        upstream call through ``client`` (an :class:`HttpClient`).
+        """
+        key = self.key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.clock() < entry.expires_at:
+                self.stats["hits"] += 1
+                return entry.value
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                if budget and get_budget(budget).blocked_for() > 0:
+                    stale = self._stale(key)
+                    if stale is not None:
+                        self.stats["stale"] += 1
+                        return stale.value
+                flight = self._flights[key] = _Flight()
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not flight.done.wait(timeout):
+                raise DeadlineExceeded(f"{url} deadline exceeded waiting on a shared request")
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            response = client.get(url, params=params, budget=budget, deadline=deadline, **request_kwargs)
+            response.raise_for_status()
+            value = response.json()
+        except Exception as e:
+            with self._lock:
+                stale = self._stale(key)
+                if stale is not None:
+                    self.stats["stale"] += 1
+                    flight.value = stale.value
+                else:
+                    flight.error = e
+                self._flights.pop(key, None)
+            flight.done.set()
+            if flight.error is not None:
+                raise
+            log.warning(f"⚠️ Serving stale response for {url}: {e}", source="ResponseCache")
+            return flight.value
+
+        ttl = cache_ttl(getattr(response, "headers", None), self.default_ttl)
+        with self._lock:
+            if ttl > 0:
+                self._store(key, value, ttl)
+            flight.value = value
+            self._flights.pop(key, None)
+        flight.done.set()
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries)}
+
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide cache shared by price sync, latency pings and manual refreshes."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            _CACHE = ResponseCache()
+        return _CACHE
+
+
+def reset_response_cache():
+    global _CACHE
+    with _CACHE_LOCK:
+        _CACHE = None
@@ -0,0 +1,230 @@
+"""
+Author: BubbaDiego
+Module: tick_bus.py
+Description:
+    In-process price tick bus. Price fetches publish :class:`PriceTick`
+    objects; subscribers (position enrichment, alert evaluation, hedge
+    checks) react on their own worker threads instead of waiting for the
+    next full Cyclone cycle.
+
+    * Publishing never blocks the fetcher: ticks land in each subscriber's
+      mailbox and the call returns.
+    * Coalescing: a mailbox keeps only the newest tick per asset, so a
+      burst of ticks becomes one batch of latest prices. A subscriber
+      whose handler is still busy simply receives the merged batch next.
+    * Backpressure: ``min_interval`` spaces out handler runs and
+      ``max_pending`` bounds the mailbox (oldest assets dropped and
+      counted) so a slow subscriber cannot grow memory or fall behind
+      forever.
+"""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from core.logging import log
+
+PriceTick = namedtuple("PriceTick", "asset price previous change_pct source ts")
+
+
+class Subscription:
+    def __init__(self, name: str, handler, assets=None, min_change_pct: float = 0.0,
+                 min_interval: float = 0.0, max_pending: int = 1000):
+        self.name = name
+        self.handler = handler
+        self.assets = {a.upper() for a in assets} if assets else None
+        self.min_change_pct = min_change_pct
+        self.min_interval = min_interval
+        self.max_pending = max(1, int(max_pending))
+        self._mailbox = OrderedDict()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._last_run = 0.0
+        self._busy = False
+        self._reference = {}
+        self.stats = {"received": 0, "filtered": 0, "coalesced": 0, "dropped": 0, "batches": 0, "errors": 0,
+                      "last_lag_ms": None, "last_error": None}
+        self._thread = threading.Thread(target=self._run, name=f"tick-{name}", daemon=True)
+        self._thread.start()
+
+    def wants(self, tick: PriceTick) -> bool:
+        return self.assets is None or tick.asset in self.assets
+
+    def offer(self, tick: PriceTick):
+        with self._cond:
+            if self._closed:
+                return
+            self.stats["received"] += 1
+            # Moves are measured from the price this subscriber last handled,
+            # so a slow drift of small ticks still crosses the threshold.
+            reference = self._reference.get(tick.asset)
+            if (self.min_change_pct and reference is not None and tick.asset not in self._mailbox
+                    and abs(_change_pct(reference, tick.price)) < self.min_change_pct):
+                self.stats["filtered"] += 1
+                return
+            if tick.asset in self._mailbox:
+                # Keep the first tick's "previous" so the batch shows the whole move.
+                first = self._mailbox.pop(tick.asset)
+                tick = tick._replace(previous=first.previous, change_pct=_change_pct(first.previous, tick.price))
+                self.stats["coalesced"] += 1
+            self._mailbox[tick.asset] = tick
+            while len(self._mailbox) > self.max_pending:
+                self._mailbox.popitem(last=False)
+                self.stats["dropped"] += 1
+            self._cond.notify()
+
+    def _take(self):
+        with self._cond:
+            while not self._mailbox and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return None
+            wait = self._last_run + self.min_interval - time.monotonic()
+            while wait > 0 and not self._closed:
+                # Ticks arriving meanwhile merge into the pending batch.
+                self._cond.wait(wait)
+                wait = self._last_run + self.min_interval - time.monotonic()
+            if self._closed:
+                return None
+            batch = dict(self._mailbox)
+            self._mailbox.clear()
+            self._busy = True
+            for asset, tick in batch.items():
+                self._reference[asset] = tick.price
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._take()
+            if batch is None:
+                return
+            self._last_run = time.monotonic()
+            try:
+                self.handler(batch)
+            except Exception as e:
+                self.stats["errors"] += 1
+                self.stats["last_error"] = str(e)
+                log.error(f"❌ Tick subscriber '{self.name}' failed: {e}", source="TickBus")
+            oldest = min(t.ts for t in batch.values())
+            with self._cond:
+                self.stats["batches"] += 1
+                self.stats["last_lag_ms"] = round((time.time() - oldest) * 1000, 2)
+                self._busy = False
+
+    def close(self, timeout: float = 1.0):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def idle(self) -> bool:
+        with self._cond:
+            return not self._mailbox and not self._busy
+
+
+def _change_pct(previous, price) -> float:
+    if not previous:
+        return 0.0
+    return (price - previous) / previous * 100.0
+
+
+class TickBus:
+    def __init__(self):
+        self._subs = {}
+        self._last = {}
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, name: str, handler, assets=None, min_change_pct: float = 0.0,
+                  min_interval: float = 0.0, max_pending: int = 1000) -> Subscription:
+        """
+        Run ``handler({asset: PriceTick})`` for ticks on ``assets`` (all by
+        default) once an asset has moved at least ``min_change_pct`` percent
+        from the price the subscriber last handled.
+        """
+        sub = Subscription(name, handler, assets, min_change_pct, min_interval, max_pending)
+        with self._lock:
+            previous = self._subs.pop(name, None)
+            self._subs[name] = sub
+        if previous:
+            previous.close()
+        return sub
+
+    def unsubscribe(self, name: str):
+        with self._lock:
+            sub = self._subs.pop(name, None)
+        if sub:
+            sub.close()
+
+    def publish(self, ticks):
+        with self._lock:
+            subs = list(self._subs.values())
+        for tick in ticks:
+            self.published += 1
+            for sub in subs:
+                if sub.wants(tick):
+                    sub.offer(tick)
+
+    def publish_prices(self, prices: dict, source: str = "price_sync") -> list:
+        """Publish ``{asset: price}``; only assets whose price changed become ticks."""
+        now = time.time()
+        ticks = []
+        with self._lock:
+            for asset, price in prices.items():
+                if price is None:
+                    continue
+                previous = self._last.get(asset)
+                if previous == price:
+                    continue
+                self._last[asset] = price
+                ticks.append(PriceTick(asset, float(price), previous, _change_pct(previous, price), source, now))
+        if ticks:
+            self.publish(ticks)
+        return ticks
+
+    def last_price(self, asset: str):
+        with self._lock:
+            return self._last.get(asset)
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """Block until every mailbox is empty (tests, shutdown)."""
+        end = time.monotonic() + timeout
+        while time.monotonic() < end:
+            if all(sub.idle() for sub in list(self._subs.values())):
+                return True
+            time.sleep(0.01)
+        return False
+
+    def stats(self) -> dict:
+        with self._lock:
+            subs = list(self._subs.values())
+        return {"published": self.published, "subscribers": {s.name: dict(s.stats) for s in subs}}
+
+    def close(self):
+        with self._lock:
+            subs = list(self._subs.values())
+            self._subs.clear()
+        for sub in subs:
+            sub.close()
+
+
+_BUS = None
+_BUS_LOCK = threading.Lock()
+
+
+def get_tick_bus() -> TickBus:
+    """Process-wide bus shared by price fetchers and subscribers."""
+    global _BUS
+    with _BUS_LOCK:
+        if _BUS is None:
+            _BUS = TickBus()
+        return _BUS
+
+
+def reset_tick_bus():
+    global _BUS
+    with _BUS_LOCK:
+        bus, _BUS = _BUS, None
+    if bus:
+        bus.close()
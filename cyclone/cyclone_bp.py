@@ -1,35 +1,34 @@
-import asyncio
 import os
 from flask import Blueprint, jsonify, render_template, current_app
 # Access the shared Cyclone instance attached to the Flask app
 from core.core_imports import BASE_DIR, log
-from threading import Thread
-import inspect
+from cyclone.cyclone_worker import CycloneWorker
+from threading import Lock
 
 cyclone_bp = Blueprint("cyclone", __name__, template_folder=".", url_prefix="/cyclone")
 
-# --- Smart Background Runner ---
-def run_in_background(task_func, name="UnnamedTask"):
-    app = current_app._get_current_object()
+_worker_lock = Lock()
+
 
-    def wrapper():
-        try:
-            log.info(f"🧵 Starting background task: {name}", source="AsyncRunner")
+def get_worker() -> CycloneWorker:
+    """The app's single Cyclone worker, created on first use."""
+    app = current_app._get_current_object()
+    with _worker_lock:
+        worker = getattr(app, "cyclone_worker", None)
+        if worker is None:
+            worker = CycloneWorker(context_factory=app.app_context).start()
+            app.cyclone_worker = worker
+    return worker
 
-            with app.app_context():
-                if inspect.iscoroutinefunction(task_func):
-                    asyncio.run(task_func())
-                else:
-                    result = task_func()
-                    if inspect.iscoroutine(result):
-                        asyncio.run(result)
 
-            log.success(f"✅ Completed background task: {name}", source="AsyncRunner")
+# --- Background Runner ---
+def run_in_background(task_func, name="UnnamedTask"):
+    """Queue ``task_func`` on the Cyclone worker; a request identical to a queued one joins it."""
+    return get_worker().submit(name, task_func)
 
-        except Exception as e:
-            log.error(f"🔥 Task '{name}' crashed: {e}", source="AsyncRunner")
 
-    Thread(target=wrapper, name=name).start()
+def accepted(message, job):
+    return jsonify({"message": message, "job": job.snapshot(), "status_url": f"/cyclone/jobs/{job.id}"}), 202
 
 # --- Dashboard View (Optional) ---
 @cyclone_bp.route("/dashboard", methods=["GET"])
@@ -40,9 +39,9 @@ def cyclone_dashboard():
 @cyclone_bp.route("/run_market_updates", methods=["POST"])
 def run_market_updates():
     try:
-        run_in_background(lambda: asyncio.run(current_app.cyclone.run_market_updates()),
-                          name="MarketUpdate")
-        return jsonify({"message": "Market Updates Started."}), 202
+        job = run_in_background(current_app.cyclone.run_market_updates,
+                                name="MarketUpdate")
+        return accepted("Market Updates Started.", job)
     except Exception as e:
         log.error(f"Market Updates Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
@@ -50,9 +49,9 @@ def run_market_updates():
 @cyclone_bp.route("/run_position_updates", methods=["POST"])
 def run_position_updates():
     try:
-        run_in_background(lambda: asyncio.run(current_app.cyclone.run_position_updates()),
-                          name="JupiterUpdate")
-        return jsonify({"message": "Position Updates Started."}), 202
+        job = run_in_background(current_app.cyclone.run_position_updates,
+                                name="JupiterUpdate")
+        return accepted("Position Updates Started.", job)
     except Exception as e:
         log.error(f"Position Updates Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
@@ -60,9 +59,9 @@ def run_position_updates():
 @cyclone_bp.route("/run_dependent_updates", methods=["POST"])
 def run_dependent_updates():
     try:
-        run_in_background(lambda: asyncio.run(current_app.cyclone.run_enrich_positions()),
-                          name="DependentUpdate")
-        return jsonify({"message": "Dependent Updates Started."}), 202
+        job = run_in_background(current_app.cyclone.run_enrich_positions,
+                                name="DependentUpdate")
+        return accepted("Dependent Updates Started.", job)
     except Exception as e:
         log.error(f"Dependent Updates Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
@@ -70,9 +69,9 @@ def run_dependent_updates():
 @cyclone_bp.route("/run_alert_evaluations", methods=["POST"])
 def run_alert_evaluations():
     try:
-        run_in_background(lambda: asyncio.run(current_app.cyclone.run_alert_updates()),
-                          name="AlertEval")
-        return jsonify({"message": "Alert Evaluations Started."}), 202
+        job = run_in_background(current_app.cyclone.run_alert_updates,
+                                name="AlertEval")
+        return accepted("Alert Evaluations Started.", job)
     except Exception as e:
         log.error(f"Alert Evaluations Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
@@ -80,9 +79,9 @@ def run_alert_evaluations():
 @cyclone_bp.route("/run_system_updates", methods=["POST"])
 def run_system_updates():
     try:
-        run_in_background(lambda: asyncio.run(current_app.cyclone.run_system_updates()),
-                          name="SystemUpdate")
-        return jsonify({"message": "System Updates Started."}), 202
+        job = run_in_background(current_app.cyclone.run_system_updates,
+                                name="SystemUpdate")
+        return accepted("System Updates Started.", job)
     except Exception as e:
         log.error(f"System Updates Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
@@ -90,9 +89,11 @@ def run_system_updates():
 @cyclone_bp.route("/run_full_cycle", methods=["POST"])
 def run_full_cycle():
     try:
-        run_in_background(lambda: asyncio.run(current_app.cyclone.run_cycle()),
-                          name="FullCycle")
-        return jsonify({"message": "Full Cycle Started."}), 202
+        cyclone = current_app.cyclone
+        # Waits for the sonic monitor's cycle instead of running a second one.
+        job = run_in_background(lambda: cyclone.run_exclusive_cycle(owner="sonic_app"),
+                                name="FullCycle")
+        return accepted("Full Cycle Started.", job)
     except Exception as e:
         log.error(f"Full Cycle Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
@@ -100,9 +101,9 @@ def run_full_cycle():
 @cyclone_bp.route("/clear_all_data", methods=["POST"])
 def clear_all_data():
     try:
-        run_in_background(lambda: asyncio.run(current_app.cyclone.run_clear_all_data()),
-                          name="ClearAllData")
-        return jsonify({"message": "Clear All Data Started."}), 202
+        job = run_in_background(current_app.cyclone.run_clear_all_data,
+                                name="ClearAllData")
+        return accepted("Clear All Data Started.", job)
     except Exception as e:
         log.error(f"Clear All Data Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
@@ -111,9 +112,9 @@ def clear_all_data():
 @cyclone_bp.route("/run_create_alerts", methods=["POST"])
 def run_create_alerts():
     try:
-        run_in_background(lambda: asyncio.run(current_app.cyclone.alert_core.create_all_alerts()),
-                          name="CreateAlerts")
-        return jsonify({"message": "Alert creation started."}), 202
+        job = run_in_background(current_app.cyclone.alert_core.create_all_alerts,
+                                name="CreateAlerts")
+        return accepted("Alert creation started.", job)
     except Exception as e:
         log.error(f"Create Alerts Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
@@ -121,13 +122,25 @@ def run_create_alerts():
 @cyclone_bp.route("/clear_alerts", methods=["POST"])
 def clear_alerts():
     try:
-        run_in_background(current_app.cyclone.clear_alerts_backend,
-                          name="ClearAlerts")
-        return jsonify({"message": "Alert deletion started."}), 202
+        job = run_in_background(current_app.cyclone.clear_alerts_backend,
+                                name="ClearAlerts")
+        return accepted("Alert deletion started.", job)
     except Exception as e:
         log.error(f"Clear Alerts Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
 
+# --- Job Status ---
+@cyclone_bp.route("/jobs", methods=["GET"])
+def list_jobs():
+    return jsonify({"jobs": get_worker().jobs()})
+
+@cyclone_bp.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    job = get_worker().get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(job)
+
 @cyclone_bp.route("/cyclone_logs", methods=["GET"])
 def api_cyclone_logs():
     try:
@@ -2,14 +2,24 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import asyncio
+import json
 import logging
+import socket
+import threading
+import time
+from types import SimpleNamespace
 from datetime import datetime
 from uuid import uuid4
 import traceback  # PATCH: for full stack info
 
 from alert_core.alert_core import AlertCore #alert_service_manager import AlertServiceManager
 from data.data_locker import DataLocker
-from core.constants import DB_PATH, ALERT_LIMITS_PATH
+from core.constants import (
+    DB_PATH, ALERT_LIMITS_PATH, CONFIG_PATH, CYCLE_LEASE_TTL, CYCLE_LEASE_WAIT,
+    TICK_HEDGE_INTERVAL, TICK_MIN_CHANGE_PCT,
+)
+from core.cancellation import CancelToken, StepCancelled, cancel_scope
+from core.tick_bus import get_tick_bus
 from core.logging import log
 
 # PATCH: Import SystemCore for death screams
@@ -29,6 +39,74 @@ from hedge_core.hedge_core import HedgeCore
 global_data_locker = DataLocker(str(DB_PATH))  # There can be only one
 logging.basicConfig(level=logging.DEBUG)
 
+CYCLONE_LEDGER_NAME = "cyclone"
+
+# Only one process at a time may run a full cycle against the database.
+CYCLE_LEASE_NAME = "cyclone_cycle"
+WAIT = "wait"  # another process is cycling: wait for its result
+SKIP = "skip"  # another process is cycling: skip this run
+LEASE_LOST = "cycle lease lost"  # cancel reason for a step whose lease was taken over
+
+# Tick reactions and the cycle steps that write prices, positions, alerts or
+# hedges take this lease, so only one of them rewrites that state at a time.
+RISK_LEASE_NAME = "cyclone_risk"
+RISK_STEPS = frozenset({
+    "market_updates", "check_jupiter_for_updates", "enrich_positions",
+    "enrich_alerts", "update_evaluated_value", "create_portfolio_alerts",
+    "create_position_alerts", "evaluate_alerts", "cleanse_ids",
+    "link_hedges", "update_hedges",
+})
+RISK_LEASE_POLL = 0.1
+
+# What a cycle does when a step misses its deadline.
+CONTINUE = "continue"                # keep going; later steps use what is already stored
+SKIP_DEPENDENTS = "skip_dependents"  # also skip the steps listed in "dependents"
+ABORT = "abort"                      # end the cycle here
+
+DEFAULT_STEP_POLICY = {"deadline_seconds": 30, "on_timeout": CONTINUE, "dependents": []}
+
+# Per-step deadlines and timeout policies; the optional "cyclone_steps"
+# section of sonic_config.json overrides individual fields.
+STEP_POLICIES = {
+    "update_operations": {"deadline_seconds": 30},
+    # Prices are stored atomically; a timeout leaves the last stored prices in use.
+    "market_updates": {"deadline_seconds": 45},
+    # Positions reconcile in one transaction at the end; a timeout changes nothing.
+    "check_jupiter_for_updates": {"deadline_seconds": 60},
+    "enrich_positions": {"deadline_seconds": 30},
+    # Evaluating half-enriched alerts would act on stale values.
+    "enrich_alerts": {"deadline_seconds": 30, "on_timeout": SKIP_DEPENDENTS,
+                      "dependents": ["update_evaluated_value", "evaluate_alerts"]},
+    "update_evaluated_value": {"deadline_seconds": 30},
+    "create_portfolio_alerts": {"deadline_seconds": 15},
+    "create_position_alerts": {"deadline_seconds": 15},
+    "create_global_alerts": {"deadline_seconds": 15},
+    "evaluate_alerts": {"deadline_seconds": 45},
+    "cleanse_ids": {"deadline_seconds": 15},
+    # Updating hedges that were only partly relinked would mix old and new groups.
+    "link_hedges": {"deadline_seconds": 20, "on_timeout": SKIP_DEPENDENTS, "dependents": ["update_hedges"]},
+    "update_hedges": {"deadline_seconds": 30},
+}
+
+
+def load_step_policies(path=CONFIG_PATH) -> dict:
+    """:data:`STEP_POLICIES` filled with defaults and overridden by sonic_config's ``cyclone_steps``."""
+    overrides = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            overrides = json.load(f).get("cyclone_steps") or {}
+    except (OSError, ValueError):
+        pass
+    policies = {}
+    for step in set(STEP_POLICIES) | set(overrides):
+        policy = {**DEFAULT_STEP_POLICY, **STEP_POLICIES.get(step, {}), **(overrides.get(step) or {})}
+        if policy["on_timeout"] not in (CONTINUE, SKIP_DEPENDENTS, ABORT):
+            log.warning(f"⚠️ Unknown on_timeout '{policy['on_timeout']}' for {step}; using continue",
+                        source="Cyclone")
+            policy["on_timeout"] = CONTINUE
+        policies[step] = policy
+    return policies
+
 def configure_cyclone_console_log():
     """
     🧠 Centralized Cyclone Console Log Config
@@ -66,9 +144,13 @@ def configure_cyclone_console_log():
 
 
 class Cyclone:
-    def __init__(self, monitor_core=None, poll_interval=60):
+    def __init__(self, monitor_core=None, poll_interval=60, step_policies=None):
         self.logger = logging.getLogger("Cyclone")
         self.poll_interval = poll_interval
+        self.step_policies = step_policies if step_policies is not None else load_step_policies()
+        self._step_token = None  # token of the step run_cycle is running
+        self._tick_cores = None
+        self._tick_cores_lock = threading.Lock()
         self.logger.setLevel(logging.DEBUG)
         self.monitor_core = monitor_core or MonitorCore()
 
@@ -142,8 +224,25 @@ class Cyclone:
         print("💡 DEBUG: calling CyclonePositionService.update_positions_from_jupiter()")
         self.position_core.update_positions_from_jupiter()
 
+    def step_policy(self, step: str) -> dict:
+        return {**DEFAULT_STEP_POLICY, **self.step_policies.get(step, {})}
+
     # PATCH: Wrap each run step in try/except and call death on terminal error
-    async def run_cycle(self, steps=None):
+    async def run_cycle(self, steps=None, lease=None):
+        """
+        Run ``steps`` (all by default) in order and return ``{step: outcome}``.
+        With a cycle ``lease`` the fence is checked before every step, and a
+        holder whose lease was taken over stops without writing further. A
+        takeover noticed mid-step (see :meth:`run_exclusive_cycle`) cancels
+        the step's token, so it stops at its next cancellation point.
+
+        Each step runs under its policy's ``deadline_seconds``. When it
+        expires the step's :class:`~core.cancellation.CancelToken` is
+        cancelled so work it started in threads stops at its next
+        cancellation point, a ``Timeout`` entry is written to the ``cyclone``
+        ledger, and ``on_timeout`` decides whether the cycle continues,
+        skips the step's dependents, or aborts. Any other error is terminal.
+        """
         available_steps = {
            # "clear_all_data": self.run_clear_all_data,
             "update_operations": self.run_operations_update,
@@ -162,15 +261,48 @@ class Cyclone:
         }
 
         steps = steps or list(available_steps.keys())
+        outcomes = {}
+        skip = {}
 
         for step in steps:
             if step not in available_steps:
                 log.warning(f"⚠️ Unknown step: '{step}'", source="Cyclone")
                 continue
+            if step in skip:
+                log.warning(f"⏭️ Skipping step '{step}' after '{skip[step]}' timed out", source="Cyclone")
+                outcomes[step] = {"status": "skipped", "after": skip[step]}
+                continue
+            if lease is not None and not self.data_locker.leases.holds(lease):
+                log.error(f"⛔ Cycle lease {lease.token} was taken over; stopping before '{step}'",
+                          source="Cyclone")
+                outcomes[step] = {"status": "fenced", "token": lease.token}
+                break
+            policy = self.step_policy(step)
+            deadline = policy["deadline_seconds"]
+            token = CancelToken.with_timeout(step, deadline)
+            self._step_token = token
             log.info(f"▶️ Running step: {step}", source="Cyclone")
+            started = time.monotonic()
             try:
-                await available_steps[step]()
+                with cancel_scope(token):
+                    await asyncio.wait_for(self._run_step(step, available_steps[step], deadline), deadline)
+            except (asyncio.TimeoutError, StepCancelled):
+                if token.reason == LEASE_LOST:
+                    log.error(f"⛔ Cycle lease {lease.token} was taken over during '{step}'; stopping",
+                              source="Cyclone")
+                    outcomes[step] = {"status": "fenced", "token": lease.token}
+                    break
+                token.cancel("deadline exceeded")
+                outcomes[step] = self._record_timeout(step, policy, time.monotonic() - started)
+                if policy["on_timeout"] == ABORT:
+                    log.error(f"⛔ Cycle aborted after '{step}' timed out", source="Cyclone")
+                    break
+                if policy["on_timeout"] == SKIP_DEPENDENTS:
+                    for dependent in policy["dependents"]:
+                        skip.setdefault(dependent, step)
+                continue
             except Exception as e:
+                token.cancel("step failed")
                 log.error(f"💀 Terminal failure during step '{step}': {e}", source="Cyclone")
                 self.system_core.death({
                     "message": f"💀 Cyclone terminal failure during step '{step}'",
@@ -182,6 +314,196 @@ class Cyclone:
                     }
                 })
                 raise  # Optionally re-raise if you want to halt further steps
+            outcomes[step] = {"status": "ok", "elapsed": round(time.monotonic() - started, 3)}
+
+        return outcomes
+
+    async def _run_step(self, step: str, step_fn, deadline: float):
+        """Run ``step_fn``; risk steps first wait (within the deadline) for the risk lease."""
+        if step not in RISK_STEPS:
+            return await step_fn()
+        leases = self.data_locker.leases
+        holder = self._holder(f"cycle:{step}")
+        lease = leases.acquire(RISK_LEASE_NAME, holder, deadline)
+        while lease is None:
+            await asyncio.sleep(RISK_LEASE_POLL)
+            lease = leases.acquire(RISK_LEASE_NAME, holder, deadline)
+        try:
+            return await step_fn()
+        finally:
+            leases.release(lease)
+
+    @staticmethod
+    def _holder(owner: str) -> str:
+        return f"{owner}@{socket.gethostname()}:{os.getpid()}"
+
+    async def run_exclusive_cycle(self, steps=None, owner: str = "cyclone", on_busy: str = WAIT,
+                                  ttl: float = CYCLE_LEASE_TTL, wait_timeout: float = CYCLE_LEASE_WAIT):
+        """
+        :meth:`run_cycle` under the cross-process cycle lease. The lease is
+        renewed every ``ttl / 3`` seconds while the cycle runs and released
+        with the outcomes. If another process holds it, ``on_busy`` either
+        waits for that cycle and returns its outcomes (``wait``) or returns
+        ``None`` at once (``skip``).
+
+        Renewal runs on the event loop while steps work in threads, so the
+        lease only lapses if this process stalls for a whole ``ttl``; keep
+        ``ttl`` above the largest step deadline plus the ``ttl / 3`` renew
+        interval. If a renewal finds the lease taken over, the running
+        step's token is cancelled: writers that check for cancellation
+        (position reconcile, alert updates) stop before their next write,
+        and the step is reported as ``fenced``.
+        """
+        leases = self.data_locker.leases
+        holder = self._holder(owner)
+        lease = leases.acquire(CYCLE_LEASE_NAME, holder, ttl)
+        if lease is None:
+            return await self._join_running_cycle(holder, on_busy, wait_timeout)
+
+        renewer = asyncio.create_task(self._renew_lease(lease, ttl))
+        outcomes = None
+        try:
+            outcomes = await self.run_cycle(steps, lease=lease)
+            return outcomes
+        finally:
+            renewer.cancel()
+            leases.release(lease, outcomes)
+
+    async def _renew_lease(self, lease, ttl: float):
+        leases = self.data_locker.leases
+        while True:
+            await asyncio.sleep(ttl / 3)
+            renewed = await asyncio.to_thread(leases.renew, lease, ttl)
+            if renewed is None and not await asyncio.to_thread(leases.holds, lease):
+                log.error(f"⛔ Lost cycle lease {lease.token}", source="Cyclone")
+                if self._step_token is not None:
+                    self._step_token.cancel(LEASE_LOST)
+                return
+
+    async def _join_running_cycle(self, holder: str, on_busy: str, wait_timeout: float):
+        running = self.data_locker.leases.current(CYCLE_LEASE_NAME) or {}
+        info = {"holder": holder, "running_holder": running.get("holder"), "token": running.get("token"),
+                "on_busy": on_busy}
+        if on_busy == SKIP or not running:
+            log.info(f"⏭️ Cycle already running in {info['running_holder']}; skipping", source="Cyclone")
+            self._record_lease_event("Skipped", info)
+            return None
+        log.info(f"⏳ Cycle already running in {info['running_holder']}; waiting for its result", source="Cyclone")
+        finished, result = await asyncio.to_thread(
+            self.data_locker.leases.wait_for_release, CYCLE_LEASE_NAME, running["token"], wait_timeout
+        )
+        self._record_lease_event("Joined" if finished else "Skipped", {**info, "finished": finished})
+        return result
+
+    def _record_lease_event(self, status: str, metadata: dict):
+        try:
+            self.data_locker.ledger.insert_ledger_entry(CYCLONE_LEDGER_NAME, status, metadata=metadata)
+        except Exception as e:
+            log.error(f"❌ Failed to record cycle lease event: {e}", source="Cyclone")
+
+    def _record_timeout(self, step: str, policy: dict, elapsed: float) -> dict:
+        outcome = {
+            "status": "timeout",
+            "step": step,
+            "deadline_seconds": policy["deadline_seconds"],
+            "elapsed": round(elapsed, 3),
+            "on_timeout": policy["on_timeout"],
+            "skipped": policy["dependents"] if policy["on_timeout"] == SKIP_DEPENDENTS else [],
+        }
+        log.warning(f"⏰ Step '{step}' exceeded its {policy['deadline_seconds']}s deadline "
+                    f"({policy['on_timeout']})", source="Cyclone", payload=outcome)
+        try:
+            self.data_locker.ledger.insert_ledger_entry(CYCLONE_LEDGER_NAME, "Timeout", metadata=outcome)
+        except Exception as e:
+            log.error(f"❌ Failed to record step timeout: {e}", source="Cyclone")
+        return outcome
+
+    @staticmethod
+    async def _off_loop(coro_fn, *args, **kwargs):
+        """
+        Run an ``async`` core method that does blocking work on its own loop
+        in a worker thread, so the step deadline can fire while it runs.
+        """
+        return await asyncio.to_thread(lambda: asyncio.run(coro_fn(*args, **kwargs)))
+
+    def tick_cores(self):
+        """
+        Position, alert and hedge cores for tick handlers, on a DataLocker of
+        their own: handlers run on bus threads, and sharing the cycle's
+        connection would mix their commits into the cycle's transactions.
+        """
+        with self._tick_cores_lock:
+            if self._tick_cores is None:
+                path = getattr(self.data_locker.db, "db_path", None)
+                dl = self.data_locker if not path or path == ":memory:" else DataLocker(path)
+                self._tick_cores = SimpleNamespace(
+                    data_locker=dl,
+                    position_core=PositionCore(dl),
+                    alert_core=AlertCore(dl, config_loader=lambda: self.config),
+                    hedge_core=HedgeCore(dl),
+                )
+            return self._tick_cores
+
+    async def run_tick_reaction(self, assets, cores=None):
+        """Incremental pass for assets whose price just moved: enrich their positions, then re-check alerts."""
+        cores = cores or self
+        log.info(f"⚡ Tick reaction for {sorted(assets)}", source="Cyclone")
+        await cores.position_core.enrich_positions(assets=assets)
+        await cores.alert_core.process_alerts(assets=assets)
+
+    def _with_risk_lease(self, owner: str, work, what: str, ttl: float) -> bool:
+        leases = self.data_locker.leases
+        lease = leases.acquire(RISK_LEASE_NAME, self._holder(owner), ttl)
+        if lease is None:
+            running = (leases.current(RISK_LEASE_NAME) or {}).get("holder")
+            log.info(f"⏭️ Risk lease held by {running}; skipping {what}", source="Cyclone")
+            return False
+        try:
+            work()
+        finally:
+            leases.release(lease)
+        return True
+
+    def react_to_ticks(self, assets, ttl: float = CYCLE_LEASE_TTL) -> bool:
+        """
+        Run :meth:`run_tick_reaction` under the risk lease. If a cycle step
+        (or another reaction) holds it, the batch is skipped: that pass
+        evaluates the same alerts and the next move triggers a new reaction.
+        """
+        return self._with_risk_lease(
+            "ticks",
+            lambda: asyncio.run(self.run_tick_reaction(assets, self.tick_cores())),
+            f"tick batch {sorted(assets)}",
+            ttl,
+        )
+
+    def react_to_hedge_ticks(self, ttl: float = CYCLE_LEASE_TTL) -> bool:
+        """Tick-driven hedge update, skipped like :meth:`react_to_ticks` while the risk lease is held."""
+        return self._with_risk_lease(
+            "tick_hedges", lambda: self.tick_cores().hedge_core.update_hedges(), "hedge update", ttl
+        )
+
+    def attach_tick_bus(self, bus=None, min_change_pct: float = TICK_MIN_CHANGE_PCT,
+                        hedge_interval: float = TICK_HEDGE_INTERVAL):
+        """
+        Subscribe this engine to price ticks. Risk checks run as soon as an
+        asset moves ``min_change_pct``; hedge checks at most every
+        ``hedge_interval`` seconds. Handlers run on the bus's worker threads
+        against :meth:`tick_cores`, under the risk lease.
+        """
+        bus = bus or get_tick_bus()
+        bus.subscribe(
+            "cyclone_risk",
+            lambda batch: self.react_to_ticks(set(batch)),
+            min_change_pct=min_change_pct,
+        )
+        bus.subscribe(
+            "cyclone_hedges",
+            lambda batch: self.react_to_hedge_ticks(),
+            min_change_pct=min_change_pct,
+            min_interval=hedge_interval,
+        )
+        return bus
 
     def run_delete_all_data(self):
         log.warning("⚠️ Deletion requested via legacy method (run_delete_all_data)", source="Cyclone")
@@ -194,19 +516,19 @@ class Cyclone:
         await self.portfolio_runner.create_portfolio_alerts()
 
     async def run_link_hedges(self):
-        self.hedge_core.link_hedges()
+        await asyncio.to_thread(self.hedge_core.link_hedges)
 
     async def run_update_hedges(self):
         await asyncio.to_thread(self.hedge_core.update_hedges)
 
     async def run_alert_evaluation(self):
-        await self.alert_core.run_alert_evaluation()
+        await self._off_loop(self.alert_core.run_alert_evaluation)
 
     async def run_create_position_alerts(self):
-        self.alert_core.create_position_alerts()
+        await asyncio.to_thread(self.alert_core.create_position_alerts)
 
     async def run_create_portfolio_alerts(self):
-        self.alert_core.create_portfolio_alerts()
+        await asyncio.to_thread(self.alert_core.create_portfolio_alerts)
 
     async def run_create_global_alerts(self):
         #await self.alert_core.create_global_alerts()
@@ -218,19 +540,20 @@ class Cyclone:
 
     async def run_cleanse_ids(self):
         log.info("🧹 Running cleanse_ids: clearing stale alerts", source="Cyclone")
-        self.alert_core.clear_stale_alerts()
+        await asyncio.to_thread(self.alert_core.clear_stale_alerts)
+        await asyncio.to_thread(self.data_locker.alert_history.prune)
         log.success("✅ Alert IDs cleansed", source="Cyclone")
 
     async def run_enrich_positions(self):
-        await self.position_core.enrich_positions()
+        await self._off_loop(self.position_core.enrich_positions)
         log.success("✅ Position enrichment complete", source="Cyclone")
 
     async def run_alert_enrichment(self):
-        await self.alert_core.enrich_all_alerts()
+        await self._off_loop(self.alert_core.enrich_all_alerts)
         log.success("✅ Alert enrichment complete", source="Cyclone")
 
     async def run_update_evaluated_value(self):
-        await self.alert_core.update_evaluated_values()
+        await self._off_loop(self.alert_core.update_evaluated_values)
         log.success("✅ Evaluated alert values updated", source="Cyclone")
 
     def clear_prices_backend(self):
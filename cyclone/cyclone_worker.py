@@ -0,0 +1,178 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import inspect
+import json
+import queue
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from core.logging import log
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _jsonable(value):
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+class CycloneJob:
+    def __init__(self, key: str, task_func):
+        self.id = uuid4().hex[:12]
+        self.key = key
+        self.task_func = task_func
+        self.status = QUEUED
+        self.coalesced = 0
+        self.result = None
+        self.error = None
+        self.submitted_at = _now()
+        self.started_at = None
+        self.finished_at = None
+        self.done = threading.Event()
+
+    def snapshot(self) -> dict:
+        return {
+            "id": self.id,
+            "key": self.key,
+            "status": self.status,
+            "coalesced": self.coalesced,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "result": _jsonable(self.result),
+            "error": self.error,
+        }
+
+
+class CycloneWorker:
+    """
+    One long-lived thread that owns an event loop and runs Cyclone jobs
+    from a queue, one at a time, so dashboard requests never start
+    overlapping cycles.
+
+    Submitting a job whose ``key`` is already waiting in the queue returns
+    that job instead of queueing another; a job that is already running is
+    not reused, since a later request may need fresher data. Finished jobs
+    are kept (up to ``history``) for status polling.
+    """
+
+    def __init__(self, history: int = 100, context_factory=None):
+        self.history = history
+        self.context_factory = context_factory
+        self._queue = queue.Queue()
+        self._pending = {}
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._loop = None
+        self.current = None
+
+    def submit(self, key: str, task_func) -> CycloneJob:
+        """Queue ``task_func`` (a coroutine function or plain callable) under ``key``."""
+        self.start()
+        with self._lock:
+            job = self._pending.get(key)
+            if job is not None:
+                job.coalesced += 1
+                log.info(f"🔁 '{key}' already queued as job {job.id}; coalesced", source="CycloneWorker")
+                return job
+            job = CycloneJob(key, task_func)
+            self._pending[key] = job
+            self._jobs[job.id] = job
+            self._trim()
+        self._queue.put(job)
+        log.info(f"📥 Queued job {job.id} ({key})", source="CycloneWorker")
+        return job
+
+    def _trim(self):
+        while len(self._jobs) > self.history:
+            oldest = next(iter(self._jobs.values()))
+            if oldest.status in (QUEUED, RUNNING):
+                break
+            self._jobs.popitem(last=False)
+
+    def get(self, job_id: str):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.snapshot() if job else None
+
+    def jobs(self) -> list:
+        with self._lock:
+            return [job.snapshot() for job in reversed(self._jobs.values())]
+
+    def wait(self, job_id: str, timeout: float = None):
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        job.done.wait(timeout)
+        return job.snapshot()
+
+    # --------------------------------------------------------------
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            while True:
+                job = self._queue.get()
+                if job is None:
+                    return
+                self._execute(job)
+        finally:
+            self._loop.close()
+
+    def _execute(self, job: CycloneJob):
+        with self._lock:
+            self._pending.pop(job.key, None)
+            job.status = RUNNING
+            job.started_at = _now()
+            self.current = job
+        log.info(f"🧵 Starting job {job.id} ({job.key})", source="CycloneWorker")
+        try:
+            with (self.context_factory() if self.context_factory else nullcontext()):
+                result = job.task_func()
+                if inspect.isawaitable(result):
+                    result = self._loop.run_until_complete(result)
+            job.result = result
+            job.status = DONE
+            log.success(f"✅ Completed job {job.id} ({job.key})", source="CycloneWorker")
+        except Exception as e:
+            job.error = str(e) or e.__class__.__name__
+            job.status = FAILED
+            log.error(f"🔥 Job {job.id} ({job.key}) crashed: {e}", source="CycloneWorker")
+        finally:
+            with self._lock:
+                job.finished_at = _now()
+                self.current = None
+            job.done.set()
+
+    def start(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return self
+            self._thread = threading.Thread(target=self._run, name="cyclone-worker", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        """Finish the queued jobs, then end the worker thread."""
+        self._queue.put(None)
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
@@ -68,3 +68,101 @@ class Alert(BaseModel):
 
     class Config:
         use_enum_values = True  # serialize enums into their string values (not Enum objects)
+
+
+# === LIGHTWEIGHT READ MODEL ===
+
+# Column → default for every field an AlertRecord carries. Mirrors the
+# defaults on ``Alert`` plus the DB-only ``created_at`` / ``asset_type``.
+ALERT_RECORD_DEFAULTS = {
+    "id": None,
+    "created_at": None,
+    "alert_type": None,
+    "alert_class": "Unknown",
+    "asset": None,
+    "asset_type": None,
+    "trigger_value": None,
+    "condition": None,
+    "evaluated_value": 0.0,
+    "position_reference_id": None,
+    "position_type": None,
+    "notification_type": NotificationType.SMS.value,
+    "level": AlertLevel.NORMAL.value,
+    "last_triggered": None,
+    "status": Status.ACTIVE.value,
+    "frequency": 1,
+    "counter": 0,
+    "liquidation_distance": 0.0,
+    "travel_percent": 0.0,
+    "liquidation_price": 0.0,
+    "starting_value": None,
+    "notes": "",
+    "description": "",
+}
+
+_VALID_LEVELS = {lvl.value for lvl in AlertLevel}
+
+
+class AlertRecord:
+    """
+    Slotted, validation-free alert built from rows in our own ``alerts`` table.
+
+    Exposes the same attributes as :class:`Alert` so enrichment and evaluation
+    can use either. Rows we wrote ourselves are trusted, so nothing is
+    validated here.
+    """
+
+    __slots__ = tuple(ALERT_RECORD_DEFAULTS)
+
+    def __init__(self, **fields):
+        for name, default in ALERT_RECORD_DEFAULTS.items():
+            setattr(self, name, fields.get(name, default))
+
+    @classmethod
+    def from_row(cls, row) -> "AlertRecord":
+        """Build a record from a single ``sqlite3.Row`` (or mapping) of the alerts table."""
+        return cls.from_rows([dict(row)])[0]
+
+    @classmethod
+    def from_rows(cls, rows) -> list:
+        """Build records from ``alerts`` rows sharing one column layout.
+
+        Column positions are resolved once per batch so each row costs only a
+        handful of slot assignments.
+        """
+        if not rows:
+            return []
+
+        columns = list(rows[0].keys())
+        position = {name: i for i, name in enumerate(columns)}
+        plan = [(name, position.get(name), default) for name, default in ALERT_RECORD_DEFAULTS.items()]
+        has_starting_value = "starting_value" in position
+        is_mapping = isinstance(rows[0], dict)
+        normal = AlertLevel.NORMAL.value
+
+        records = []
+        new = cls.__new__
+        for row in rows:
+            values = tuple(row.values()) if is_mapping else row
+            record = new(cls)
+            for name, idx, default in plan:
+                setattr(record, name, default if idx is None else values[idx])
+
+            level = record.level
+            if level not in _VALID_LEVELS:
+                level = str(level or "").strip().capitalize()
+                record.level = level if level in _VALID_LEVELS else normal
+            if not has_starting_value:
+                record.starting_value = record.trigger_value
+            records.append(record)
+        return records
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return (
+            f"AlertRecord(id={self.id!r}, alert_type={self.alert_type!r}, "
+            f"alert_class={self.alert_class!r}, level={self.level!r}, "
+            f"evaluated_value={self.evaluated_value})"
+        )
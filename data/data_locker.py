@@ -26,8 +26,10 @@ from data.dl_brokers import DLBrokerManager
 from data.dl_portfolio import DLPortfolioManager
 from data.dl_system_data import DLSystemDataManager
 from data.dl_monitor_ledger import DLMonitorLedgerManager
+from data.dl_alert_history import DLAlertHistoryManager
 from data.dl_modifiers import DLModifierManager
 from data.dl_hedges import DLHedgeManager
+from data.dl_cycle_lease import DLCycleLeaseManager
 from core.constants import SONIC_SAUCE_PATH, BASE_DIR
 from core.core_imports import log
 from datetime import datetime
@@ -46,7 +48,11 @@ class DataLocker:
         self.portfolio = DLPortfolioManager(self.db)
         self.system = DLSystemDataManager(self.db)
         self.ledger = DLMonitorLedgerManager(self.db)
+        self.alert_history = DLAlertHistoryManager(self.db)
         self.modifiers = DLModifierManager(self.db)
+        # Lease writes commit on their own connection so that acquiring or
+        # renewing mid-step never commits a step's open transaction.
+        self.leases = DLCycleLeaseManager(self.db if db_path == ":memory:" else DatabaseManager(db_path))
 
         try:
             self.initialize_database()
@@ -244,6 +250,17 @@ class DataLocker:
         # --- Automatic schema migrations ---
         _ensure_column(cursor, "positions", "status TEXT DEFAULT 'ACTIVE'")
 
+        index_defs = {
+            "idx_alerts_status": "CREATE INDEX IF NOT EXISTS idx_alerts_status ON alerts (status)",
+            "idx_prices_asset_time": "CREATE INDEX IF NOT EXISTS idx_prices_asset_time ON prices (asset_type, last_update_time)",
+        }
+        for name, ddl in index_defs.items():
+            try:
+                cursor.execute(ddl)
+                log.debug(f"Index ensured: {name}", source="DataLocker")
+            except Exception as e:
+                log.error(f"❌ Failed creating index {name}: {e}", source="DataLocker")
+
         # Ensure a default row exists for system vars so lookups don't fail
         try:
             cursor.execute("INSERT OR IGNORE INTO system_vars (id) VALUES (1)")
@@ -278,6 +295,9 @@ class DataLocker:
     def get_latest_price(self, asset_type: str) -> dict:
         return self.prices.get_latest_price(asset_type)
 
+    def get_latest_prices(self, asset_types: list = None) -> dict:
+        return self.prices.get_latest_prices(asset_types)
+
     def set_last_update_times(self, updates: dict):
         self.system.set_last_update_times(updates)
 
@@ -303,6 +323,13 @@ class DataLocker:
         }
         self.prices.insert_price(price_data)
 
+    def insert_or_update_prices(self, prices: dict, source="PriceMonitor") -> int:
+        """Record ``{asset_type: price}`` in a single transaction."""
+        return self.prices.insert_prices([
+            {"asset_type": asset, "current_price": price, "source": source}
+            for asset, price in prices.items()
+        ])
+
     def get_position_by_reference_id(self, pos_id: str):
         return self.positions.get_position_by_id(pos_id)
 
@@ -0,0 +1,197 @@
+# dl_alert_history.py
+"""
+Author: BubbaDiego
+Module: DLAlertHistoryManager
+Description:
+    Append-only log of alert level transitions. A row is written only when an
+    alert's level actually changes, so the table stays small and trend or
+    matrix views become indexed range reads instead of log parsing.
+
+    Timestamps are naive local ISO strings like the rest of the database;
+    timezone-aware values passed in are converted so string comparisons in
+    range reads and pruning stay correct.
+
+Dependencies:
+    - DatabaseManager from database.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from datetime import datetime, timedelta
+from core.logging import log
+
+
+class DLAlertHistoryManager:
+    DEFAULT_RETENTION_DAYS = 30
+    DEFAULT_MAX_ROWS_PER_ALERT = 500
+
+    def __init__(self, db):
+        self.db = db
+        self.ensure_table()
+
+    def ensure_table(self):
+        cursor = self.db.get_cursor()
+        if not cursor:
+            log.error("❌ DB unavailable, alert history table not created", source="DLAlertHistory")
+            return
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS alert_level_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                alert_id TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                previous_level TEXT,
+                level TEXT NOT NULL,
+                evaluated_value REAL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alert_level_history_alert_time
+            ON alert_level_history (alert_id, timestamp)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alert_level_history_time
+            ON alert_level_history (timestamp)
+        """)
+        self._normalize_stored_timestamps(cursor)
+        self.db.commit()
+        log.debug("alert_level_history table ensured", source="DLAlertHistory")
+
+    @staticmethod
+    def normalize_timestamp(value):
+        """Return ``value`` as a naive local ISO string; unparsable values pass through."""
+        if not value:
+            return value
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except ValueError:
+            return value
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed.isoformat()
+
+    def _normalize_stored_timestamps(self, cursor):
+        # Early rows were written as UTC with an offset suffix.
+        cursor.execute("""
+            SELECT id, timestamp FROM alert_level_history
+            WHERE timestamp LIKE '%+__:__' OR timestamp LIKE '%-__:__' OR timestamp LIKE '%Z'
+        """)
+        rows = [(self.normalize_timestamp(row["timestamp"]), row["id"]) for row in cursor.fetchall()]
+        if rows:
+            cursor.executemany("UPDATE alert_level_history SET timestamp = ? WHERE id = ?", rows)
+            log.info(f"🕒 Normalized {len(rows)} alert history timestamps to local time",
+                     source="DLAlertHistory")
+
+    def record_transition(self, alert_id: str, previous_level, level, evaluated_value=None,
+                          timestamp: str = None, commit: bool = True):
+        """Append a level transition. Callers only invoke this on real changes."""
+        cursor = self.db.get_cursor()
+        if not cursor:
+            log.error("❌ DB unavailable, alert transition not stored", source="DLAlertHistory")
+            return
+        cursor.execute("""
+            INSERT INTO alert_level_history (
+                alert_id, timestamp, previous_level, level, evaluated_value
+            ) VALUES (?, ?, ?, ?, ?)
+        """, (
+            alert_id,
+            self.normalize_timestamp(timestamp) or datetime.now().isoformat(),
+            previous_level,
+            level,
+            evaluated_value,
+        ))
+        if commit:
+            self.db.commit()
+        log.debug(f"📈 Alert {alert_id} level {previous_level} → {level}", source="DLAlertHistory")
+
+    def get_history(self, alert_id: str, since: str = None, until: str = None, limit: int = None) -> list:
+        """Return transitions for one alert, oldest first, optionally within [since, until]."""
+        try:
+            sql = "SELECT * FROM alert_level_history WHERE alert_id = ?"
+            params = [alert_id]
+            if since:
+                sql += " AND timestamp >= ?"
+                params.append(self.normalize_timestamp(since))
+            if until:
+                sql += " AND timestamp <= ?"
+                params.append(self.normalize_timestamp(until))
+            sql += " ORDER BY timestamp ASC"
+            if limit:
+                sql += " LIMIT ?"
+                params.append(int(limit))
+            cursor = self.db.get_cursor()
+            cursor.execute(sql, params)
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            log.error(f"❌ Failed to read history for alert {alert_id}: {e}", source="DLAlertHistory")
+            return []
+
+    def get_recent_transitions(self, since: str = None, limit: int = 100) -> list:
+        """Return the newest transitions across all alerts (for matrix/status views)."""
+        try:
+            sql = "SELECT * FROM alert_level_history"
+            params = []
+            if since:
+                sql += " WHERE timestamp >= ?"
+                params.append(self.normalize_timestamp(since))
+            sql += " ORDER BY timestamp DESC LIMIT ?"
+            params.append(int(limit))
+            cursor = self.db.get_cursor()
+            cursor.execute(sql, params)
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            log.error(f"❌ Failed to read recent alert transitions: {e}", source="DLAlertHistory")
+            return []
+
+    def get_latest_levels(self, prefix: str) -> dict:
+        """Return ``{alert_id: level}`` from the newest transition of each alert id starting with ``prefix``."""
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute("""
+                SELECT alert_id, level FROM (
+                    SELECT alert_id, level, ROW_NUMBER() OVER (
+                        PARTITION BY alert_id ORDER BY timestamp DESC, id DESC
+                    ) AS rn
+                    FROM alert_level_history
+                    WHERE alert_id LIKE ? ESCAPE '\\'
+                ) WHERE rn = 1
+            """, (prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%",))
+            return {row["alert_id"]: row["level"] for row in cursor.fetchall()}
+        except Exception as e:
+            log.error(f"❌ Failed to read latest levels for {prefix}: {e}", source="DLAlertHistory")
+            return {}
+
+    def prune(self, max_age_days: int = None, max_rows_per_alert: int = None) -> int:
+        """Apply the retention policy and return the number of rows removed.
+
+        Rows older than ``max_age_days`` are dropped, then each alert is capped
+        to its newest ``max_rows_per_alert`` transitions.
+        """
+        max_age_days = self.DEFAULT_RETENTION_DAYS if max_age_days is None else max_age_days
+        max_rows_per_alert = (
+            self.DEFAULT_MAX_ROWS_PER_ALERT if max_rows_per_alert is None else max_rows_per_alert
+        )
+        try:
+            cursor = self.db.get_cursor()
+            cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+            cursor.execute("DELETE FROM alert_level_history WHERE timestamp < ?", (cutoff,))
+            removed = cursor.rowcount
+            cursor.execute("""
+                DELETE FROM alert_level_history WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY alert_id ORDER BY timestamp DESC, id DESC
+                        ) AS rn
+                        FROM alert_level_history
+                    ) WHERE rn > ?
+                )
+            """, (max_rows_per_alert,))
+            removed += cursor.rowcount
+            self.db.commit()
+            if removed:
+                log.info(f"🧹 Pruned {removed} alert history rows", source="DLAlertHistory")
+            return removed
+        except Exception as e:
+            log.error(f"❌ Alert history prune failed: {e}", source="DLAlertHistory")
+            return 0
@@ -0,0 +1,163 @@
+# dl_cycle_lease.py
+"""
+Author: BubbaDiego
+Module: DLCycleLeaseManager
+Description:
+    Cross-process leases stored in mother_brain.db. The Flask app and the
+    sonic monitor both run Cyclone cycles against the same database; a
+    named lease makes sure only one of them runs at a time.
+
+    * Expiry: a lease holds until ``expires_at`` (epoch seconds) unless
+      renewed, so a crashed holder blocks others for at most one TTL.
+    * Fencing: every acquisition bumps ``token``. A holder whose lease
+      expired and was taken over sees a newer token in :meth:`holds` and
+      must stop writing; its :meth:`release` is ignored.
+    * The finishing holder stores its result on the row, so a process that
+      found the cycle running can wait and reuse it.
+
+Dependencies:
+    - DatabaseManager from database.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+from core.logging import log
+
+Lease = namedtuple("Lease", "name holder token expires_at")
+
+
+class DLCycleLeaseManager:
+    def __init__(self, db, clock=time.time):
+        self.db = db
+        self.clock = clock
+        self._lock = threading.RLock()
+        self.ensure_table()
+
+    def ensure_table(self):
+        cursor = self.db.get_cursor()
+        if not cursor:
+            log.error("❌ DB unavailable, cycle_leases not created", source="DLCycleLease")
+            return
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS cycle_leases (
+                name TEXT PRIMARY KEY,
+                token INTEGER NOT NULL DEFAULT 0,
+                holder TEXT,
+                expires_at REAL NOT NULL DEFAULT 0,
+                acquired_at TEXT,
+                finished_at TEXT,
+                last_holder TEXT,
+                result TEXT
+            )
+        """)
+        self.db.commit()
+
+    @staticmethod
+    def _now_iso() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    def acquire(self, name: str, holder: str, ttl: float):
+        """Take ``name`` if it is free or expired; returns a :class:`Lease` or None."""
+        now = self.clock()
+        with self._lock:
+            try:
+                cursor = self.db.get_cursor()
+                cursor.execute("INSERT OR IGNORE INTO cycle_leases (name) VALUES (?)", (name,))
+                cursor.execute("""
+                    UPDATE cycle_leases
+                    SET holder = ?, token = token + 1, expires_at = ?, acquired_at = ?, finished_at = NULL
+                    WHERE name = ? AND (holder IS NULL OR expires_at <= ?)
+                """, (holder, now + ttl, self._now_iso(), name, now))
+                if cursor.rowcount != 1:
+                    self.db.commit()
+                    return None
+                cursor.execute("SELECT token FROM cycle_leases WHERE name = ?", (name,))
+                token = cursor.fetchone()[0]
+                self.db.commit()
+            except sqlite3.Error as e:
+                log.error(f"❌ Lease acquire failed for {name}: {e}", source="DLCycleLease")
+                return None
+        log.debug(f"🔐 {holder} acquired {name} (token {token})", source="DLCycleLease")
+        return Lease(name, holder, token, now + ttl)
+
+    def renew(self, lease: Lease, ttl: float):
+        """Extend a lease still held under its token; returns the renewed lease or None if lost."""
+        expires = self.clock() + ttl
+        with self._lock:
+            try:
+                cursor = self.db.get_cursor()
+                cursor.execute("""
+                    UPDATE cycle_leases SET expires_at = ?
+                    WHERE name = ? AND token = ? AND holder = ?
+                """, (expires, lease.name, lease.token, lease.holder))
+                renewed = cursor.rowcount == 1
+                self.db.commit()
+            except sqlite3.Error as e:
+                log.error(f"❌ Lease renew failed for {lease.name}: {e}", source="DLCycleLease")
+                return None
+        return lease._replace(expires_at=expires) if renewed else None
+
+    def holds(self, lease: Lease) -> bool:
+        """Fencing check: True while no newer holder has taken the lease over."""
+        row = self.current(lease.name)
+        return bool(row) and row["token"] == lease.token and row["holder"] == lease.holder
+
+    def release(self, lease: Lease, result=None) -> bool:
+        """Free the lease and store ``result`` for waiters; ignored if the lease was taken over."""
+        with self._lock:
+            try:
+                cursor = self.db.get_cursor()
+                cursor.execute("""
+                    UPDATE cycle_leases
+                    SET holder = NULL, expires_at = 0, finished_at = ?, last_holder = ?, result = ?
+                    WHERE name = ? AND token = ? AND holder = ?
+                """, (self._now_iso(), lease.holder, json.dumps(result, default=str),
+                      lease.name, lease.token, lease.holder))
+                released = cursor.rowcount == 1
+                self.db.commit()
+            except sqlite3.Error as e:
+                log.error(f"❌ Lease release failed for {lease.name}: {e}", source="DLCycleLease")
+                return False
+        if not released:
+            log.warning(f"⚠️ {lease.holder} lost {lease.name} (token {lease.token}) before release",
+                        source="DLCycleLease")
+        return released
+
+    def current(self, name: str):
+        with self._lock:
+            try:
+                cursor = self.db.get_cursor()
+                cursor.execute("SELECT * FROM cycle_leases WHERE name = ?", (name,))
+                row = cursor.fetchone()
+            except sqlite3.Error as e:
+                log.error(f"❌ Lease read failed for {name}: {e}", source="DLCycleLease")
+                return None
+        return dict(row) if row else None
+
+    def wait_for_release(self, name: str, token: int, timeout: float, poll: float = 0.5):
+        """
+        Wait for the holder of ``token`` to release ``name``. Returns
+        ``(True, result)`` once it has, or ``(False, None)`` on timeout or
+        if the holder let the lease expire without releasing it.
+        """
+        end = time.monotonic() + timeout
+        while True:
+            row = self.current(name)
+            if row is None or row["token"] != token:
+                return False, None
+            if row["holder"] is None:
+                try:
+                    return True, json.loads(row["result"]) if row["result"] else None
+                except ValueError:
+                    return True, None
+            if row["expires_at"] <= self.clock() or time.monotonic() >= end:
+                return False, None
+            time.sleep(poll)
@@ -16,13 +16,48 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from uuid import uuid4
 from datetime import datetime
 from core.core_imports import log
+from calc_core.portfolio_totals_cache import PortfolioTotalsCache
 
 
 class DLPositionManager:
     def __init__(self, db):
         self.db = db
+        self.totals_cache = PortfolioTotalsCache()
+        self._totals_version = None
         log.debug("DLPositionManager initialized.", source="DLPositionManager")
 
+    @staticmethod
+    def _apply_defaults(position: dict) -> dict:
+        from datetime import datetime
+
+        position.setdefault("id", str(uuid4()))
+        position.setdefault("asset_type", "UNKNOWN")
+        position.setdefault("entry_price", 0.0)
+        position.setdefault("liquidation_price", 0.0)
+        position.setdefault("position_type", "LONG")
+        position.setdefault("wallet_name", "Unspecified")
+        position.setdefault("collateral", 0.0)
+        position.setdefault("size", 0.0)
+        position.setdefault("leverage", 1.0)
+        position.setdefault("value", 0.0)
+        position.setdefault("current_price", 0.0)
+        position.setdefault("travel_percent", 0.0)
+        position.setdefault("pnl_after_fees_usd", 0.0)
+        position.setdefault("current_heat_index", 0.0)
+        position.setdefault("heat_index", position["current_heat_index"])
+        position.setdefault("liquidation_distance", 0.0)
+        position.setdefault("status", "ACTIVE")
+        position.setdefault("last_updated", datetime.now().isoformat())
+        position.setdefault("alert_reference_id", None)
+        position.setdefault("hedge_buddy_id", None)
+        position.setdefault("profit", position["value"])
+        return position
+
+    def _columns(self) -> set:
+        cursor = self.db.get_cursor()
+        cursor.execute("PRAGMA table_info(positions);")
+        return set(row[1] for row in cursor.fetchall())
+
     def create_position(self, position: dict):
         from datetime import datetime
         import os
@@ -31,27 +66,7 @@ class DLPositionManager:
 
         try:
             # ✅ Default injection — retain logic
-            position.setdefault("id", str(uuid4()))
-            position.setdefault("asset_type", "UNKNOWN")
-            position.setdefault("entry_price", 0.0)
-            position.setdefault("liquidation_price", 0.0)
-            position.setdefault("position_type", "LONG")
-            position.setdefault("wallet_name", "Unspecified")
-            position.setdefault("collateral", 0.0)
-            position.setdefault("size", 0.0)
-            position.setdefault("leverage", 1.0)
-            position.setdefault("value", 0.0)
-            position.setdefault("current_price", 0.0)
-            position.setdefault("travel_percent", 0.0)
-            position.setdefault("pnl_after_fees_usd", 0.0)
-            position.setdefault("current_heat_index", 0.0)
-            position.setdefault("heat_index", position["current_heat_index"])
-            position.setdefault("liquidation_distance", 0.0)
-            position.setdefault("status", "ACTIVE")
-            position.setdefault("last_updated", datetime.now().isoformat())
-            position.setdefault("alert_reference_id", None)
-            position.setdefault("hedge_buddy_id", None)
-            position.setdefault("profit", position["value"])
+            self._apply_defaults(position)
 
             # ✅ Fetch DB schema and sanitize fields
             cursor = self.db.get_cursor()
@@ -77,6 +92,8 @@ class DLPositionManager:
             """, valid_position)
 
             self.db.commit()
+            if self.totals_cache.is_loaded:
+                self.totals_cache.upsert(valid_position)
             log.success(f"💾 Position INSERTED: {position['id']}", source="DLPositionManager")
 
         except Exception as e:
@@ -105,6 +122,187 @@ class DLPositionManager:
             except Exception as file_err:
                 log.error(f"⚠️ Failed to write insert failure log: {file_err}", source="DLPositionManager")
 
+    def insert_positions(self, positions: list) -> int:
+        """
+        Insert many positions in a single transaction (one commit). Rows that
+        fail (e.g. duplicate id) are logged and skipped; returns rows inserted.
+        """
+        if not positions:
+            return 0
+        inserted = 0
+        try:
+            db_columns = self._columns()
+            cursor = self.db.get_cursor()
+            for position in positions:
+                row = {k: v for k, v in self._apply_defaults(position).items() if k in db_columns}
+                fields = ", ".join(row.keys())
+                placeholders = ", ".join(f":{k}" for k in row.keys())
+                try:
+                    cursor.execute(f"INSERT INTO positions ({fields}) VALUES ({placeholders})", row)
+                except Exception as e:
+                    log.error(f"❌ Failed to insert position {row.get('id')}: {e}", source="DLPositionManager")
+                    continue
+                inserted += 1
+                if self.totals_cache.is_loaded:
+                    self.totals_cache.upsert(row)
+            self.db.commit()
+            log.success(f"💾 Batch inserted {inserted}/{len(positions)} positions", source="DLPositionManager")
+        except Exception as e:
+            log.error(f"❌ Batch position insert failed: {e}", source="DLPositionManager")
+            self.totals_cache.invalidate()
+        return inserted
+
+    # Fields owned by Sonic (links made by alert/hedge code), never overwritten by a sync
+    SYNC_PRESERVED_FIELDS = ("alert_reference_id", "hedge_buddy_id")
+
+    @staticmethod
+    def _field_changed(old, new) -> bool:
+        if isinstance(old, (int, float)) and isinstance(new, (int, float)):
+            return abs(float(old) - float(new)) > 1e-9 * max(1.0, abs(float(old)), abs(float(new)))
+        return old != new
+
+    def diff_positions(self, stored: dict, fetched: list, columns: set) -> dict:
+        """
+        Compare ``fetched`` positions against ``stored`` ({id: row}) by id.
+        Returns ``inserts`` (rows), ``updates`` ({id: {field: value}}) and
+        ``unchanged`` (ids). Only fields present in the fetched row are diffed.
+        """
+        inserts, updates, unchanged = [], {}, []
+        for position in fetched:
+            row = {k: v for k, v in position.items() if k in columns}
+            current = stored.get(row.get("id"))
+            if current is None:
+                inserts.append(row)
+                continue
+            changes = {
+                k: v for k, v in row.items()
+                if k != "id" and k not in self.SYNC_PRESERVED_FIELDS and self._field_changed(current.get(k), v)
+            }
+            if changes:
+                updates[row["id"]] = changes
+            else:
+                unchanged.append(row["id"])
+        return {"inserts": inserts, "updates": updates, "unchanged": unchanged}
+
+    def get_active_position_ids(self, wallet_names=None) -> dict:
+        """Return ``{wallet_name: set(ids)}`` for ACTIVE positions (ids only, cheap)."""
+        try:
+            cursor = self.db.get_cursor()
+            if wallet_names is None:
+                cursor.execute("SELECT id, wallet_name FROM positions WHERE status = 'ACTIVE'")
+            else:
+                names = sorted(set(wallet_names))
+                if not names:
+                    return {}
+                marks = ", ".join("?" for _ in names)
+                cursor.execute(
+                    f"SELECT id, wallet_name FROM positions WHERE status = 'ACTIVE' AND wallet_name IN ({marks})",
+                    names,
+                )
+            result = {}
+            for row in cursor.fetchall():
+                result.setdefault(row["wallet_name"], set()).add(row["id"])
+            return result
+        except Exception as e:
+            log.error(f"❌ Failed to fetch active position ids: {e}", source="DLPositionManager")
+            return {}
+
+    def reconcile_positions(self, fetched: list, wallet_names, keep_ids=()) -> dict:
+        """
+        Bring stored positions for ``wallet_names`` in line with ``fetched``.
+
+        Current ACTIVE rows for those wallets are loaded in one query and
+        diffed by id: new positions are inserted (a previously closed id is
+        reactivated), changed fields are updated, and ACTIVE positions that
+        are no longer reported are marked CLOSED. Everything is applied in a
+        single transaction. Wallets not listed (e.g. whose fetch failed) are
+        left untouched. ``keep_ids`` are known unchanged upstream: they are
+        neither diffed nor closed.
+        """
+        summary = {"inserted": [], "updated": {}, "closed": [], "unchanged": 0}
+        wallet_names = sorted(set(wallet_names or []))
+        if not wallet_names and not fetched:
+            return summary
+
+        conn = self.db.connect()
+        try:
+            columns = self._columns()
+            cursor = self.db.get_cursor()
+            stored = {}
+            if wallet_names:
+                marks = ", ".join("?" for _ in wallet_names)
+                cursor.execute(
+                    f"SELECT * FROM positions WHERE status = 'ACTIVE' AND wallet_name IN ({marks})",
+                    wallet_names,
+                )
+                stored = {row["id"]: dict(row) for row in cursor.fetchall()}
+
+            seen = set(keep_ids or ())
+            unique = []
+            for position in fetched:
+                if position.get("id") in seen:
+                    continue
+                seen.add(position.get("id"))
+                unique.append(position)
+
+            diff = self.diff_positions(stored, unique, columns)
+            now = datetime.now().isoformat()
+
+            for row in diff["inserts"]:
+                row = {k: v for k, v in self._apply_defaults(row).items() if k in columns}
+                row["status"] = row.get("status") or "ACTIVE"
+                fields = ", ".join(row.keys())
+                placeholders = ", ".join(f":{k}" for k in row.keys())
+                refresh = ", ".join(
+                    f"{k} = excluded.{k}" for k in row.keys()
+                    if k != "id" and k not in self.SYNC_PRESERVED_FIELDS
+                )
+                cursor.execute(
+                    f"INSERT INTO positions ({fields}) VALUES ({placeholders}) "
+                    f"ON CONFLICT(id) DO UPDATE SET {refresh}",
+                    row,
+                )
+                summary["inserted"].append(row["id"])
+
+            for pos_id, changes in diff["updates"].items():
+                assignments = ", ".join(f"{k} = :{k}" for k in changes)
+                cursor.execute(f"UPDATE positions SET {assignments} WHERE id = :id", {**changes, "id": pos_id})
+                summary["updated"][pos_id] = sorted(changes)
+
+            for pos_id in set(stored) - seen:
+                cursor.execute(
+                    "UPDATE positions SET status = 'CLOSED', last_updated = ? WHERE id = ?",
+                    (now, pos_id),
+                )
+                summary["closed"].append(pos_id)
+
+            self.db.commit()
+        except Exception as e:
+            log.error(f"❌ Position reconciliation failed, rolled back: {e}", source="DLPositionManager")
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            self.totals_cache.invalidate()
+            raise
+
+        summary["unchanged"] = len(diff["unchanged"]) + len(set(keep_ids or ()) & set(stored))
+        if self.totals_cache.is_loaded:
+            for pos_id in summary["closed"]:
+                self.totals_cache.remove(pos_id)
+            for row in diff["inserts"]:
+                self.totals_cache.upsert(row)
+            for pos_id, changes in diff["updates"].items():
+                self.totals_cache.upsert({**stored[pos_id], **changes})
+
+        log.success(
+            f"🔁 Reconciled positions → {len(summary['inserted'])} inserted, "
+            f"{len(summary['updated'])} updated, {len(summary['closed'])} closed, "
+            f"{summary['unchanged']} unchanged",
+            source="DLPositionManager",
+        )
+        return summary
+
     def get_all_positions(self) -> list:
         try:
             cursor = self.db.get_cursor()
@@ -131,6 +329,7 @@ class DLPositionManager:
             cursor = self.db.get_cursor()
             cursor.execute("DELETE FROM positions WHERE id = ?", (position_id,))
             self.db.commit()
+            self.totals_cache.remove(position_id)
             log.info(f"Deleted position {position_id}", source="DLPositionManager")
         except Exception as e:
             log.error(f"Failed to delete position {position_id}: {e}", source="DLPositionManager")
@@ -141,6 +340,7 @@ class DLPositionManager:
             cursor.execute("DELETE FROM positions")
             self.db.commit()
             cursor.close()
+            self.totals_cache.clear()
             log.success("🧹 All positions got fucked", source="DLPositionManager")
         except Exception as e:
             log.error(f"❌ Failed to wipe positions: {e}", source="DLPositionManager")
@@ -241,6 +441,8 @@ class DLPositionManager:
                 )
             """, position)
             self.db.commit()
+            if self.totals_cache.is_loaded:
+                self.totals_cache.upsert(self.get_position_by_id(position["id"]) or position)
             log.success(f"✅ Position inserted for test: {position['id']}", source="DLPositionManager")
         except Exception as e:
             log.error(f"❌ Failed to insert test position: {e}", source="DLPositionManager")
@@ -267,3 +469,70 @@ class DLPositionManager:
         except Exception as e:
             log.error(f"❌ Failed to fetch position {pos_id}: {e}", source="DLPositionManager")
             return None
+
+    def upsert_position(self, position: dict):
+        """Insert ``position`` or overwrite the stored row with the same id."""
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute("PRAGMA table_info(positions);")
+            db_columns = set(row[1] for row in cursor.fetchall())
+            valid_position = {k: v for k, v in position.items() if k in db_columns}
+
+            fields = ", ".join(valid_position.keys())
+            placeholders = ", ".join(f":{k}" for k in valid_position.keys())
+            updates = ", ".join(f"{k} = excluded.{k}" for k in valid_position.keys() if k != "id")
+            cursor.execute(f"""
+                INSERT INTO positions ({fields}) VALUES ({placeholders})
+                ON CONFLICT(id) DO UPDATE SET {updates}
+            """, valid_position)
+            self.db.commit()
+            if self.totals_cache.is_loaded:
+                self.totals_cache.upsert(self.get_position_by_id(position["id"]) or valid_position)
+            log.success(f"💾 Position UPSERTED: {position['id']}", source="DLPositionManager")
+        except Exception as e:
+            log.error(f"❌ Failed to upsert position {position.get('id')}: {e}", source="DLPositionManager")
+
+    def close_position(self, position_id: str, status: str = "CLOSED"):
+        """Mark a position as no longer active without deleting its row."""
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute(
+                "UPDATE positions SET status = ?, last_updated = ? WHERE id = ?",
+                (status, datetime.now().isoformat(), position_id),
+            )
+            self.db.commit()
+            self.totals_cache.remove(position_id)
+            log.info(f"Closed position {position_id} ({status})", source="DLPositionManager")
+        except Exception as e:
+            log.error(f"Failed to close position {position_id}: {e}", source="DLPositionManager")
+
+    # === Portfolio totals ===
+    def _data_version(self):
+        """Identify the DB state as seen by *other* connections.
+
+        ``PRAGMA data_version`` only changes when a different connection
+        commits, so our own writes (already folded into the cache) never
+        trigger a rebuild.
+        """
+        conn = self.db.connect()
+        if conn is None:
+            return None
+        return id(conn), conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def get_portfolio_totals(self) -> dict:
+        """Return totals across ACTIVE positions from the incremental cache.
+
+        The cache is rebuilt with a single query only on first use or when
+        another connection has written to the database since the last read.
+        """
+        try:
+            version = self._data_version()
+            if not self.totals_cache.is_loaded or version != self._totals_version:
+                cursor = self.db.get_cursor()
+                cursor.execute("SELECT * FROM positions WHERE status = 'ACTIVE'")
+                self.totals_cache.load([dict(row) for row in cursor.fetchall()])
+                self._totals_version = version
+            return self.totals_cache.totals()
+        except Exception as e:
+            log.error(f"❌ Failed to read portfolio totals: {e}", source="DLPositionManager")
+            return {}
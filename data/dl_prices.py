@@ -4,6 +4,8 @@ from datetime import datetime
 from core.core_imports import log
 
 class DLPriceManager:
+    BULK_CHUNK = 500  # stays under SQLite's bound-parameter limit
+
     def __init__(self, db):
         self.db = db
         log.debug("DLPriceManager initialized.", source="DLPriceManager")
@@ -31,6 +33,72 @@ class DLPriceManager:
         except Exception as e:
             log.error(f"Failed to insert price: {e}", source="DLPriceManager")
 
+    def insert_prices(self, rows: list) -> int:
+        """Insert many price rows with one commit; returns the count written."""
+        if not rows:
+            return 0
+        now = datetime.now().isoformat()
+        prepared = []
+        for row in rows:
+            row = dict(row)
+            row.setdefault("id", str(uuid4()))
+            row.setdefault("last_update_time", now)
+            row.setdefault("previous_price", 0.0)
+            row.setdefault("previous_update_time", None)
+            row.setdefault("source", None)
+            prepared.append(row)
+        try:
+            cursor = self.db.get_cursor()
+            cursor.executemany("""
+                INSERT INTO prices (
+                    id, asset_type, current_price, previous_price,
+                    last_update_time, previous_update_time, source
+                ) VALUES (
+                    :id, :asset_type, :current_price, :previous_price,
+                    :last_update_time, :previous_update_time, :source
+                )
+            """, prepared)
+            self.db.commit()
+            log.success(f"Inserted {len(prepared)} prices", source="DLPriceManager")
+            return len(prepared)
+        except Exception as e:
+            log.error(f"Failed to insert prices: {e}", source="DLPriceManager")
+            return 0
+
+    def get_latest_prices(self, asset_types: list = None) -> dict:
+        """
+        Latest row per asset as ``{asset_type: row}`` in one query per
+        ``BULK_CHUNK`` assets (every asset when ``asset_types`` is None).
+        """
+        base = """
+            SELECT p.* FROM prices p
+            JOIN (
+                SELECT asset_type, MAX(last_update_time) AS latest
+                FROM prices {where}
+                GROUP BY asset_type
+            ) m ON p.asset_type = m.asset_type AND p.last_update_time = m.latest
+        """
+        try:
+            cursor = self.db.get_cursor()
+            if asset_types is None:
+                batches = [None]
+            else:
+                wanted = list(dict.fromkeys(asset_types))
+                batches = [wanted[i:i + self.BULK_CHUNK] for i in range(0, len(wanted), self.BULK_CHUNK)]
+            latest = {}
+            for batch in batches:
+                if batch is None:
+                    cursor.execute(base.format(where=""))
+                else:
+                    marks = ",".join("?" for _ in batch)
+                    cursor.execute(base.format(where=f"WHERE asset_type IN ({marks})"), batch)
+                for row in cursor.fetchall():
+                    latest.setdefault(row["asset_type"], dict(row))
+            return latest
+        except Exception as e:
+            log.error(f"Error retrieving latest prices: {e}", source="DLPriceManager")
+            return {}
+
     def get_latest_price(self, asset_type: str) -> dict:
         try:
             cursor = self.db.get_cursor()
@@ -20,6 +20,9 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 class DLSystemDataManager:
     def __init__(self, db):
         self.db = db
+        # key -> (stamp, raw_json, decoded_value); see get_var()
+        self._var_cache = {}
+        self._var_version = 0
         log.debug("DLSystemDataManager initialized.", source="DLSystemDataManager")
 
     # === Theme Mode ===
@@ -137,14 +140,45 @@ class DLSystemDataManager:
             log.error(f"❌ Failed to retrieve active theme profile: {e}", source="DLSystemDataManager")
             return {}
 
-    def get_var(self, key: str) -> dict:
+    # === Cached global_config vars ===
+    def var_stamp(self) -> tuple:
+        """
+        Version stamp for ``global_config``. It changes when this manager
+        writes via :meth:`set_var` or when another connection commits to the
+        database (``PRAGMA data_version``).
+        """
+        conn = self.db.connect()
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0] if conn else None
+        return (id(conn), data_version, self._var_version)
+
+    def invalidate_vars(self, key: str = None):
+        if key is None:
+            self._var_cache.clear()
+        else:
+            self._var_cache.pop(key, None)
+
+    def get_var(self, key: str, readonly: bool = False) -> dict:
+        """
+        Return a decoded ``global_config`` value, served from an in-memory
+        cache while :meth:`var_stamp` is unchanged.
+
+        By default a fresh copy is returned so callers may mutate it. Hot
+        read-only callers can pass ``readonly=True`` to get the shared cached
+        object and skip JSON decoding entirely; it must not be modified.
+        """
         try:
-            cursor = self.db.get_cursor()
-            cursor.execute("SELECT value FROM global_config WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            if row:
-                return json.loads(row["value"])
-            return {}
+            stamp = self.var_stamp()
+            entry = self._var_cache.get(key)
+            if entry is None or entry[0] != stamp:
+                cursor = self.db.get_cursor()
+                cursor.execute("SELECT value FROM global_config WHERE key = ?", (key,))
+                row = cursor.fetchone()
+                raw = row["value"] if row else None
+                entry = (stamp, raw, json.loads(raw) if raw else {})
+                self._var_cache[key] = entry
+            if readonly:
+                return entry[2]
+            return json.loads(entry[1]) if entry[1] else {}
         except Exception as e:
             log.error(f"❌ Failed to read system var '{key}': {e}", source="DLSystemDataManager")
             return {}
@@ -161,6 +195,8 @@ class DLSystemDataManager:
                 ON CONFLICT(key) DO UPDATE SET value = excluded.value
             """, (key, json.dumps(value)))
             self.db.commit()
+            self._var_version += 1
+            self._var_cache.pop(key, None)
             log.success(f"✅ System var set: {key}", source="DLSystemDataManager")
         except Exception as e:
             log.error(f"❌ Failed to set system var '{key}': {e}", source="DLSystemDataManager")
@@ -0,0 +1,217 @@
+# dl_xcom_outbox.py
+"""
+Author: BubbaDiego
+Module: DLXComOutboxManager
+Description:
+    Durable outbox for XCom notifications plus a per-attempt delivery ledger.
+    Messages are written here before any provider is contacted so a crash or
+    slow provider never loses a notification; the dispatcher claims, retries
+    and finalizes rows from this table.
+
+Dependencies:
+    - DatabaseManager from database.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from core.logging import log
+
+
+class DLXComOutboxManager:
+    PENDING = "pending"
+    IN_FLIGHT = "in_flight"
+    SENT = "sent"
+    DEAD = "dead"
+
+    def __init__(self, db):
+        self.db = db
+        # The dispatcher's channel workers share this manager's connection.
+        self._lock = threading.RLock()
+        self.ensure_table()
+
+    def ensure_table(self):
+        cursor = self.db.get_cursor()
+        if not cursor:
+            log.error("❌ DB unavailable, xcom outbox not created", source="DLXComOutbox")
+            return
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS xcom_outbox (
+                id TEXT PRIMARY KEY,
+                channel TEXT NOT NULL,
+                level TEXT,
+                subject TEXT,
+                body TEXT,
+                recipient TEXT,
+                initiator TEXT,
+                metadata TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT,
+                delivered_at TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_xcom_outbox_due
+            ON xcom_outbox (status, next_attempt_at)
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS xcom_delivery_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                outbox_id TEXT NOT NULL,
+                channel TEXT NOT NULL,
+                attempt INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                error TEXT,
+                duration_ms REAL,
+                timestamp TEXT NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_xcom_delivery_log_outbox
+            ON xcom_delivery_log (outbox_id)
+        """)
+        self.db.commit()
+        log.debug("xcom_outbox tables ensured", source="DLXComOutbox")
+
+    @staticmethod
+    def _now_iso() -> str:
+        return datetime.now(timezone.utc).isoformat()
+
+    def enqueue(self, channel: str, level: str = None, subject: str = None, body: str = None,
+                recipient: str = None, initiator: str = None, metadata: dict = None) -> str:
+        """Persist a new pending message and return its id."""
+        msg_id = str(uuid.uuid4())
+        with self._lock:
+            cursor = self.db.get_cursor()
+            cursor.execute("""
+                INSERT INTO xcom_outbox (
+                    id, channel, level, subject, body, recipient, initiator, metadata,
+                    status, attempts, next_attempt_at, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)
+            """, (
+                msg_id, channel, level, subject, body, recipient, initiator,
+                json.dumps(metadata or {}), self.PENDING, time.time(),
+                self._now_iso(), self._now_iso(),
+            ))
+            self.db.commit()
+        log.debug(f"📮 Queued {channel} notification {msg_id}", source="DLXComOutbox")
+        return msg_id
+
+    def claim(self, msg_id: str):
+        """Atomically move a pending message to in_flight; returns the row or None."""
+        with self._lock:
+            cursor = self.db.get_cursor()
+            cursor.execute("""
+                UPDATE xcom_outbox
+                SET status = ?, attempts = attempts + 1, updated_at = ?
+                WHERE id = ? AND status = ?
+            """, (self.IN_FLIGHT, self._now_iso(), msg_id, self.PENDING))
+            claimed = cursor.rowcount == 1
+            self.db.commit()
+            if not claimed:
+                return None
+            cursor.execute("SELECT * FROM xcom_outbox WHERE id = ?", (msg_id,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def mark_sent(self, msg_id: str):
+        with self._lock:
+            cursor = self.db.get_cursor()
+            now = self._now_iso()
+            cursor.execute("""
+                UPDATE xcom_outbox
+                SET status = ?, last_error = NULL, updated_at = ?, delivered_at = ?
+                WHERE id = ?
+            """, (self.SENT, now, now, msg_id))
+            self.db.commit()
+
+    def mark_failed(self, msg_id: str, error: str, retry_at: float = None):
+        """Reschedule for ``retry_at`` (epoch seconds) or mark dead when None."""
+        with self._lock:
+            cursor = self.db.get_cursor()
+            status = self.PENDING if retry_at is not None else self.DEAD
+            cursor.execute("""
+                UPDATE xcom_outbox
+                SET status = ?, last_error = ?, next_attempt_at = ?, updated_at = ?
+                WHERE id = ?
+            """, (status, error, retry_at or 0, self._now_iso(), msg_id))
+            self.db.commit()
+
+    def record_attempt(self, msg_id: str, channel: str, attempt: int, status: str,
+                       error: str = None, duration_ms: float = None):
+        with self._lock:
+            cursor = self.db.get_cursor()
+            cursor.execute("""
+                INSERT INTO xcom_delivery_log (
+                    outbox_id, channel, attempt, status, error, duration_ms, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (msg_id, channel, attempt, status, error, duration_ms, self._now_iso()))
+            self.db.commit()
+
+    def get_due(self, now: float = None, limit: int = 100) -> list:
+        """Pending messages whose retry time has arrived, oldest first."""
+        with self._lock:
+            cursor = self.db.get_cursor()
+            cursor.execute("""
+                SELECT id, channel FROM xcom_outbox
+                WHERE status = ? AND next_attempt_at <= ?
+                ORDER BY next_attempt_at ASC
+                LIMIT ?
+            """, (self.PENDING, now if now is not None else time.time(), limit))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def requeue_in_flight(self) -> int:
+        """Return messages orphaned by a crash mid-delivery to the pending pool."""
+        with self._lock:
+            cursor = self.db.get_cursor()
+            cursor.execute("""
+                UPDATE xcom_outbox SET status = ?, updated_at = ? WHERE status = ?
+            """, (self.PENDING, self._now_iso(), self.IN_FLIGHT))
+            count = cursor.rowcount
+            self.db.commit()
+        if count:
+            log.warning(f"♻️ Re-queued {count} in-flight notifications", source="DLXComOutbox")
+        return count
+
+    def get_message(self, msg_id: str) -> dict:
+        try:
+            with self._lock:
+                cursor = self.db.get_cursor()
+                cursor.execute("SELECT * FROM xcom_outbox WHERE id = ?", (msg_id,))
+                row = cursor.fetchone()
+            return dict(row) if row else {}
+        except Exception as e:
+            log.error(f"❌ Failed to load outbox message {msg_id}: {e}", source="DLXComOutbox")
+            return {}
+
+    def get_delivery_log(self, msg_id: str) -> list:
+        try:
+            with self._lock:
+                cursor = self.db.get_cursor()
+                cursor.execute("""
+                    SELECT * FROM xcom_delivery_log WHERE outbox_id = ? ORDER BY id ASC
+                """, (msg_id,))
+                return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            log.error(f"❌ Failed to load delivery log for {msg_id}: {e}", source="DLXComOutbox")
+            return []
+
+    def get_status_counts(self) -> dict:
+        try:
+            with self._lock:
+                cursor = self.db.get_cursor()
+                cursor.execute("SELECT status, COUNT(*) AS n FROM xcom_outbox GROUP BY status")
+                return {row["status"]: row["n"] for row in cursor.fetchall()}
+        except Exception as e:
+            log.error(f"❌ Failed to count outbox statuses: {e}", source="DLXComOutbox")
+            return {}
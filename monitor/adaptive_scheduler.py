@@ -0,0 +1,184 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import math
+from datetime import datetime, timedelta
+
+from core.logging import log
+from core.constants import CONFIG_PATH
+
+SCHEDULER_LEDGER_NAME = "sonic_scheduler"
+
+ADAPTIVE_DEFAULTS = {
+    "floor_seconds": 15,          # never cycle faster than this
+    "ceiling_seconds": 300,       # never wait longer than this
+    "lookback_minutes": 15,       # price window used for volatility
+    "calm_move_pct": 0.25,        # price range at/below this → ceiling
+    "storm_move_pct": 2.0,        # price range at/above this → floor
+    "safe_liq_distance_pct": 25,  # every position at least this far from liquidation → ceiling
+    "danger_liq_distance_pct": 5, # any position this close → floor
+    "max_step_up": 2.0,           # delay may at most double from one cycle to the next
+}
+
+
+def load_adaptive_settings(path=CONFIG_PATH) -> dict:
+    """Defaults overridden by the optional ``adaptive_interval`` section of sonic_config.json."""
+    settings = dict(ADAPTIVE_DEFAULTS)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            settings.update(json.load(f).get("adaptive_interval") or {})
+    except (OSError, ValueError):
+        pass
+    return settings
+
+
+def _scale(value: float, urgent: float, relaxed: float, floor: float, ceiling: float) -> float:
+    """
+    Map ``value`` onto [floor, ceiling]: ``urgent`` or beyond → floor,
+    ``relaxed`` or beyond → ceiling, geometric in between so each step of
+    calm stretches the delay by the same factor.
+    """
+    if urgent == relaxed:
+        return floor if value == urgent else ceiling
+    t = (value - urgent) / (relaxed - urgent)
+    t = min(1.0, max(0.0, t))
+    return floor * math.pow(ceiling / floor, t)
+
+
+def choose_delay(volatility_pct, min_liq_distance_pct, settings: dict, baseline: float = None,
+                 previous: float = None) -> tuple:
+    """
+    Return ``(delay_seconds, reason)``. Volatility and liquidation distance
+    each propose a delay and the shorter one wins; with no data at all the
+    ``baseline`` interval is used. The result is clamped to the floor and
+    ceiling, and may grow by at most ``max_step_up`` over ``previous`` so a
+    calm spell after a storm relaxes gradually.
+    """
+    floor = max(1.0, float(settings["floor_seconds"]))
+    ceiling = max(floor, float(settings["ceiling_seconds"]))
+    candidates = {}
+    if volatility_pct is not None:
+        candidates["volatility"] = _scale(volatility_pct, settings["storm_move_pct"],
+                                          settings["calm_move_pct"], floor, ceiling)
+    if min_liq_distance_pct is not None:
+        candidates["liquidation"] = _scale(min_liq_distance_pct, settings["danger_liq_distance_pct"],
+                                           settings["safe_liq_distance_pct"], floor, ceiling)
+
+    if candidates:
+        driver = min(candidates, key=candidates.get)
+        delay = candidates[driver]
+    else:
+        driver = "baseline"
+        delay = float(baseline if baseline is not None else ceiling)
+
+    bounded = min(ceiling, max(floor, delay))
+    if bounded == floor and delay <= floor:
+        bound = "floor"
+    elif bounded == ceiling and delay >= ceiling:
+        bound = "ceiling"
+    else:
+        bound = None
+    if previous and bounded > previous * settings["max_step_up"]:
+        bounded = previous * settings["max_step_up"]
+        bound = "step_limit"
+
+    reason = {
+        "delay_seconds": round(bounded, 1),
+        "driver": driver,
+        "bound": bound,
+        "volatility_pct": None if volatility_pct is None else round(volatility_pct, 3),
+        "min_liquidation_distance_pct": None if min_liq_distance_pct is None else round(min_liq_distance_pct, 2),
+        "candidates": {k: round(v, 1) for k, v in candidates.items()},
+        "floor_seconds": floor,
+        "ceiling_seconds": ceiling,
+    }
+    return bounded, reason
+
+
+class AdaptiveScheduler:
+    """
+    Picks the sonic loop's next delay from recent price volatility and the
+    portfolio's closest liquidation, and records each decision in the
+    monitor ledger under ``sonic_scheduler``.
+    """
+
+    def __init__(self, data_locker, settings: dict = None, now=datetime.now):
+        self.dl = data_locker
+        self.settings = {**ADAPTIVE_DEFAULTS, **(settings if settings is not None else load_adaptive_settings())}
+        self.now = now
+        self.previous = None
+
+    def volatility(self) -> tuple:
+        """Largest high-low range, in percent of the last price, across assets in the lookback window."""
+        cutoff = (self.now() - timedelta(minutes=self.settings["lookback_minutes"])).isoformat()
+        try:
+            cursor = self.dl.db.get_cursor()
+            cursor.execute(
+                """
+                SELECT asset_type, MIN(current_price) AS low, MAX(current_price) AS high, COUNT(*) AS samples,
+                       (SELECT p2.current_price FROM prices p2
+                         WHERE p2.asset_type = p.asset_type
+                         ORDER BY p2.last_update_time DESC LIMIT 1) AS last
+                FROM prices p
+                WHERE last_update_time >= ? AND current_price > 0
+                GROUP BY asset_type
+                """,
+                (cutoff,),
+            )
+            rows = cursor.fetchall()
+        except Exception as e:
+            log.error(f"❌ Volatility query failed: {e}", source="AdaptiveScheduler")
+            return None, None
+        best, asset = None, None
+        for row in rows:
+            if row["samples"] < 2 or not row["last"]:
+                continue
+            move = (row["high"] - row["low"]) / row["last"] * 100.0
+            if best is None or move > best:
+                best, asset = move, row["asset_type"]
+        return best, asset
+
+    def min_liquidation_distance(self) -> tuple:
+        """Closest active position to liquidation, as percent of its current price."""
+        try:
+            positions = self.dl.positions.get_active_positions()
+        except Exception as e:
+            log.error(f"❌ Position query failed: {e}", source="AdaptiveScheduler")
+            return None, None
+        best, pos_id = None, None
+        for pos in positions:
+            try:
+                price = float(pos.get("current_price") or 0.0)
+                liq = float(pos.get("liquidation_price") or 0.0)
+            except (TypeError, ValueError):
+                continue
+            if price <= 0 or liq <= 0:
+                continue
+            distance = abs(price - liq) / price * 100.0
+            if best is None or distance < best:
+                best, pos_id = distance, pos.get("id")
+        return best, pos_id
+
+    def next_delay(self, baseline: float = None) -> tuple:
+        volatility_pct, asset = self.volatility()
+        liq_pct, pos_id = self.min_liquidation_distance()
+        delay, reason = choose_delay(volatility_pct, liq_pct, self.settings, baseline, self.previous)
+        reason["volatile_asset"] = asset
+        reason["closest_position_id"] = pos_id
+        reason["baseline_seconds"] = baseline
+        self.previous = delay
+        self.record(reason)
+        return delay, reason
+
+    def record(self, reason: dict):
+        try:
+            self.dl.ledger.insert_ledger_entry(SCHEDULER_LEDGER_NAME, "Success", metadata=reason)
+        except Exception as e:
+            log.error(f"❌ Failed to record schedule decision: {e}", source="AdaptiveScheduler")
+        log.info(
+            f"⏱️ Next cycle in {reason['delay_seconds']}s ({reason['driver']})",
+            source="AdaptiveScheduler",
+            payload=reason,
+        )
@@ -8,6 +8,7 @@ class BaseMonitor:
         from core.logging import log
         from data.data_locker import DataLocker
         from core.core_imports import DB_PATH
+        from core.circuit_breaker import breaker_snapshot
 
         log.banner(f"🚀 Running {self.name}")
         result = {}
@@ -20,7 +21,7 @@ class BaseMonitor:
             locker.ledger.insert_ledger_entry(
                 monitor_name=self.name,
                 status=status,
-                metadata=result
+                metadata={**result, "breakers": breaker_snapshot()}
             )
 
             log.success(f"{self.name} completed successfully.", source=self.name)
@@ -33,7 +34,7 @@ class BaseMonitor:
             locker.ledger.insert_ledger_entry(
                 monitor_name=self.name,
                 status="Error",
-                metadata={"error": str(e)}
+                metadata={"error": str(e), "breakers": breaker_snapshot()}
             )
 
     def _do_work(self):
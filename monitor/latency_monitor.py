@@ -1,30 +1,47 @@
 # monitor/monitors/latency_monitor.py
 
 from monitor.base_monitor import BaseMonitor
-import requests
+from core.http_client import get_http_client
+from core.circuit_breaker import breaker_snapshot
+from core.request_budget import budget_snapshot, get_budget
+from core.constants import COINGECKO_API_BASE, JUPITER_QUOTE_API_BASE
 from datetime import datetime, timezone
 
 class LatencyMonitor(BaseMonitor):
     """
     Measures HTTP ping latency to key services (e.g., CoinGecko).
+    Pings draw on the same request budget as price fetches; a ping that
+    would have to wait for a slot is skipped rather than spend quota.
     """
     TARGETS = {
-        "CoinGecko": "https://api.coingecko.com/api/v3/ping",
-        "Jupiter": "https://quote-api.jup.ag/v6/ping"
+        "CoinGecko": f"{COINGECKO_API_BASE}/ping",
+        "Jupiter": f"{JUPITER_QUOTE_API_BASE}/v6/ping"
     }
+    BUDGETS = {"CoinGecko": "coingecko"}
 
-    def __init__(self):
+    def __init__(self, targets: dict = None, budgets: dict = None):
         super().__init__(name="latency_monitor", ledger_filename="latency_ledger.json")
+        self.targets = dict(targets or self.TARGETS)
+        self.budgets = dict(self.BUDGETS if budgets is None else budgets)
 
     def _do_work(self):
+        http = get_http_client()
         latencies = {}
-        for name, url in self.TARGETS.items():
+        for name, url in self.targets.items():
+            budget = self.budgets.get(name)
+            if budget and get_budget(budget).reserve(max_wait=0) is None:
+                latencies[name] = "SKIPPED: rate budget exhausted"
+                continue
             try:
                 start = datetime.now()
-                r = requests.get(url, timeout=5)
+                r = http.get(url, timeout=5, retries=0, endpoint=f"ping.{name}")
                 r.raise_for_status()
                 duration = (datetime.now() - start).total_seconds()
                 latencies[name] = round(duration * 1000, 2)  # ms
             except Exception as e:
                 latencies[name] = f"ERROR: {e}"
+        # Rolling per-endpoint stats for every integration using the shared client
+        latencies["endpoints"] = http.metrics()
+        latencies["breakers"] = breaker_snapshot()
+        latencies["budgets"] = budget_snapshot()
         return latencies
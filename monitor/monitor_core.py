@@ -1,6 +1,8 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+from core.cancellation import current_token
 from core.logging import log
 
 # Import your monitor classes here
@@ -36,29 +38,46 @@ class MonitorCore:
             self.registry.register("twilio_monitor", TwilioMonitor())
             # Add more monitors as needed
 
+        # One lock per monitor so Cyclone steps and the scheduler never run
+        # the same monitor twice at once.
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, name: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(name, threading.Lock())
+
     def run_all(self):
         """
         Run all registered monitors in sequence.
         """
-        for name, monitor in self.registry.get_all_monitors().items():
-            try:
-                log.info(f"Running monitor: {name}", source="MonitorCore")
-                monitor.run_cycle()
-                log.success(f"Monitor '{name}' completed successfully.", source="MonitorCore")
-            except Exception as e:
-                log.error(f"Monitor '{name}' failed: {e}", source="MonitorCore")
+        for name in list(self.registry.get_all_monitors()):
+            self.run_by_name(name)
 
-    def run_by_name(self, name: str):
+    def run_by_name(self, name: str, blocking: bool = True) -> bool:
         """
-        Run a specific monitor by its registered name.
+        Run a specific monitor by its registered name. If it is already
+        running, wait for the lock or, with ``blocking=False``, return
+        ``False`` without running it. Inside a Cyclone step the wait is
+        bounded by the step's remaining deadline.
         """
         monitor = self.registry.get(name)
-        if monitor:
-            try:
-                log.info(f"Running monitor: {name}", source="MonitorCore")
-                monitor.run_cycle()
-                log.success(f"Monitor '{name}' completed successfully.", source="MonitorCore")
-            except Exception as e:
-                log.error(f"Monitor '{name}' failed: {e}", source="MonitorCore")
-        else:
+        if not monitor:
             log.warning(f"Monitor '{name}' not found.", source="MonitorCore")
+            return False
+        lock = self._lock_for(name)
+        token = current_token()
+        remaining = token.remaining() if token is not None and blocking else None
+        acquired = lock.acquire(timeout=remaining) if remaining is not None else lock.acquire(blocking=blocking)
+        if not acquired:
+            log.info(f"Monitor '{name}' already running; skipped.", source="MonitorCore")
+            return False
+        try:
+            log.info(f"Running monitor: {name}", source="MonitorCore")
+            monitor.run_cycle()
+            log.success(f"Monitor '{name}' completed successfully.", source="MonitorCore")
+        except Exception as e:
+            log.error(f"Monitor '{name}' failed: {e}", source="MonitorCore")
+        finally:
+            lock.release()
+        return True
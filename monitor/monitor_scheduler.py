@@ -0,0 +1,243 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from core.logging import log
+
+SKIP = "skip"
+COALESCE = "coalesce"
+
+# Used when timer_config.json has no "schedules" section.
+DEFAULT_SCHEDULES = {
+    "price_monitor": {"interval_seconds": 60, "jitter_seconds": 3, "on_overrun": SKIP},
+    "position_monitor": {"interval_seconds": 120, "jitter_seconds": 5, "on_overrun": COALESCE},
+    "operations_monitor": {"interval_seconds": 300, "jitter_seconds": 10, "on_overrun": SKIP},
+    "xcom_monitor": {"interval_seconds": 300, "jitter_seconds": 10, "on_overrun": SKIP},
+    "twilio_monitor": {"interval_seconds": 600, "jitter_seconds": 15, "on_overrun": SKIP},
+}
+
+
+class MonitorJob:
+    """
+    Fixed-rate schedule for one monitor. Run slots sit on a grid
+    ``anchor + k * interval``; each run starts at its slot plus a fresh
+    random jitter, so neither jitter nor run time shifts later slots.
+    """
+
+    def __init__(self, name: str, interval_seconds: float, jitter_seconds: float = 0.0,
+                 on_overrun: str = SKIP, rng=random.random):
+        if on_overrun not in (SKIP, COALESCE):
+            raise ValueError(f"on_overrun must be '{SKIP}' or '{COALESCE}'")
+        self.name = name
+        self.interval = max(0.001, float(interval_seconds))
+        self.jitter = max(0.0, float(jitter_seconds))
+        self.on_overrun = on_overrun
+        self.rng = rng
+        self.slot = None
+        self.due = None
+        self.running = False
+        self.catch_up = False
+        self.stats = {"runs": 0, "skipped": 0, "coalesced": 0, "busy": 0,
+                      "last_started": None, "last_duration": None}
+
+    def start_at(self, first_slot: float):
+        self.slot = first_slot
+        self.due = first_slot + self.rng() * self.jitter
+
+    def advance(self, now: float):
+        """Move to the first grid slot after ``now``; returns how many slots were passed over."""
+        passed = 0
+        while self.slot <= now:
+            self.slot += self.interval
+            passed += 1
+        self.due = self.slot + self.rng() * self.jitter
+        return passed
+
+    def snapshot(self, now: float) -> dict:
+        return {
+            **self.stats,
+            "interval_seconds": self.interval,
+            "on_overrun": self.on_overrun,
+            "running": self.running,
+            "next_due_in": None if self.due is None else round(max(0.0, self.due - now), 2),
+        }
+
+
+def load_schedules(timer_config) -> dict:
+    """``schedules`` section of timer_config.json, else :data:`DEFAULT_SCHEDULES`."""
+    try:
+        schedules = timer_config.get("schedules")
+    except Exception as e:
+        log.warning(f"⚠️ Timer config unavailable: {e}", source="MonitorScheduler")
+        schedules = None
+    return schedules or DEFAULT_SCHEDULES
+
+
+class MonitorScheduler:
+    """
+    Runs registered monitors on independent fixed-rate schedules in a
+    worker pool.
+
+    * Drift-free: slots stay on each monitor's grid however long runs take.
+    * No overlap: a monitor still running when its slot comes up is not
+      started again. ``skip`` drops the missed slot; ``coalesce`` runs
+      once as soon as the current run ends, however many slots were missed.
+    * Independent: a slow monitor occupies one worker; the others keep
+      their schedules.
+    * Last runs are stored as ``<name>_last_run`` in timer_config.json, so
+      a restart resumes the schedule instead of running everything at once.
+    """
+
+    def __init__(self, monitor_core, schedules: dict = None, max_workers: int = 4, timer_config=None,
+                 clock=time.monotonic, wall=lambda: datetime.now(timezone.utc), rng=random.random):
+        if timer_config is None:
+            from monitor.monitor_utils import TimerConfig
+            timer_config = TimerConfig()
+        self.core = monitor_core
+        self.timer_config = timer_config
+        self.clock = clock
+        self.wall = wall
+        self.max_workers = max_workers
+        schedules = schedules if schedules is not None else load_schedules(timer_config)
+        self.jobs = {}
+        for name, cfg in schedules.items():
+            if isinstance(cfg, (int, float)):
+                cfg = {"interval_seconds": cfg}
+            if self.core.registry.get(name) is None:
+                log.warning(f"⚠️ No monitor registered as '{name}'; schedule ignored", source="MonitorScheduler")
+                continue
+            self.jobs[name] = MonitorJob(name, rng=rng, **cfg)
+        self._pool = None
+        self._lock = threading.Lock()
+        self._config_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._anchor()
+
+    def _anchor(self):
+        now, wall = self.clock(), self.wall()
+        for name, job in self.jobs.items():
+            first = now
+            last = self.timer_config.get(f"{name}_last_run")
+            if last:
+                try:
+                    elapsed = (wall - datetime.fromisoformat(last)).total_seconds()
+                    first = now + max(0.0, job.interval - elapsed)
+                except (TypeError, ValueError):
+                    pass
+            job.start_at(first)
+
+    # --------------------------------------------------------------
+    def run_pending(self, now: float = None) -> list:
+        """Start every due monitor that is not already running; returns their names."""
+        now = self.clock() if now is None else now
+        started = []
+        with self._lock:
+            for job in self.jobs.values():
+                if now < job.due:
+                    continue
+                if job.running:
+                    missed = job.advance(now)
+                    if job.on_overrun == COALESCE:
+                        job.catch_up = True
+                        job.stats["coalesced"] += missed
+                    else:
+                        job.stats["skipped"] += missed
+                    log.warning(f"⏭️ {job.name} still running at its slot ({job.on_overrun})",
+                                source="MonitorScheduler")
+                    continue
+                job.advance(now)
+                job.running = True
+                job.stats["last_started"] = self.wall().isoformat()
+                started.append(job)
+        for job in started:
+            self._submit(job)
+        return [job.name for job in started]
+
+    def _submit(self, job: MonitorJob):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="monitor")
+        self._pool.submit(self._run_job, job)
+
+    def _run_job(self, job: MonitorJob):
+        start = self.clock()
+        ran = False
+        try:
+            # Non-blocking: if a Cyclone step holds this monitor, count it as busy.
+            ran = self.core.run_by_name(job.name, blocking=False)
+        except Exception as e:
+            log.error(f"❌ Scheduled run of {job.name} failed: {e}", source="MonitorScheduler")
+        finally:
+            with self._lock:
+                job.running = False
+                job.stats["last_duration"] = round(self.clock() - start, 3)
+                if ran:
+                    job.stats["runs"] += 1
+                else:
+                    job.stats["busy"] += 1
+                if job.catch_up:
+                    job.catch_up = False
+                    job.due = min(job.due, self.clock())
+            if ran:
+                self._record_last_run(job.name)
+            self._wake.set()
+
+    def _record_last_run(self, name: str):
+        with self._config_lock:
+            try:
+                self.timer_config.set(f"{name}_last_run", self.wall().isoformat())
+            except Exception as e:
+                log.warning(f"⚠️ Could not store last run for {name}: {e}", source="MonitorScheduler")
+
+    # --------------------------------------------------------------
+    def _loop(self):
+        while not self._stop.is_set():
+            self.run_pending()
+            with self._lock:
+                next_due = min((job.due for job in self.jobs.values()), default=None)
+            timeout = 1.0 if next_due is None else max(0.0, next_due - self.clock())
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="monitor-scheduler", daemon=True)
+        self._thread.start()
+        log.info(f"🗓️ Monitor scheduler started for {sorted(self.jobs)}", source="MonitorScheduler")
+        return self
+
+    def stop(self, wait: bool = True):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(5)
+            self._thread = None
+        if self._pool:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+    def snapshot(self) -> dict:
+        now = self.clock()
+        with self._lock:
+            return {name: job.snapshot(now) for name, job in self.jobs.items()}
+
+
+if __name__ == "__main__":
+    from monitor.monitor_core import MonitorCore
+
+    scheduler = MonitorScheduler(MonitorCore()).start()
+    try:
+        while True:
+            time.sleep(60)
+            log.info("🗓️ Monitor schedule", source="MonitorScheduler", payload=scheduler.snapshot())
+    except KeyboardInterrupt:
+        scheduler.stop(wait=False)
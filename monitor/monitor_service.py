@@ -1,23 +1,38 @@
 # monitor/core/monitor_service.py
 
 import subprocess
-import requests
 from datetime import datetime
 from core.core_imports import log
+from core.http_client import get_http_client
+from core.constants import COINGECKO_API_BASE, PRICE_SOURCES, PRICE_QUORUM, PRICE_DEADLINE_SECONDS
+from core.asset_registry import get_asset_registry
+from prices.price_sources import PriceAggregator, build_sources
 
 class MonitorService:
+    def __init__(self, api_base: str = None, sources=None, quorum: int = PRICE_QUORUM,
+                 deadline: float = PRICE_DEADLINE_SECONDS, hedge_delay: float = 0.0, assets: list = None):
+        self.api_base = (api_base or COINGECKO_API_BASE).rstrip("/")
+        self.assets = list(assets) if assets else None
+        self.aggregator = PriceAggregator(
+            build_sources(sources or PRICE_SOURCES, coingecko_base=self.api_base),
+            quorum=quorum,
+            deadline=deadline,
+            hedge_delay=hedge_delay,
+        )
+        self.last_report = {}
+
+    def tracked_assets(self) -> list:
+        """Assets to price: explicit list, else every priced asset in the registry."""
+        return self.assets or get_asset_registry().priced_symbols()
+
     def fetch_prices(self):
-        url = "https://api.coingecko.com/api/v3/simple/price"
-        params = {"ids": "bitcoin,ethereum,solana", "vs_currencies": "usd"}
+        """
+        Median price per asset across the configured sources, bounded by the
+        aggregator deadline. Per-source details land in ``last_report``.
+        """
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            return {
-                "BTC": data.get("bitcoin", {}).get("usd"),
-                "ETH": data.get("ethereum", {}).get("usd"),
-                "SOL": data.get("solana", {}).get("usd"),
-            }
+            prices, self.last_report = self.aggregator.fetch(self.tracked_assets())
+            return prices
         except Exception as e:
             log.error(f"[PriceFetch] failed: {e}")
             return {}
@@ -16,7 +16,7 @@ from core.logging import log
 class PriceMonitor(BaseMonitor):
     """
     Fetches prices from external APIs and stores them in DB.
-    Uses CoinGecko via MonitorService.
+    Uses the multi-source price aggregator via MonitorService.
     """
 
     def __init__(self):
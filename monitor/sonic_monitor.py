@@ -5,13 +5,17 @@ import asyncio
 import logging
 import time
 from datetime import datetime, timezone
-from cyclone.cyclone_engine import Cyclone
+from cyclone.cyclone_engine import SKIP, Cyclone
 
 from data.data_locker import DataLocker
 from core.constants import DB_PATH
+from core.tick_bus import get_tick_bus
+from monitor.adaptive_scheduler import AdaptiveScheduler
 
 MONITOR_NAME = "sonic_monitor"
 DEFAULT_INTERVAL = 60  # fallback if nothing set in DB
+# Run as Cyclone steps every cycle, so the monitor scheduler leaves them alone
+CYCLONE_MONITORS = {"price_monitor", "position_monitor", "operations_monitor"}
 
 def get_monitor_interval(db_path=DB_PATH, monitor_name=MONITOR_NAME):
     dl = DataLocker(str(db_path))
@@ -44,7 +48,9 @@ def heartbeat(loop_counter: int):
 
 async def sonic_cycle(loop_counter: int, cyclone: Cyclone, interval: int):
     logging.info("🔄 SonicMonitor cycle #%d starting", loop_counter)
-    await cyclone.run_cycle()
+    # If the dashboard is mid-cycle this loop is skipped (its outcomes are not
+    # reused); the next loop runs a cycle of its own.
+    await cyclone.run_exclusive_cycle(owner=MONITOR_NAME, on_busy=SKIP)
     heartbeat(loop_counter)
     update_heartbeat(MONITOR_NAME, interval)
     logging.info("✅ SonicMonitor cycle #%d complete", loop_counter)
@@ -56,6 +62,11 @@ def main():
     monitor_core = MonitorCore()
     cyclone = Cyclone(monitor_core=monitor_core)
 
+    # Between full cycles, price moves reach enrichment/alerts/hedges via ticks.
+    from prices.price_ticker import PriceTicker
+    cyclone.attach_tick_bus()
+    ticker = PriceTicker(cyclone.data_locker).start()
+
     # --- Ensure the heartbeat table exists ---
     dl = DataLocker(str(DB_PATH))
     cursor = dl.db.get_cursor()
@@ -68,16 +79,35 @@ def main():
     """)
     dl.db.commit()
 
+    cycle_scheduler = AdaptiveScheduler(cyclone.data_locker)
+
+    # Monitors Cyclone does not drive run on their own fixed-rate schedules.
+    from monitor.monitor_scheduler import MonitorScheduler, load_schedules
+    from monitor.monitor_utils import TimerConfig
+    timer_config = TimerConfig()
+    side_schedules = {
+        name: cfg for name, cfg in load_schedules(timer_config).items()
+        if name not in CYCLONE_MONITORS
+    }
+    monitor_scheduler = MonitorScheduler(monitor_core, schedules=side_schedules, timer_config=timer_config).start()
+
     loop = asyncio.get_event_loop()
     try:
         while True:
-            # Always use the latest interval from the DB for max flexibility
+            # The DB interval is the fallback when there is no price/position data
             interval = get_monitor_interval()
             loop_counter += 1
+            cycle_started = time.monotonic()
             loop.run_until_complete(sonic_cycle(loop_counter, cyclone, interval))
-            time.sleep(interval)
+            delay, _ = cycle_scheduler.next_delay(baseline=interval)
+            # Delay is start-to-start, so cycle time does not stretch the period.
+            time.sleep(max(0.0, delay - (time.monotonic() - cycle_started)))
     except KeyboardInterrupt:
         logging.info("SonicMonitor terminated by user.")
+    finally:
+        monitor_scheduler.stop(wait=False)
+        ticker.stop()
+        get_tick_bus().close()
 
 if __name__ == "__main__":
     main()
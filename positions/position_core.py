@@ -3,6 +3,7 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.core_imports import log
+from core.cancellation import StepCancelled, check_cancelled
 from positions.position_store import PositionStore
 from positions.position_enrichment_service import PositionEnrichmentService
 from positions.position_enrichment_service import validate_enriched_position
@@ -76,19 +77,24 @@ class PositionCore:
             log.error(f"❌ Failed to generate hedges: {e}", source="PositionCore")
             return []
 
-    async def enrich_positions(self):
+    async def enrich_positions(self, assets=None):
         """
         Enriches all current positions and returns the list.
-        Performs validation after enrichment.
+        Performs validation after enrichment. ``assets`` limits the work to
+        positions on those assets (price tick reactions).
         """
         log.banner("🧠 Enriching All Positions via PositionCore")
 
         try:
             raw = self.store.get_all()
+            if assets is not None:
+                wanted = {str(a).upper() for a in assets}
+                raw = [p for p in raw if str(p.get("asset_type", "")).upper() in wanted]
             enriched = []
             failed = []
 
             for pos in raw:
+                check_cancelled()
                 try:
                     enriched_pos = self.enricher.enrich(pos)
 
@@ -112,6 +118,9 @@ class PositionCore:
 
             return enriched
 
+        except StepCancelled as e:
+            log.warning(f"⏹️ enrich_positions() cancelled: {e}", source="PositionCore")
+            return []
         except Exception as e:
             log.error(f"❌ enrich_positions() failed: {e}", source="PositionCore")
             return []
@@ -2,45 +2,47 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from datetime import datetime
-import requests
+import hashlib
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from core.logging import log
+from core.cancellation import check_cancelled, submit_with_context
+from core.http_client import get_http_client, RequestException
 from core.constants import JUPITER_API_BASE
+from core.asset_registry import get_asset_registry
 from data.data_locker import DataLocker
 from positions.position_enrichment_service import PositionEnrichmentService
 from calc_core.calculation_core import CalculationCore
 
 class PositionSyncService:
-    def __init__(self, data_locker):
-        self.dl = data_locker
+    DEFAULT_MAX_CONCURRENCY = 8
+    DEFAULT_WALLET_TIMEOUT = 20.0
+    WATERMARK_VAR = "jupiter_sync_watermarks"
 
-    MINT_TO_ASSET = {
-        "3NZ9JMVBmGAqocybic2c7LQCJScmgsAZ6vQqTDzcqmJh": "BTC",
-        "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs": "ETH",
-        "So11111111111111111111111111111111111111112": "SOL"
-    }
+    def __init__(self, data_locker, max_concurrency: int = None, wallet_timeout: float = None,
+                 api_base: str = None):
+        self.dl = data_locker
+        self.api_base = (api_base or JUPITER_API_BASE).rstrip("/")
+        self.max_concurrency = max_concurrency or self.DEFAULT_MAX_CONCURRENCY
+        self.wallet_timeout = wallet_timeout or self.DEFAULT_WALLET_TIMEOUT
 
-    def _request_with_retries(self, url: str, attempts: int = 3, delay: float = 1.0):
-        """Return a requests.Response object with simple retry logic."""
+    def _request_with_retries(self, url: str, attempts: int = 3, delay: float = 1.0, deadline: float = None):
+        """Return a requests.Response via the shared pooled client (jittered retry)."""
         headers = {"User-Agent": "Cyclone/PositionSyncService"}
-        for attempt in range(1, attempts + 1):
-            try:
-                res = requests.get(url, headers=headers, timeout=10)
-                log.debug(
-                    f"📡 Attempt {attempt} → status {res.status_code}",
-                    source="JupiterAPI",
-                )
-                res.raise_for_status()
-                return res
-            except requests.RequestException as e:
-                log.error(
-                    f"[{attempt}/{attempts}] Request error: {e}",
-                    source="JupiterAPI",
-                )
-                if attempt == attempts:
-                    raise
-                time.sleep(delay * attempt)
+        res = get_http_client().get(
+            url,
+            headers=headers,
+            timeout=10,
+            retries=attempts - 1,
+            backoff_base=delay,
+            deadline=deadline,
+            endpoint="jupiter.positions",
+            breaker="jupiter_perps",
+        )
+        log.debug(f"📡 Jupiter → status {res.status_code}", source="JupiterAPI")
+        res.raise_for_status()
+        return res
 
     def run_full_jupiter_sync(self, source="user") -> dict:
         from positions.hedge_manager import HedgeManager
@@ -127,7 +129,7 @@ class PositionSyncService:
             # ✅ Step 6: Ledger Entry
             try:
                 ledger = DLMonitorLedgerManager(self.dl.db)
-                status = "Success" if errors == 0 else "Error"
+                status = "Success" if errors == 0 and not result.get("failed_wallets") else "Error"
                 ledger.insert_ledger_entry("position_monitor", status, metadata=result)
             except Exception as e:
                 log.warning(f"⚠️ Failed to write monitor ledger: {e}", source="PositionSyncService")
@@ -146,6 +148,177 @@ class PositionSyncService:
                 "timestamp": datetime.now().isoformat()
             }
 
+    def _parse_jupiter_item(self, item: dict, wallet_name: str):
+        pos_id = item.get("positionPubkey")
+        if not pos_id:
+            log.warning("🚫 Missing positionPubkey, skipping", source="PositionSyncService")
+            return None
+        return {
+            "id": pos_id,
+            "asset_type": get_asset_registry().asset_for_mint(item.get("marketMint", ""), "BTC"),
+            "position_type": item.get("side", "short").lower(),
+            "entry_price": float(item.get("entryPrice", 0.0)),
+            "liquidation_price": float(item.get("liquidationPrice", 0.0)),
+            "collateral": float(item.get("collateral", 0.0)),
+            "size": float(item.get("size", 0.0)),
+            "leverage": float(item.get("leverage", 0.0)),
+            "value": float(item.get("value", 0.0)),
+            "last_updated": datetime.fromtimestamp(float(item.get("updatedTime", 0))).isoformat(),
+            "wallet_name": wallet_name,
+            "pnl_after_fees_usd": float(item.get("pnlAfterFeesUsd", 0.0)),
+            "travel_percent": float(item.get("pnlChangePctAfterFees", 0.0)),
+            "current_price": float(item.get("markPrice", 0.0))
+        }
+
+    @staticmethod
+    def _payload_hash(data_list: list) -> str:
+        """Stable content hash of a wallet's Jupiter ``dataList``."""
+        import json
+        encoded = json.dumps(data_list, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+    def _fetch_wallet_positions(self, wallet: dict) -> dict:
+        """
+        Fetch and parse one wallet's Jupiter positions (runs on a worker thread).
+        Returns ``{"positions", "hash", "stamps"}`` where ``stamps`` maps each
+        position id to a content hash of its Jupiter item. ``updatedTime``
+        alone is not enough: it stays put while the mark price, value and
+        PnL move.
+        """
+        pub = wallet.get("public_address", "").strip()
+        name = wallet.get("name", "Unnamed")
+        deadline = time.monotonic() + self.wallet_timeout
+
+        url = f"{self.api_base}/v1/positions?walletAddress={pub}&showTpslRequests=true"
+        res = self._request_with_retries(url, deadline=deadline)
+
+        log.debug(f"🌐 [{name}] Jupiter API status: {res.status_code}", source="JupiterAPI")
+        log.debug(f"📝 Response Body:\n{res.text}", source="JupiterAPI")
+
+        data_list = res.json().get("dataList", [])
+        log.info(f"📊 {name} → {len(data_list)} Jupiter positions", source="PositionSyncService")
+
+        parsed = []
+        stamps = {}
+        for item in data_list:
+            raw_pos = self._parse_jupiter_item(item, name)
+            if raw_pos:
+                log.debug(f"🆕 Parsed Jupiter position: {raw_pos}", source="Parser")
+                parsed.append(raw_pos)
+                stamps[raw_pos["id"]] = self._payload_hash([item])
+        return {"positions": parsed, "hash": self._payload_hash(data_list), "stamps": stamps}
+
+    def fetch_all_wallets(self, wallets: list) -> tuple:
+        """
+        Fetch every wallet concurrently (at most ``max_concurrency`` in flight,
+        each bounded by ``wallet_timeout``). Returns ``(positions, report)``
+        where ``report`` lists synced wallets, per-wallet failures, and the
+        payload hash / position stamps used for watermarking.
+        """
+        report = {"synced": [], "failed": {}, "skipped": [], "hashes": {}, "stamps": {}}
+        targets = []
+        for wallet in wallets:
+            name = wallet.get("name", "Unnamed")
+            if not wallet.get("public_address", "").strip():
+                log.warning(f"⚠️ Skipping {name} — missing address", source="PositionSyncService")
+                report["skipped"].append(name)
+                continue
+            targets.append(wallet)
+
+        positions = []
+        if not targets:
+            return positions, report
+
+        workers = max(1, min(self.max_concurrency, len(targets)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jupiter-sync") as pool:
+            futures = {
+                submit_with_context(pool, self._fetch_wallet_positions, w): w.get("name", "Unnamed")
+                for w in targets
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    fetched = future.result()
+                except Exception as e:
+                    log.error(f"❌ [{name}] API Request Error: {e}", source="JupiterAPI")
+                    report["failed"][name] = str(e)
+                    continue
+                positions.extend(fetched["positions"])
+                report["synced"].append(name)
+                report["hashes"][name] = fetched["hash"]
+                report["stamps"].update(fetched["stamps"])
+        return positions, report
+
+    # --------------------------------------------------------------
+    def _load_watermarks(self) -> dict:
+        try:
+            marks = self.dl.system.get_var(self.WATERMARK_VAR) or {}
+        except Exception as e:
+            log.warning(f"⚠️ Failed to load sync watermarks: {e}", source="PositionSyncService")
+            marks = {}
+        return {"wallets": marks.get("wallets") or {}, "positions": marks.get("positions") or {}}
+
+    def _save_watermarks(self, marks: dict):
+        try:
+            self.dl.system.set_var(self.WATERMARK_VAR, marks)
+        except Exception as e:
+            log.warning(f"⚠️ Failed to save sync watermarks: {e}", source="PositionSyncService")
+
+    def apply_watermarks(self, positions: list, report: dict, marks: dict) -> tuple:
+        """
+        Drop work already done by a previous sync.
+
+        A wallet whose payload hash matches its watermark, and whose ACTIVE
+        rows are still exactly the ids recorded with it, is skipped outright.
+        Within changed wallets, a position whose item hash matches its
+        watermark (nothing upstream changed, mark price and PnL included) and
+        is still ACTIVE is kept as-is without enrichment. Returns ``(positions_to_process, wallets_to_reconcile,
+        keep_ids, unchanged_wallets)``.
+        """
+        active = self.dl.positions.get_active_position_ids(report["synced"])
+        unchanged_wallets = []
+        for name in report["synced"]:
+            mark = marks["wallets"].get(name) or {}
+            if (
+                mark.get("hash") == report["hashes"].get(name)
+                and set(mark.get("ids") or []) == active.get(name, set())
+            ):
+                unchanged_wallets.append(name)
+
+        active_ids = set().union(*active.values()) if active else set()
+        keep_ids = set()
+        remaining = []
+        for pos in positions:
+            if pos.get("wallet_name") in unchanged_wallets:
+                continue
+            stamp = report["stamps"].get(pos["id"])
+            if stamp is not None and pos["id"] in active_ids and marks["positions"].get(pos["id"]) == stamp:
+                keep_ids.add(pos["id"])
+                continue
+            remaining.append(pos)
+
+        wallets = [name for name in report["synced"] if name not in unchanged_wallets]
+        return remaining, wallets, keep_ids, unchanged_wallets
+
+    def _next_watermarks(self, marks: dict, positions: list, report: dict, wallets: list, closed: list) -> dict:
+        by_wallet = {}
+        for pos in positions:
+            by_wallet.setdefault(pos.get("wallet_name"), []).append(pos["id"])
+        position_marks = dict(marks["positions"])
+        for pos_id in closed:
+            position_marks.pop(pos_id, None)
+        wallet_marks = dict(marks["wallets"])
+        for name in wallets:
+            ids = by_wallet.get(name, [])
+            wallet_marks[name] = {"hash": report["hashes"].get(name), "ids": sorted(ids)}
+            for pos_id in ids:
+                stamp = report["stamps"].get(pos_id)
+                if stamp is None:
+                    position_marks.pop(pos_id, None)
+                else:
+                    position_marks[pos_id] = stamp
+        return {"wallets": wallet_marks, "positions": position_marks}
+
     def update_jupiter_positions(self):
         from positions.position_enrichment_service import PositionEnrichmentService
         from core.logging import log
@@ -157,84 +330,29 @@ class PositionSyncService:
             wallets = self.dl.read_wallets()
             log.info(f"🔍 Loaded {len(wallets)} wallets for sync", source="PositionSyncService")
 
-            new_positions = []
+            fetched_positions, wallet_report = self.fetch_all_wallets(wallets)
 
-            for wallet in wallets:
-                pub = wallet.get("public_address", "").strip()
-                name = wallet.get("name", "Unnamed")
-
-                if not pub:
-                    log.warning(f"⚠️ Skipping {name} — missing address", source="PositionSyncService")
-                    continue
-
-                try:
-                    url = f"{JUPITER_API_BASE}/v1/positions?walletAddress={pub}&showTpslRequests=true"
-                    res = self._request_with_retries(url)
-
-                    log.debug(f"🌐 [{name}] Jupiter API status: {res.status_code}", source="JupiterAPI")
-                    log.debug(f"📝 Response Body:\n{res.text}", source="JupiterAPI")
-
-                    data_list = res.json().get("dataList", [])
-                    log.info(f"📊 {name} → {len(data_list)} Jupiter positions", source="PositionSyncService")
-
-                    for item in data_list:
-                        pos_id = item.get("positionPubkey")
-                        if not pos_id:
-                            log.warning("🚫 Missing positionPubkey, skipping", source="PositionSyncService")
-                            continue
-
-                        raw_pos = {
-                            "id": pos_id,
-                            "asset_type": self.MINT_TO_ASSET.get(item.get("marketMint", ""), "BTC"),
-                            "position_type": item.get("side", "short").lower(),
-                            "entry_price": float(item.get("entryPrice", 0.0)),
-                            "liquidation_price": float(item.get("liquidationPrice", 0.0)),
-                            "collateral": float(item.get("collateral", 0.0)),
-                            "size": float(item.get("size", 0.0)),
-                            "leverage": float(item.get("leverage", 0.0)),
-                            "value": float(item.get("value", 0.0)),
-                            "last_updated": datetime.fromtimestamp(float(item.get("updatedTime", 0))).isoformat(),
-                            "wallet_name": name,
-                            "pnl_after_fees_usd": float(item.get("pnlAfterFeesUsd", 0.0)),
-                            "travel_percent": float(item.get("pnlChangePctAfterFees", 0.0)),
-                            "current_price": float(item.get("markPrice", 0.0))
-                        }
-
-                        log.debug(f"🆕 Parsed Jupiter position: {raw_pos}", source="Parser")
-                        new_positions.append(raw_pos)
-
-                except requests.RequestException as e:
-                    log.error(f"❌ [{name}] API Request Error: {e}", source="JupiterAPI")
-                    log.debug(f"📝 Raw body:\n{res.text if 'res' in locals() else 'no response'}", source="JupiterAPI")
+            # ✅ Skip wallets/positions unchanged since the last sync
+            marks = self._load_watermarks()
+            new_positions, reconcile_wallets, keep_ids, unchanged_wallets = self.apply_watermarks(
+                fetched_positions, wallet_report, marks
+            )
+            if unchanged_wallets or keep_ids:
+                log.info(
+                    f"💤 Watermarks → {len(unchanged_wallets)} wallets unchanged, "
+                    f"{len(keep_ids)} positions unchanged",
+                    source="PositionSyncService",
+                )
 
-            imported = 0
             errors = 0
             skipped = 0
+            enriched_positions = []
+            batch_ids = set()
             enricher = PositionEnrichmentService(self.dl)
 
-            # ✅ Fetch DB schema for safe field filtering
-            try:
-                cursor = self.dl.db.get_cursor()
-                cursor.execute("PRAGMA table_info(positions);")
-                db_columns = set(row[1] for row in cursor.fetchall())
-                cursor.close()
-            except Exception as e:
-                log.warning(f"⚠️ Failed to fetch DB schema: {e}", source="InsertCheck")
-                db_columns = None
-
             for pos in new_positions:
-                try:
-                    cursor = self.dl.db.get_cursor()
-                    cursor.execute("SELECT COUNT(*) FROM positions WHERE id = ?", (pos["id"],))
-                    exists = cursor.fetchone()[0]
-                    cursor.close()
-                except Exception as e:
-                    log.error(f"❌ DB existence check failed for {pos['id']}: {e}", source="InsertCheck")
-                    errors += 1
-                    continue
-
-                if exists:
-                    log.info(f"⏭️ Skipped (already exists): {pos['id']}", source="InsertCheck")
+                if pos["id"] in batch_ids:
+                    log.info(f"⏭️ Skipped (duplicate in payload): {pos['id']}", source="InsertCheck")
                     skipped += 1
                     continue
 
@@ -242,37 +360,49 @@ class PositionSyncService:
                     enriched = enricher.enrich(pos)
                     enriched.setdefault("alert_reference_id", None)
                     enriched.setdefault("hedge_buddy_id", None)
-
-                    # ✅ Strip unknown fields
-                    if db_columns:
-                        stripped_keys = set(enriched.keys()) - db_columns
-                        if stripped_keys:
-                            log.debug(f"🧹 Stripped non-schema keys: {stripped_keys}", source="InsertSanitizer")
-                        enriched = {k: v for k, v in enriched.items() if k in db_columns}
-
                 except Exception as e:
                     log.error(f"❌ Enrichment failed for {pos['id']}: {e}", source="Enrichment")
                     errors += 1
+                    # Still live upstream: keep the stored row instead of closing it.
+                    keep_ids.add(pos["id"])
                     continue
 
-                try:
-                    self.dl.positions.create_position(enriched)
-                    log.success(f"✅ Inserted: {pos['id']}", source="InsertVerify")
-                    imported += 1
-                except Exception as e:
-                    log.error(f"❌ Insert failed for {pos['id']}: {e}", source="InsertVerify")
-                    errors += 1
-
+                enriched_positions.append(enriched)
+                batch_ids.add(pos["id"])
+
+            # ✅ Diff against stored ACTIVE rows and apply in one transaction.
+            # Only wallets that fetched successfully are reconciled, so a
+            # failed wallet never has its positions closed. A sync whose
+            # Cyclone step already timed out stops here and writes nothing.
+            check_cancelled()
+            changes = self.dl.positions.reconcile_positions(enriched_positions, reconcile_wallets, keep_ids)
+            imported = len(changes["inserted"])
+            skipped += changes["unchanged"]
+            skipped += sum(1 for p in fetched_positions if p.get("wallet_name") in unchanged_wallets)
+
+            if errors == 0:
+                self._save_watermarks(self._next_watermarks(
+                    marks, fetched_positions, wallet_report, reconcile_wallets, changes["closed"]
+                ))
+
+            failed_wallets = wallet_report["failed"]
             log.info(
-                f"📦 Jupiter Sync Result → Imported: {imported}, Skipped: {skipped}, Errors: {errors}",
+                f"📦 Jupiter Sync Result → Imported: {imported}, Updated: {len(changes['updated'])}, "
+                f"Closed: {len(changes['closed'])}, Skipped: {skipped}, Errors: {errors}, "
+                f"Wallets: {len(wallet_report['synced'])} ok / {len(failed_wallets)} failed",
                 source="SyncSummary"
             )
 
             return {
                 "message": "Jupiter sync complete",
                 "imported": imported,
+                "updated": len(changes["updated"]),
+                "closed": len(changes["closed"]),
                 "skipped": skipped,
-                "errors": errors
+                "errors": errors,
+                "wallets_synced": len(wallet_report["synced"]),
+                "wallets_unchanged": len(unchanged_wallets),
+                "failed_wallets": failed_wallets,
             }
 
         except Exception as e:
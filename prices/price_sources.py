@@ -0,0 +1,286 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import statistics
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from core.logging import log
+from core.cancellation import submit_with_context
+from core.http_client import get_http_client
+from core.response_cache import get_response_cache
+from core.asset_registry import get_asset_registry
+from core.constants import (
+    COINGECKO_API_BASE,
+    JUPITER_PRICE_API_BASE,
+    PRICE_DEADLINE_SECONDS,
+    PRICE_QUORUM,
+)
+
+
+
+class PriceSource:
+    """
+    One upstream quote provider. ``fetch`` returns ``{asset: price}`` or
+    ``(prices, data_time)`` where ``data_time`` is the provider's own quote
+    timestamp (epoch seconds), used to report how old its data is.
+
+    Requests go through the shared response cache (one upstream call per
+    URL per TTL, concurrent callers coalesced) and the provider's request
+    budget, so sync cycles and manual refreshes share a single quota.
+
+    Provider ids come from the asset registry; assets are requested in
+    chunks of ``max_batch`` ids, so the request count grows with
+    ``len(assets) / max_batch`` rather than with the asset count.
+    """
+
+    name = "source"
+    breaker = None
+    budget = None
+    max_batch = 100
+
+    def __init__(self, api_base: str, timeout: float = 5.0, cache=None, registry=None, max_batch: int = None):
+        self.api_base = api_base.rstrip("/")
+        self.timeout = timeout
+        self.cache = cache
+        self.registry = registry
+        self.max_batch = max(1, int(max_batch or self.max_batch))
+
+    def fetch(self, assets: list, deadline: float = None) -> dict:
+        ids = self.provider_ids(assets)
+        if not ids:
+            return {}
+        prices, stamps, errors = {}, [], []
+        keys = sorted(ids)
+        for start in range(0, len(keys), self.max_batch):
+            chunk = {key: ids[key] for key in keys[start:start + self.max_batch]}
+            try:
+                chunk_prices, data_time = self.fetch_chunk(chunk, deadline)
+            except Exception as e:
+                errors.append(e)
+                log.warning(f"⚠️ {self.name} chunk of {len(chunk)} failed: {e}", source="PriceAggregator")
+                continue
+            prices.update(chunk_prices)
+            if data_time:
+                stamps.append(data_time)
+        if errors and not prices:
+            raise errors[0]
+        return prices, (min(stamps) if stamps else None)
+
+    def provider_ids(self, assets: list) -> dict:
+        """``{provider_id: symbol}`` for the requested assets this source can price."""
+        return {asset: asset for asset in assets}
+
+    def fetch_chunk(self, ids: dict, deadline: float) -> tuple:
+        """One request for ``ids``; returns ``(prices, data_time)``."""
+        raise NotImplementedError
+
+    def _registry(self):
+        return self.registry or get_asset_registry()
+
+    def _get(self, url: str, params: dict, deadline: float):
+        cache = self.cache or get_response_cache()
+        return cache.get_json(
+            get_http_client(), url, params=params, timeout=self.timeout, deadline=deadline,
+            endpoint=f"{self.name}.price", breaker=self.breaker, budget=self.budget,
+        )
+
+
+class CoinGeckoSource(PriceSource):
+    name = "coingecko"
+    breaker = "coingecko"
+    budget = "coingecko"
+
+    def __init__(self, api_base: str = COINGECKO_API_BASE, **kwargs):
+        super().__init__(api_base, **kwargs)
+
+    def provider_ids(self, assets: list) -> dict:
+        return self._registry().coingecko_ids(assets)
+
+    def fetch_chunk(self, ids: dict, deadline: float) -> tuple:
+        data = self._get(
+            f"{self.api_base}/simple/price",
+            {"ids": ",".join(ids), "vs_currencies": "usd", "include_last_updated_at": "true"},
+            deadline,
+        )
+        prices, stamps = {}, []
+        for cid, asset in ids.items():
+            quote = data.get(cid) or {}
+            if quote.get("usd") is not None:
+                prices[asset] = float(quote["usd"])
+            if quote.get("last_updated_at"):
+                stamps.append(float(quote["last_updated_at"]))
+        return prices, (min(stamps) if stamps else None)
+
+
+class JupiterPriceSource(PriceSource):
+    name = "jupiter"
+    breaker = "jupiter_price"
+    budget = "jupiter_price"
+
+    def __init__(self, api_base: str = JUPITER_PRICE_API_BASE, **kwargs):
+        super().__init__(api_base, **kwargs)
+
+    def provider_ids(self, assets: list) -> dict:
+        return self._registry().jupiter_mints(assets)
+
+    def fetch_chunk(self, mints: dict, deadline: float) -> tuple:
+        data = self._get(self.api_base, {"ids": ",".join(mints)}, deadline).get("data") or {}
+        prices = {}
+        for mint, asset in mints.items():
+            quote = data.get(mint) or {}
+            if quote.get("price") is not None:
+                prices[asset] = float(quote["price"])
+        return prices, None
+
+
+SOURCE_TYPES = {cls.name: cls for cls in (CoinGeckoSource, JupiterPriceSource)}
+
+
+def build_sources(specs, coingecko_base: str = None, jupiter_base: str = None) -> list:
+    """Turn names (``"coingecko"``) or ready instances into :class:`PriceSource` objects."""
+    bases = {"coingecko": coingecko_base, "jupiter": jupiter_base}
+    sources = []
+    for spec in specs:
+        if isinstance(spec, PriceSource):
+            sources.append(spec)
+            continue
+        cls = SOURCE_TYPES.get(spec)
+        if cls is None:
+            log.warning(f"⚠️ Unknown price source '{spec}' ignored", source="PriceAggregator")
+            continue
+        sources.append(cls(bases[spec]) if bases.get(spec) else cls())
+    return sources
+
+
+class PriceAggregator:
+    """
+    Queries several :class:`PriceSource` objects concurrently and merges them.
+
+    Sources are listed in priority order. The first ``quorum`` start at once;
+    the rest are hedges, launched after ``hedge_delay`` seconds without a
+    quorum or as soon as a running source fails. The call returns when every
+    requested asset has ``quorum`` quotes or at ``deadline`` seconds,
+    whichever is first. Each asset's price is the median of the quotes in
+    hand. An asset only some sources list needs at most that many quotes.
+    Sources still running are abandoned; their HTTP deadline stops
+    further retries. Per-source latency, errors and staleness are kept in
+    :attr:`source_status`.
+    """
+
+    def __init__(self, sources: list, quorum: int = PRICE_QUORUM, deadline: float = PRICE_DEADLINE_SECONDS,
+                 hedge_delay: float = 0.0, clock=time.time):
+        self.sources = list(sources)
+        self.quorum = max(1, min(int(quorum), len(self.sources) or 1))
+        self.deadline = deadline
+        self.hedge_delay = hedge_delay
+        self.clock = clock
+        self.source_status = {s.name: {"last_success": None} for s in self.sources}
+        self._lock = threading.Lock()
+
+    def _run_source(self, source: PriceSource, assets: list, deadline: float):
+        start = time.perf_counter()
+        try:
+            result = source.fetch(assets, deadline=deadline)
+            prices, data_time = result if isinstance(result, tuple) else (result, None)
+            return source, prices or {}, data_time, None, (time.perf_counter() - start) * 1000
+        except Exception as e:
+            return source, {}, None, str(e) or e.__class__.__name__, (time.perf_counter() - start) * 1000
+
+    def _record(self, source, prices, data_time, error, latency_ms, used: bool):
+        now = self.clock()
+        with self._lock:
+            status = self.source_status.setdefault(source.name, {"last_success": None})
+            status.update({
+                "ok": error is None and bool(prices),
+                "error": error,
+                "latency_ms": round(latency_ms, 2),
+                "used": used,
+                "assets": sorted(prices),
+            })
+            if error is None and prices:
+                status["last_success"] = now
+                status["data_age_seconds"] = round(now - data_time, 1) if data_time else None
+            last = status.get("last_success")
+            status["stale_seconds"] = round(now - last, 1) if last else None
+
+    def _needed_quotes(self, assets: list) -> dict:
+        coverage = {asset: 0 for asset in assets}
+        for source in self.sources:
+            try:
+                listed = set(source.provider_ids(assets).values())
+            except Exception:
+                listed = set(assets)
+            for asset in listed & set(coverage):
+                coverage[asset] += 1
+        return {asset: min(self.quorum, count) for asset, count in coverage.items()}
+
+    def fetch(self, assets: list) -> tuple:
+        """Return ``(prices, report)`` for ``assets``."""
+        started = time.monotonic()
+        deadline = started + self.deadline
+        quotes = {asset: [] for asset in assets}
+        needed = self._needed_quotes(assets)
+        pending = {}
+        waiting = list(self.sources)
+        pool = ThreadPoolExecutor(max_workers=max(1, len(self.sources)), thread_name_prefix="price-src")
+
+        def launch(count):
+            for _ in range(min(count, len(waiting))):
+                source = waiting.pop(0)
+                pending[submit_with_context(pool, self._run_source, source, assets, deadline)] = source.name
+
+        def satisfied():
+            return all(len(q) >= needed[asset] for asset, q in quotes.items())
+
+        launch(self.quorum)
+        hedge_at = started + self.hedge_delay
+        try:
+            while (pending or waiting) and not satisfied():
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                if not pending:
+                    launch(len(waiting))
+                wake = deadline if not waiting else min(deadline, max(hedge_at, now))
+                done, _ = wait(list(pending), timeout=max(0.0, wake - now), return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.pop(future)
+                    source, prices, data_time, error, latency_ms = future.result()
+                    self._record(source, prices, data_time, error, latency_ms, used=True)
+                    if error or not prices:
+                        launch(1)
+                    for asset, price in prices.items():
+                        if asset in quotes:
+                            quotes[asset].append((source.name, price))
+                if waiting and time.monotonic() >= hedge_at and not satisfied():
+                    launch(len(waiting))
+        finally:
+            for future, name in pending.items():
+                future.cancel()
+                with self._lock:
+                    self.source_status.setdefault(name, {"last_success": None}).update(
+                        {"used": False, "error": "deadline exceeded"}
+                    )
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        prices = {
+            asset: statistics.median(p for _, p in q)
+            for asset, q in quotes.items() if q
+        }
+        report = {
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 2),
+            "quorum": self.quorum,
+            "degraded": not satisfied(),
+            "abandoned": sorted(pending.values()),
+            "quotes": {asset: dict(q) for asset, q in quotes.items()},
+            "sources": {name: dict(status) for name, status in self.source_status.items()},
+        }
+        if report["degraded"]:
+            log.warning(
+                f"⚠️ Price quorum not reached for {[a for a, q in quotes.items() if len(q) < needed[a]]}",
+                source="PriceAggregator",
+            )
+        return prices, report
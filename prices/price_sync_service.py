@@ -3,6 +3,7 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.logging import log
+from core.tick_bus import get_tick_bus
 from monitor.monitor_service import MonitorService
 from data.dl_monitor_ledger import DLMonitorLedgerManager
 from datetime import datetime, timezone
@@ -31,21 +32,25 @@ class PriceSyncService:
                     "assets": [],
                     "success": False,
                     "error": "No prices returned from service",
+                    "sources": self._source_summary(),
                     "timestamp": now.isoformat()
                 }
                 self._write_ledger(result, "Error")
                 return result
 
-            asset_list = []
-            for asset, price in prices.items():
-                self.dl.insert_or_update_price(asset, price, source=source)
-                log.info(f"💾 Saved {asset} = ${price:,.4f}", source="PriceSyncService")
-                asset_list.append(asset)
+            sources = self._source_summary()
+            asset_list = list(prices)
+            self.dl.insert_or_update_prices(prices, source=source)
+            # Stored first, so subscribers that re-read the DB see the new prices.
+            get_tick_bus().publish_prices(prices, source=source)
+            log.info(f"💾 Saved {len(asset_list)} prices", source="PriceSyncService",
+                     payload={a: round(p, 4) for a, p in prices.items()})
 
             result = {
                 "fetched_count": len(prices),
                 "assets": asset_list,
                 "success": True,
+                "sources": sources,
                 "timestamp": now.isoformat()
             }
 
@@ -72,6 +77,19 @@ class PriceSyncService:
             self._write_ledger(result, "Error")
             return result
 
+    def _source_summary(self) -> dict:
+        """Compact per-source status (latency, staleness, errors) for the ledger."""
+        report = getattr(self.service, "last_report", None) or {}
+        return {
+            "elapsed_ms": report.get("elapsed_ms"),
+            "degraded": report.get("degraded"),
+            "abandoned": report.get("abandoned", []),
+            "status": {
+                name: {k: status.get(k) for k in ("ok", "latency_ms", "stale_seconds", "data_age_seconds", "error")}
+                for name, status in (report.get("sources") or {}).items()
+            },
+        }
+
     def _write_ledger(self, result: dict, status: str):
         try:
             ledger = DLMonitorLedgerManager(self.dl.db)
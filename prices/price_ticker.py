@@ -0,0 +1,80 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+import time
+
+from core.logging import log
+from core.constants import PRICE_TICK_INTERVAL
+from core.tick_bus import get_tick_bus
+
+
+class PriceTicker:
+    """
+    Background poller that turns quote changes into ticks between full
+    Cyclone cycles. Quotes come through MonitorService, so polls share the
+    response cache and request budgets with everything else; only assets
+    whose price changed are written to the DB and published. Writes go
+    through a DataLocker of the ticker's own, since polls run on the
+    ticker thread while cycles use the engine's connection.
+    """
+
+    def __init__(self, data_locker, service=None, bus=None, interval: float = PRICE_TICK_INTERVAL):
+        from monitor.monitor_service import MonitorService
+
+        self.dl = self._own_locker(data_locker)
+        self.service = service or MonitorService()
+        self.bus = bus or get_tick_bus()
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+        self.polls = 0
+        self.ticks = 0
+
+    @staticmethod
+    def _own_locker(data_locker):
+        from data.data_locker import DataLocker
+
+        path = getattr(getattr(data_locker, "db", None), "db_path", None)
+        if not path or path == ":memory:":
+            return data_locker
+        return DataLocker(path)
+
+    def poll_once(self) -> list:
+        prices = self.service.fetch_prices() or {}
+        changed = {a: p for a, p in prices.items() if self.bus.last_price(a) != p}
+        self.polls += 1
+        if not changed:
+            return []
+        try:
+            self.dl.insert_or_update_prices(changed, source="PriceTicker")
+        except Exception as e:
+            log.error(f"❌ Failed to store ticked prices: {e}", source="PriceTicker")
+        ticks = self.bus.publish_prices(changed, source="PriceTicker")
+        self.ticks += len(ticks)
+        return ticks
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.poll_once()
+            except Exception as e:
+                log.error(f"❌ Price tick poll failed: {e}", source="PriceTicker")
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="price-ticker", daemon=True)
+        self._thread.start()
+        log.info(f"📡 Price ticker polling every {self.interval:.0f}s", source="PriceTicker")
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
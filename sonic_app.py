@@ -46,6 +46,7 @@ from dashboard.dashboard_service import get_profit_badge_value
 # --- Monitor & Cyclone Core Integration ---
 from monitor.monitor_core import MonitorCore
 from cyclone.cyclone_engine import Cyclone
+from cyclone.cyclone_worker import CycloneWorker
 
 # --- Logging Setup ---
 log.banner("SONIC DASHBOARD STARTUP")
@@ -63,6 +64,8 @@ app.data_locker = DataLocker(str(DB_PATH))
 app.system_core = SystemCore(app.data_locker)
 app.monitor_core = MonitorCore()
 app.cyclone = Cyclone(monitor_core=app.monitor_core)
+# One worker thread runs every dashboard-triggered Cyclone job in turn.
+app.cyclone_worker = CycloneWorker(context_factory=app.app_context).start()
 
 # --- Blueprints ---
 from app.positions_bp import positions_bp
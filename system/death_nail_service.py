@@ -41,11 +41,11 @@ class DeathNailService:
             # 💀 1. Console log
             self.logger.death(message, payload=payload)
 
-            # 🔊 2. Play death spiral sound
+            # 🔊 2. Death spiral sound; block so it finishes before the process exits
             try:
                 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
                 abs_path = os.path.join(base_dir, "static", "sounds", "death_spiral.mp3")
-                SoundService().play(abs_path)
+                SoundService().play(abs_path, block=True)
             except Exception as e:
                 self.logger.warning(f"⚠️ Death spiral sound failed: {e}", source="DeathNail")
 
@@ -68,7 +68,8 @@ class DeathNailService:
                         subject="💀 Fatal Error Triggered",
                         body=message,
                         recipient=recipient,
-                        initiator="SystemCore"
+                        initiator="SystemCore",
+                        blocking=True,  # the process usually exits right after
                     )
 
                 except Exception as e:
@@ -1 +1,2 @@
 from .test_core import TestCore
+from .fake_services import FakeServiceSuite
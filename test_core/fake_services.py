@@ -0,0 +1,325 @@
+"""
+Author: BubbaDiego
+Module: fake_services.py
+Description:
+    Local stand-in for the external APIs Sonic talks to (Jupiter perps,
+    CoinGecko and Solana JSON-RPC) so sync, price and balance paths can be
+    exercised and benchmarked with no network.
+
+    One threaded HTTP server hosts all three under path prefixes:
+
+        /jupiter     → PositionSyncService / JupiterService / LatencyMonitor,
+                       price API at /jupiter/price/v2
+        /coingecko   → MonitorService.fetch_prices / LatencyMonitor
+        /solana      → Solana JSON-RPC (getBalance, getSlot, getLatestBlockhash)
+
+    Payloads come from the recorded fixtures in ``test_core/fixtures``;
+    ``wallets=N`` adds N synthetic wallets with generated positions. Latency,
+    5xx errors and 429 rate limits are injected per service via
+    :meth:`FakeServiceSuite.set_faults`.
+
+Usage:
+    with FakeServiceSuite(wallets=50, latency=0.05) as fake:
+        for w in fake.wallets:
+            dl.create_wallet(w)
+        PositionSyncService(dl, api_base=fake.jupiter_base).update_jupiter_positions()
+        MonitorService(api_base=fake.coingecko_base).fetch_prices()
+
+    ``fake.env()`` returns the matching ``*_API_BASE`` / ``*_RPC_URL``
+    variables for running a whole process (e.g. a Cyclone cycle) offline.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from core.logging import log
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+SERVICES = ("jupiter", "coingecko", "solana")
+
+MARKET_MINTS = {
+    "BTC": "3NZ9JMVBmGAqocybic2c7LQCJScmgsAZ6vQqTDzcqmJh",
+    "ETH": "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs",
+    "SOL": "So11111111111111111111111111111111111111112",
+}
+COINGECKO_IDS = {"bitcoin": "BTC", "ethereum": "ETH", "solana": "SOL"}
+
+
+class FaultPlan:
+    """Latency and failure injection for one service."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 rate_limit_rate: float = 0.0, retry_after: float = 1, error_status: int = 500):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.error_status = error_status
+
+    def delay(self, rng: random.Random) -> float:
+        return max(0.0, self.latency + (rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0))
+
+
+class FakeServiceSuite:
+    def __init__(self, wallets: int = 0, positions_per_wallet: int = 2, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, rate_limit_rate: float = 0.0,
+                 retry_after: float = 1, seed: int = None, host: str = "127.0.0.1", port: int = 0,
+                 fixtures_dir: str | Path = FIXTURES_DIR):
+        self.host = host
+        self.port = port
+        self.fixtures_dir = Path(fixtures_dir)
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+        default = dict(latency=latency, jitter=jitter, error_rate=error_rate,
+                       rate_limit_rate=rate_limit_rate, retry_after=retry_after)
+        self.faults = {name: FaultPlan(**default) for name in SERVICES}
+        self.hits = {name: 0 for name in SERVICES}
+        self.injected = {"errors": 0, "rate_limited": 0}
+
+        self.recorded_positions = self._load_fixture("jupiter_positions.json").get("dataList", [])
+        self.prices = {
+            COINGECKO_IDS[k]: v["usd"]
+            for k, v in self._load_fixture("coingecko_simple_price.json").items()
+            if k in COINGECKO_IDS
+        }
+        balance = self._load_fixture("solana_get_balance.json").get("result", {})
+        self.slot = balance.get("context", {}).get("slot", 1)
+        self.default_lamports = balance.get("value", 0)
+
+        self.wallets = []
+        self.positions = {}
+        self.balances = {}
+        for i in range(wallets):
+            self.add_wallet(f"SimWallet{i:03d}", positions_per_wallet)
+
+    # --------------------------------------------------------------
+    def _load_fixture(self, name: str) -> dict:
+        try:
+            with open(self.fixtures_dir / name, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            log.warning(f"⚠️ Fake service fixture {name} unavailable: {e}", source="FakeServiceSuite")
+            return {}
+
+    def add_wallet(self, name: str, positions: int = 2, address: str = None) -> dict:
+        """Register a synthetic wallet and generate ``positions`` positions for it."""
+        address = address or f"{name}{self.rng.getrandbits(64):016x}"
+        wallet = {"name": name, "public_address": address, "private_address": f"sim-{name}"}
+        self.wallets.append(wallet)
+        self.positions[address] = [self.make_position(address, i) for i in range(positions)]
+        self.balances[address] = self.rng.randint(1, 500) * 10_000_000
+        return wallet
+
+    def make_position(self, address: str, index: int) -> dict:
+        asset = list(MARKET_MINTS)[index % len(MARKET_MINTS)]
+        mark = self.prices.get(asset, 100.0)
+        side = "long" if self.rng.random() < 0.5 else "short"
+        leverage = self.rng.choice([2, 3, 5, 10, 20])
+        collateral = round(self.rng.uniform(50, 5000), 2)
+        entry = mark * self.rng.uniform(0.9, 1.1)
+        move = (mark - entry) / entry * (1 if side == "long" else -1)
+        pnl = collateral * leverage * move
+        liq_gap = entry / leverage * 0.9
+        return {
+            "positionPubkey": f"{address[:12]}-{asset}-{index}",
+            "owner": address,
+            "marketMint": MARKET_MINTS[asset],
+            "side": side,
+            "entryPrice": f"{entry:.2f}",
+            "markPrice": f"{mark:.2f}",
+            "liquidationPrice": f"{entry - liq_gap if side == 'long' else entry + liq_gap:.2f}",
+            "collateral": f"{collateral:.2f}",
+            "size": f"{collateral * leverage:.2f}",
+            "leverage": f"{leverage:.2f}",
+            "value": f"{collateral + pnl:.2f}",
+            "pnlAfterFeesUsd": f"{pnl:.2f}",
+            "pnlChangePctAfterFees": f"{pnl / collateral * 100:.2f}",
+            "updatedTime": int(time.time()),
+        }
+
+    def set_faults(self, service: str = None, **settings):
+        """Update fault settings for one service (or all when ``service`` is None)."""
+        for name in ([service] if service else SERVICES):
+            plan = self.faults[name]
+            for key, value in settings.items():
+                if not hasattr(plan, key):
+                    raise ValueError(f"Unknown fault setting '{key}'")
+                setattr(plan, key, value)
+
+    # --------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2] if self._server else (self.host, self.port)
+        return f"http://{host}:{port}"
+
+    @property
+    def jupiter_base(self) -> str:
+        return f"{self.base_url}/jupiter"
+
+    @property
+    def coingecko_base(self) -> str:
+        return f"{self.base_url}/coingecko/api/v3"
+
+    @property
+    def jupiter_price_base(self) -> str:
+        return f"{self.jupiter_base}/price/v2"
+
+    @property
+    def solana_rpc_url(self) -> str:
+        return f"{self.base_url}/solana"
+
+    def env(self) -> dict:
+        return {
+            "JUPITER_API_BASE": self.jupiter_base,
+            "JUPITER_QUOTE_API_BASE": self.jupiter_base,
+            "JUPITER_PRICE_API_BASE": self.jupiter_price_base,
+            "COINGECKO_API_BASE": self.coingecko_base,
+            "SOLANA_RPC_URL": self.solana_rpc_url,
+        }
+
+    def start(self):
+        if self._server is not None:
+            return self
+        suite = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                suite._handle(self, "GET")
+
+            def do_POST(self):
+                suite._handle(self, "POST")
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-services", daemon=True)
+        self._thread.start()
+        log.info(f"🧪 Fake services listening on {self.base_url}", source="FakeServiceSuite")
+        return self
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(5)
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --------------------------------------------------------------
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str):
+        parts = urlsplit(handler.path)
+        service, _, rest = parts.path.lstrip("/").partition("/")
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+
+        if service not in self.faults:
+            return self._reply(handler, 404, {"error": f"unknown service '{service}'"})
+
+        with self._lock:
+            self.hits[service] += 1
+            plan = self.faults[service]
+            delay = plan.delay(self.rng)
+            roll = self.rng.random()
+        if delay:
+            time.sleep(delay)
+
+        if roll < plan.rate_limit_rate:
+            with self._lock:
+                self.injected["rate_limited"] += 1
+            return self._reply(handler, 429, {"error": "rate limited"},
+                               headers={"Retry-After": str(plan.retry_after)})
+        if roll < plan.rate_limit_rate + plan.error_rate:
+            with self._lock:
+                self.injected["errors"] += 1
+            return self._reply(handler, plan.error_status, {"error": "injected failure"})
+
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        try:
+            status, payload = getattr(self, f"_{service}")(method, "/" + rest, query, body)
+        except Exception as e:
+            status, payload = 500, {"error": str(e)}
+        self._reply(handler, status, payload)
+
+    @staticmethod
+    def _reply(handler, status: int, payload, headers: dict = None):
+        data = json.dumps(payload).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def _jupiter(self, method, path, query, body):
+        if path.endswith("/ping"):
+            return 200, {"ok": True}
+        if path == "/price/v2":
+            mints = [m for m in query.get("ids", "").split(",") if m]
+            by_mint = {mint: asset for asset, mint in MARKET_MINTS.items()}
+            return 200, {"data": {
+                mint: {"id": mint, "type": "derivedPrice", "price": str(self.prices[by_mint[mint]])}
+                for mint in mints if by_mint.get(mint) in self.prices
+            }, "timeTaken": 0.001}
+        if path == "/v1/positions":
+            address = query.get("walletAddress", "")
+            data = self.positions.get(address, self.recorded_positions)
+            return 200, {"dataList": data, "count": len(data)}
+        return 404, {"error": f"no route {path}"}
+
+    def _coingecko(self, method, path, query, body):
+        if path == "/api/v3/ping":
+            return 200, {"gecko_says": "(V3) To the Moon!"}
+        if path == "/api/v3/simple/price":
+            ids = [i for i in query.get("ids", "").split(",") if i]
+            return 200, {
+                cid: {"usd": self.prices[COINGECKO_IDS[cid]]}
+                for cid in ids if COINGECKO_IDS.get(cid) in self.prices
+            }
+        return 404, {"error": f"no route {path}"}
+
+    def _solana(self, method, path, query, body):
+        try:
+            rpc = json.loads(body or b"{}")
+        except ValueError:
+            return 200, {"jsonrpc": "2.0", "error": {"code": -32700, "message": "Parse error"}, "id": None}
+        rpc_id = rpc.get("id")
+        params = rpc.get("params") or []
+        context = {"apiVersion": "2.0.18", "slot": self.slot}
+        name = rpc.get("method")
+        if name == "getBalance":
+            address = params[0] if params else ""
+            value = self.balances.get(address, self.default_lamports)
+            result = {"context": context, "value": value}
+        elif name == "getSlot":
+            result = self.slot
+        elif name == "getLatestBlockhash":
+            result = {"context": context,
+                      "value": {"blockhash": "SimBlockhash1111111111111111111111111111111",
+                                "lastValidBlockHeight": self.slot + 150}}
+        else:
+            return 200, {"jsonrpc": "2.0", "error": {"code": -32601, "message": "Method not found"}, "id": rpc_id}
+        return 200, {"jsonrpc": "2.0", "result": result, "id": rpc_id}
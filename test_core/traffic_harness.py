@@ -0,0 +1,298 @@
+"""
+Author: BubbaDiego
+Module: traffic_harness.py
+Description:
+    Record-and-replay for external API traffic (Jupiter, CoinGecko, Solana
+    JSON-RPC) that flows through the shared ``core.http_client`` client.
+
+    * ``record`` wraps the real sessions and appends every request and
+      response (status, headers, body, elapsed ms, offset from start) to
+      ``<directory>/traffic.jsonl``.
+    * ``replay`` serves those responses back with no network, in recorded
+      order per request, sleeping ``elapsed / speed`` so a slow production
+      cycle can be reproduced at its real shape or fast-forwarded.
+
+    Requests are matched on method, URL path, sorted query/params and JSON
+    body (JSON-RPC ``id`` ignored). Once a request's recordings run out the
+    last one is repeated, or :class:`ReplayMiss` is raised with ``strict``.
+
+Usage:
+    with TrafficHarness("test_core/fixtures/traffic/slow_cycle", mode="record"):
+        PositionSyncService(dl).update_jupiter_positions()
+
+    with TrafficHarness("test_core/fixtures/traffic/slow_cycle", mode="replay", speed=10):
+        PositionSyncService(dl).update_jupiter_positions()
+        MonitorService().fetch_prices()
+        WalletCore().load_wallets()
+
+    Clients that bypass ``core.http_client`` (solana-py's own transport,
+    web3) are not captured; without solana-py installed, Solana balances go
+    over the shared client and are.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from core.http_client import HttpClient, RequestException, get_http_client, set_http_client
+from core.logging import log
+from core.response_cache import get_response_cache
+
+TRAFFIC_FILE = "traffic.jsonl"
+KEPT_HEADERS = ("Content-Type", "Retry-After", "Cache-Control", "Age", "Date")
+
+
+class ReplayMiss(RequestException):
+    """No recorded response matches the request being replayed."""
+
+
+class ReplayHTTPError(RequestException):
+    def __init__(self, message, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+def request_key(method: str, url: str, params=None, json_body=None, data=None) -> str:
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if isinstance(params, dict):
+        query += [(str(k), str(v)) for k, v in params.items()]
+    elif params:
+        query += [(str(k), str(v)) for k, v in params]
+    body = json_body
+    if isinstance(body, dict) and "jsonrpc" in body:
+        body = {k: v for k, v in body.items() if k != "id"}
+    if body is None and data is not None:
+        body = data.decode("utf-8", "replace") if isinstance(data, bytes) else str(data)
+    return json.dumps(
+        [method.upper(), f"{parts.scheme}://{parts.netloc}{parts.path}", sorted(query), body],
+        sort_keys=True, default=str,
+    )
+
+
+class ReplayResponse:
+    """Just enough of ``requests.Response`` for Sonic's callers."""
+
+    def __init__(self, status_code: int, headers: dict, text: str, url: str = None):
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.url = url
+        self.ok = status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise ReplayHTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class Cassette:
+    """Recorded exchanges for one scenario, stored as JSON lines."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.path = self.directory / TRAFFIC_FILE
+        self.entries = []
+        self._lock = threading.Lock()
+
+    def load(self):
+        self.entries = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    self.entries.append(json.loads(line))
+        return self
+
+    def reset(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self.entries = []
+            open(self.path, "w", encoding="utf-8").close()
+        return self
+
+    def append(self, entry: dict):
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            self.entries.append(entry)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class RecordingSession:
+    """Wraps a real session and logs every exchange into a :class:`Cassette`."""
+
+    def __init__(self, inner, cassette: Cassette, started: float):
+        self.inner = inner
+        self.cassette = cassette
+        self.started = started
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    def _call(self, method: str, url: str, **kwargs):
+        offset = time.monotonic() - self.started
+        t0 = time.perf_counter()
+        entry = {
+            "key": request_key(method, url, kwargs.get("params"), kwargs.get("json"), kwargs.get("data")),
+            "method": method.upper(),
+            "url": url,
+            "params": kwargs.get("params"),
+            "json": kwargs.get("json"),
+            "offset_ms": round(offset * 1000, 3),
+        }
+        try:
+            response = getattr(self.inner, method.lower())(url, **kwargs)
+        except Exception as e:
+            entry.update(error=str(e) or e.__class__.__name__,
+                         elapsed_ms=round((time.perf_counter() - t0) * 1000, 3))
+            self.cassette.append(entry)
+            raise
+        headers = getattr(response, "headers", None) or {}
+        entry.update(
+            status=getattr(response, "status_code", 200),
+            headers={h: headers.get(h) for h in KEPT_HEADERS if headers.get(h) is not None},
+            body=getattr(response, "text", ""),
+            elapsed_ms=round((time.perf_counter() - t0) * 1000, 3),
+        )
+        self.cassette.append(entry)
+        return response
+
+    def get(self, url, **kwargs):
+        return self._call("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._call("POST", url, **kwargs)
+
+    def close(self):
+        closer = getattr(self.inner, "close", None)
+        if closer:
+            closer()
+
+
+class ReplaySession:
+    """Serves recorded exchanges; ``speed`` divides the recorded latency (0 = no wait)."""
+
+    def __init__(self, cassette: Cassette, speed: float = 1.0, strict: bool = False, sleep=time.sleep):
+        self.speed = speed
+        self.strict = strict
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._by_key = {}
+        self._cursor = {}
+        self.misses = 0
+        for entry in cassette.entries:
+            self._by_key.setdefault(entry["key"], []).append(entry)
+
+    def _next(self, key: str):
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                self.misses += 1
+                return None
+            index = self._cursor.get(key, 0)
+            if index >= len(recorded):
+                if self.strict:
+                    self.misses += 1
+                    return None
+                index = len(recorded) - 1
+            self._cursor[key] = index + 1
+            return recorded[index]
+
+    def _call(self, method: str, url: str, **kwargs):
+        key = request_key(method, url, kwargs.get("params"), kwargs.get("json"), kwargs.get("data"))
+        entry = self._next(key)
+        if entry is None:
+            raise ReplayMiss(f"No recorded response for {method.upper()} {url}")
+        if self.speed and entry.get("elapsed_ms"):
+            self.sleep(entry["elapsed_ms"] / 1000.0 / self.speed)
+        if "error" in entry:
+            raise RequestException(entry["error"])
+        return ReplayResponse(entry.get("status", 200), entry.get("headers"), entry.get("body", ""), url)
+
+    def get(self, url, **kwargs):
+        return self._call("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._call("POST", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+class TrafficHarness:
+    """
+    Context manager that installs a recording or replaying client as the
+    process-wide ``core.http_client`` client and restores the previous one
+    on exit.
+    """
+
+    MODES = ("record", "replay")
+
+    def __init__(self, directory, mode: str = "replay", speed: float = 1.0, strict: bool = False,
+                 session_factory=None, sleep=time.sleep):
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {self.MODES}")
+        self.cassette = Cassette(directory)
+        self.mode = mode
+        self.speed = speed
+        self.strict = strict
+        self.session_factory = session_factory
+        self.sleep = sleep
+        self.client = None
+        self._previous = None
+        self._replay = None
+
+    def start(self) -> HttpClient:
+        if self.mode == "record":
+            self.cassette.reset()
+            started = time.monotonic()
+            inner_factory = self.session_factory or HttpClient()._default_session
+            factory = lambda: RecordingSession(inner_factory(), self.cassette, started)
+            # Retries are part of the recorded shape; keep the live client's policy.
+            live = get_http_client()
+            self.client = HttpClient(timeout=live.timeout, retries=live.retries,
+                                     backoff_base=live.backoff_base, backoff_max=live.backoff_max,
+                                     session_factory=factory)
+        else:
+            self.cassette.load()
+            self._replay = ReplaySession(self.cassette, self.speed, self.strict, self.sleep)
+            # Recorded retries replay as separate exchanges, so retry waits are scaled too.
+            speed = self.speed or 0
+            self.client = HttpClient(
+                session_factory=lambda: self._replay,
+                sleep=(lambda s: self.sleep(s / speed)) if speed else (lambda s: None),
+                budgets=False,  # nothing reaches a provider, so there is no quota to pace
+            )
+        self._previous = set_http_client(self.client)
+        # Responses cached from other traffic must not mask the cassette.
+        get_response_cache().clear()
+        log.info(f"🎞️ Traffic harness {self.mode} → {self.cassette.directory}", source="TrafficHarness")
+        return self.client
+
+    def stop(self):
+        if self.client is None:
+            return
+        set_http_client(self._previous)
+        self.client.close()
+        self.client = None
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "entries": len(self.cassette.entries),
+            "misses": self._replay.misses if self._replay else 0,
+        }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -4,6 +4,8 @@ import types
 import logging
 import asyncio
 
+import pytest
+
 # Automatically fix sys.path for tests
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -92,3 +94,26 @@ def pytest_pyfunc_call(pyfuncitem):
             asyncio.run(test_func(**args))
             return True
 
+
+@pytest.fixture(autouse=True)
+def _fresh_circuit_breakers():
+    """Breakers are process-wide; start every test with none tripped."""
+    from core.circuit_breaker import reset_breakers
+    reset_breakers()
+    yield
+    reset_breakers()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_request_budgets():
+    """Request budgets, the response cache and the tick bus are process-wide too."""
+    from core.request_budget import reset_budgets
+    from core.response_cache import reset_response_cache
+    from core.tick_bus import reset_tick_bus
+    reset_budgets()
+    reset_response_cache()
+    reset_tick_bus()
+    yield
+    reset_budgets()
+    reset_response_cache()
+    reset_tick_bus()
@@ -0,0 +1,69 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from data.data_locker import DataLocker
+from monitor.adaptive_scheduler import ADAPTIVE_DEFAULTS, AdaptiveScheduler, choose_delay
+
+SETTINGS = dict(ADAPTIVE_DEFAULTS, floor_seconds=10, ceiling_seconds=640)
+
+
+def test_calm_market_and_safe_positions_wait_the_ceiling():
+    delay, reason = choose_delay(0.1, 60.0, SETTINGS)
+    assert delay == 640
+    assert reason["bound"] == "ceiling"
+
+
+def test_storm_or_near_liquidation_cycles_at_the_floor():
+    assert choose_delay(3.0, 60.0, SETTINGS)[1]["driver"] == "volatility"
+    delay, reason = choose_delay(0.1, 4.0, SETTINGS)
+    assert delay == 10
+    assert reason["driver"] == "liquidation" and reason["bound"] == "floor"
+
+
+def test_delay_scales_geometrically_between_thresholds():
+    halfway = (SETTINGS["calm_move_pct"] + SETTINGS["storm_move_pct"]) / 2
+    delay, reason = choose_delay(halfway, None, SETTINGS)
+    assert delay == pytest.approx(80.0)  # sqrt(10 * 640)
+    assert reason["candidates"] == {"volatility": 80.0}
+
+
+def test_relaxing_after_a_storm_is_step_limited():
+    delay, reason = choose_delay(0.1, None, SETTINGS, previous=10)
+    assert delay == 20
+    assert reason["bound"] == "step_limit"
+
+
+def test_no_data_falls_back_to_clamped_baseline():
+    assert choose_delay(None, None, SETTINGS, baseline=60)[0] == 60
+    delay, reason = choose_delay(None, None, SETTINGS, baseline=1)
+    assert delay == 10 and reason["driver"] == "baseline"
+
+
+def test_scheduler_reads_db_and_records_reason(tmp_path, monkeypatch):
+    dl = DataLocker(str(tmp_path / "sched.db"))
+    now = datetime.now()
+    dl.prices.insert_prices([
+        {"asset_type": "BTC", "current_price": 100.0, "last_update_time": (now - timedelta(minutes=5)).isoformat()},
+        {"asset_type": "BTC", "current_price": 101.0, "last_update_time": now.isoformat()},
+        {"asset_type": "SOL", "current_price": 10.0, "last_update_time": (now - timedelta(hours=2)).isoformat()},
+        {"asset_type": "SOL", "current_price": 20.0, "last_update_time": now.isoformat()},
+    ])
+    monkeypatch.setattr(dl.positions, "get_active_positions", lambda: [
+        {"id": "far", "current_price": 100.0, "liquidation_price": 50.0},
+        {"id": "near", "current_price": 100.0, "liquidation_price": 88.0},
+        {"id": "unpriced", "current_price": 0.0, "liquidation_price": 10.0},
+    ])
+
+    scheduler = AdaptiveScheduler(dl, settings=SETTINGS)
+    delay, reason = scheduler.next_delay(baseline=60)
+
+    assert reason["volatile_asset"] == "BTC"  # SOL's jump is outside the lookback window
+    assert reason["volatility_pct"] == pytest.approx(0.99, abs=0.01)
+    assert reason["closest_position_id"] == "near"
+    assert reason["driver"] == "liquidation"
+    assert 10 < delay < 640
+
+    entry = dl.ledger.get_last_entry("sonic_scheduler")
+    assert json.loads(entry["metadata"])["delay_seconds"] == round(delay, 1)
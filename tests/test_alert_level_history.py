@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+
+from data.data_locker import DataLocker
+from alert_core.alert_store import AlertStore
+from alert_core.alert_evaluation_service import AlertEvaluationService
+
+
+def _locker(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    return DataLocker(str(tmp_path / "history.db"))
+
+
+def _alert(alert_id):
+    return {
+        "id": alert_id,
+        "alert_type": "HeatIndex",
+        "alert_class": "Position",
+        "trigger_value": 30.0,
+        "condition": "ABOVE",
+        "notification_type": "SMS",
+        "level": "Normal",
+        "status": "Active",
+        "position_reference_id": "pos1",
+    }
+
+
+def test_level_history_written_only_on_change(tmp_path, monkeypatch):
+    dl = _locker(tmp_path, monkeypatch)
+    store = AlertStore(dl, lambda: {})
+    store.create_alert(_alert("a1"))
+    evaluator = AlertEvaluationService(threshold_service=None)
+    evaluator.inject_repo(store)
+
+    evaluator.update_alert_level("a1", "Normal", 10.0)
+    evaluator.update_alert_level("a1", "High", 95.0)
+    evaluator.update_alert_level("a1", "High", 96.0)
+    evaluator.update_alert_level("a1", "Low", 40.0)
+
+    history = dl.alert_history.get_history("a1")
+    assert [(h["previous_level"], h["level"]) for h in history] == [
+        ("Normal", "High"),
+        ("High", "Low"),
+    ]
+    assert history[0]["evaluated_value"] == 95.0
+    dl.db.close()
+
+
+def test_history_range_query_and_prune(tmp_path, monkeypatch):
+    dl = _locker(tmp_path, monkeypatch)
+    hist = dl.alert_history
+    now = datetime.now(timezone.utc)
+    old = (now - timedelta(days=90)).isoformat()
+    hist.record_transition("a1", "Normal", "High", timestamp=old)
+    for i in range(5):
+        ts = (now - timedelta(minutes=10 - i)).isoformat()
+        hist.record_transition("a1", "Low", "High", evaluated_value=i, timestamp=ts)
+    hist.record_transition("a2", "Normal", "Low", timestamp=now.isoformat())
+
+    since = (now - timedelta(minutes=8)).isoformat()
+    window = hist.get_history("a1", since=since)
+    assert [h["evaluated_value"] for h in window] == [2, 3, 4]
+    assert hist.get_recent_transitions(limit=1)[0]["alert_id"] == "a2"
+
+    removed = hist.prune(max_age_days=30, max_rows_per_alert=3)
+    assert removed == 3
+    remaining = hist.get_history("a1")
+    assert [h["evaluated_value"] for h in remaining] == [2, 3, 4]
+    assert len(hist.get_history("a2")) == 1
+    dl.db.close()
+
+
+def test_timestamps_are_naive_local_and_aware_input_is_converted(tmp_path, monkeypatch):
+    dl = _locker(tmp_path, monkeypatch)
+    hist = dl.alert_history
+    hist.record_transition("a1", "Normal", "High")
+    utc_now = datetime.now(timezone.utc)
+    hist.record_transition("a1", "High", "Low", timestamp=(utc_now + timedelta(minutes=5)).isoformat())
+
+    stamps = [h["timestamp"] for h in hist.get_history("a1")]
+    assert all(datetime.fromisoformat(ts).tzinfo is None for ts in stamps)
+    assert abs(datetime.fromisoformat(stamps[0]) - datetime.now()) < timedelta(minutes=1)
+
+    # An aware ``since`` (as from /alerts/history?since=) selects by the same instant.
+    since = (utc_now + timedelta(minutes=1)).isoformat()
+    assert [h["level"] for h in hist.get_recent_transitions(since=since)] == ["Low"]
+
+    # Rows stored with a UTC offset are rewritten when the table is opened.
+    cursor = dl.db.get_cursor()
+    cursor.execute("UPDATE alert_level_history SET timestamp = ? WHERE level = 'High'",
+                   ((utc_now - timedelta(days=40)).isoformat(),))
+    dl.db.commit()
+    hist.ensure_table()
+    assert hist.prune(max_age_days=30) == 1
+    assert [h["level"] for h in hist.get_history("a1")] == ["Low"]
+    dl.db.close()
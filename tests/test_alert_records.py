@@ -0,0 +1,56 @@
+import pytest
+from data.data_locker import DataLocker
+from data.alert import AlertRecord
+from alert_core.alert_store import AlertStore
+
+
+def _store(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    dl = DataLocker(str(tmp_path / "records.db"))
+    return dl, AlertStore(dl, lambda: {})
+
+
+def _alert(alert_id, status="Active", level="Normal"):
+    return {
+        "id": alert_id,
+        "alert_type": "HeatIndex",
+        "alert_class": "Position",
+        "trigger_value": 30.0,
+        "condition": "ABOVE",
+        "notification_type": "SMS",
+        "level": level,
+        "status": status,
+        "position_reference_id": "pos1",
+    }
+
+
+def test_get_active_alerts_filters_in_sql(tmp_path, monkeypatch):
+    dl, store = _store(tmp_path, monkeypatch)
+    store.create_alert(_alert("a1"))
+    store.create_alert(_alert("a2", status="Inactive"))
+    store.create_alert(_alert("a3", level="high"))
+
+    alerts = store.get_active_alerts()
+
+    assert {a.id for a in alerts} == {"a1", "a3"}
+    assert all(isinstance(a, AlertRecord) for a in alerts)
+    levels = {a.id: a.level for a in alerts}
+    assert levels["a3"] == "High"
+    dl.db.close()
+
+
+def test_alert_record_is_slotted(tmp_path, monkeypatch):
+    dl, store = _store(tmp_path, monkeypatch)
+    store.create_alert(_alert("a1"))
+
+    record = store.get_active_alerts()[0]
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.unknown_field = 1
+
+    assert record.starting_value == record.trigger_value
+    assert record.id == "a1"
+    assert record.alert_type == "HeatIndex"
+    dl.db.close()
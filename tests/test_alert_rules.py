@@ -0,0 +1,97 @@
+import types
+
+import pytest
+
+from alert_core.alert_rules import RuleCompiler, RuleSyntaxError, AlertRuleService
+from data.data_locker import DataLocker
+
+
+def test_compile_and_evaluate_expression():
+    compiler = RuleCompiler()
+    rule = compiler.compile("travel_percent < -40 and heat_index > 50")
+
+    assert rule({"travel_percent": -45, "heat_index": 60})
+    assert not rule({"travel_percent": -45, "heat_index": 10})
+    assert not rule({"travel_percent": None, "heat_index": 60})
+    assert rule.fields == {"travel_percent", "heat_index"}
+
+
+def test_rules_are_cached_by_hash():
+    compiler = RuleCompiler()
+    first = compiler.compile("heat_index > 50")
+    second = compiler.compile("heat_index   >  50")
+    assert first is second
+    assert len(compiler) == 1
+
+
+def test_namespaces_functions_and_chained_compare():
+    rule = RuleCompiler().compile(
+        "abs(travel_percent) > 10 and portfolio.total_value > 1000 and 0 < leverage <= 5"
+    )
+    ctx = {"travel_percent": -20, "leverage": 3, "portfolio": {"total_value": 5000}}
+    assert rule(ctx)
+    ctx["leverage"] = 8
+    assert not rule(ctx)
+
+
+@pytest.mark.parametrize("expr", [
+    "__import__('os').system('echo hi')",
+    "heat_index.__class__",
+    "[x for x in range(3)]",
+    "lambda: 1",
+    "heat_index if 1 else 2",
+    "portfolio",
+    "heat_index >",
+])
+def test_unsafe_or_invalid_expressions_rejected(expr):
+    with pytest.raises(RuleSyntaxError):
+        RuleCompiler().compile(expr)
+
+
+def test_rule_service_batch_hits():
+    positions = [
+        {"id": "p1", "asset_type": "BTC", "travel_percent": -50, "heat_index": 70},
+        {"id": "p2", "asset_type": "ETH", "travel_percent": -10, "heat_index": 70},
+        {"id": "p3", "asset_type": "BTC", "travel_percent": -5, "heat_index": 5},
+    ]
+    rules = [
+        {"id": "r1", "name": "deep", "expression": "travel_percent < -40 and heat_index > 50", "level": "High"},
+        {"id": "r2", "expression": "price > 60000"},
+        {"id": "r3", "expression": "heat_index >>> 1"},
+        {"id": "r4", "expression": "heat_index > 0", "enabled": False},
+    ]
+    svc = AlertRuleService(data_locker=None)
+
+    hits = svc.evaluate(positions, portfolio={}, prices={"BTC": 65000, "ETH": 3000}, rules=rules)
+
+    pairs = sorted((h["rule_id"], h["position_id"]) for h in hits)
+    assert pairs == [("r1", "p1"), ("r2", "p1"), ("r2", "p3")]
+
+
+@pytest.mark.parametrize("expr", ["'a' * 1000000000 == ''", "asset_type * 1000000000 == ''", "'a' + 'b' == 'ab'"])
+def test_arithmetic_is_numeric_only(expr):
+    rule = RuleCompiler().compile(expr)
+    assert not rule({"asset_type": "BTC"})
+    assert RuleCompiler().compile("leverage * 2 > 5")({"leverage": 3})
+
+
+def test_rule_service_run_records_level_changes(tmp_path):
+    dl = DataLocker(str(tmp_path / "rules.db"))
+    dl.system.set_var("alert_rules", [
+        {"id": "r1", "expression": "price > 60000", "level": "medium"},
+    ])
+    position = {"id": "p1", "asset_type": "BTC"}
+    dl.positions = types.SimpleNamespace(
+        get_active_positions=lambda: [position], get_portfolio_totals=dict
+    )
+    dl.prices = types.SimpleNamespace(get_latest_prices=lambda: {"BTC": {"current_price": 65000}})
+    svc = AlertRuleService(dl)
+
+    assert [h["level"] for h in svc.run()] == ["Medium"]
+    svc.run()  # still matching: no new transition
+    dl.prices = types.SimpleNamespace(get_latest_prices=lambda: {"BTC": {"current_price": 50000}})
+    assert svc.run() == []
+
+    history = dl.alert_history.get_history("rule:r1:p1")
+    assert [(h["previous_level"], h["level"]) for h in history] == [(None, "Medium"), ("Medium", "Normal")]
+    assert dl.alert_history.get_latest_levels("rule:") == {"rule:r1:p1": "Normal"}
@@ -0,0 +1,103 @@
+import types
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from core.asset_registry import AssetRegistry, get_asset_registry, set_asset_registry
+from core.http_client import HttpClient, set_http_client
+from core.request_budget import configure_budget
+from data.data_locker import DataLocker
+from monitor.monitor_service import MonitorService
+from prices.price_sources import CoinGeckoSource, JupiterPriceSource, PriceAggregator
+
+
+@pytest.fixture
+def big_registry():
+    assets = [{"symbol": f"T{i}", "coingecko_id": f"token-{i}", "jupiter_mint": f"Mint{i}"} for i in range(250)]
+    assets.append({"symbol": "CGONLY", "coingecko_id": "cg-only"})
+    previous = set_asset_registry(AssetRegistry(assets))
+    yield get_asset_registry()
+    set_asset_registry(previous)
+
+
+class PriceUpstream:
+    """Answers CoinGecko simple/price and Jupiter price/v2 for any ids."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        params = dict(params or {})
+        for key, values in parse_qs(urlsplit(url).query).items():
+            params.setdefault(key, values[0])
+        ids = params["ids"].split(",")
+        self.requests.append((urlsplit(url).netloc, ids))
+        if "cg.test" in url:
+            body = {cid: {"usd": float(len(cid))} for cid in ids}
+        else:
+            body = {"data": {mint: {"price": float(len(mint))} for mint in ids}}
+        return types.SimpleNamespace(status_code=200, headers={}, json=lambda: body, raise_for_status=lambda: None)
+
+
+@pytest.fixture
+def upstream():
+    configure_budget("coingecko", limit=1000, window=1.0)
+    configure_budget("jupiter_price", limit=1000, window=1.0)
+    fake = PriceUpstream()
+    previous = set_http_client(HttpClient(session_factory=lambda: fake, sleep=lambda s: None))
+    yield fake
+    set_http_client(previous)
+
+
+def test_default_config_keeps_sp500_unpriced():
+    registry = AssetRegistry.load()
+    assert registry.symbols() == ["BTC", "ETH", "SOL", "SP500"]
+    assert "SP500" not in registry.priced_symbols()
+    assert registry.asset_for_mint("So11111111111111111111111111111111111111112") == "SOL"
+    assert registry.coingecko_ids(["btc"]) == {"bitcoin": "BTC"}
+
+
+def test_missing_config_falls_back_to_defaults(tmp_path):
+    registry = AssetRegistry.load(tmp_path / "nope.json")
+    assert registry.priced_symbols() == ["BTC", "ETH", "SOL"]
+
+
+def test_hundreds_of_assets_cost_a_few_chunked_requests(big_registry, upstream):
+    source = CoinGeckoSource(api_base="http://cg.test/api/v3")
+    prices, _ = source.fetch(big_registry.priced_symbols())
+
+    assert len(prices) == 251
+    assert [len(ids) for _, ids in upstream.requests] == [100, 100, 51]
+
+
+def test_asset_listed_by_one_source_does_not_degrade_quorum(big_registry, upstream):
+    sources = [
+        CoinGeckoSource(api_base="http://cg.test/api/v3"),
+        JupiterPriceSource(api_base="http://jup.test/price/v2", max_batch=200),
+    ]
+    prices, report = PriceAggregator(sources, quorum=2, deadline=2.0).fetch(big_registry.priced_symbols())
+
+    assert len(prices) == 251 and "CGONLY" in prices
+    assert report["degraded"] is False
+    assert len(upstream.requests) == 3 + 2
+
+
+def test_monitor_service_prices_the_registry(big_registry, upstream):
+    service = MonitorService(api_base="http://cg.test/api/v3", sources=["coingecko"])
+    assert len(service.fetch_prices()) == 251
+
+
+def test_bulk_price_write_and_latest_read(tmp_path, monkeypatch):
+    dl = DataLocker(str(tmp_path / "prices.db"))
+    commits = []
+    original_commit = dl.db.commit
+    monkeypatch.setattr(dl.db, "commit", lambda: (commits.append(1), original_commit())[1])
+
+    assert dl.insert_or_update_prices({"BTC": 100.0, "ETH": 10.0, "SOL": 1.0}, source="t") == 3
+    assert len(commits) == 1
+    dl.prices.insert_prices([{"asset_type": "BTC", "current_price": 101.0, "last_update_time": "2999-01-01T00:00:00"}])
+
+    latest = dl.get_latest_prices(["BTC", "SOL", "DOGE"])
+    assert set(latest) == {"BTC", "SOL"}
+    assert latest["BTC"]["current_price"] == 101.0
+    assert set(dl.get_latest_prices()) == {"BTC", "ETH", "SOL"}
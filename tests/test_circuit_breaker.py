@@ -0,0 +1,90 @@
+import types
+
+import pytest
+
+from core.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, breaker_snapshot,
+    configure_breakers, get_breaker,
+)
+from core.http_client import HttpClient, RequestException
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_state_machine_open_half_open_closed():
+    clock = Clock()
+    breaker = CircuitBreaker("dep", failure_threshold=2, cooldown=10, clock=clock)
+
+    breaker.record_failure("boom")
+    assert breaker.state == CLOSED
+    breaker.record_failure("boom")
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    clock.now += 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # only one trial at a time
+    breaker.record_failure("still down")
+    assert breaker.state == OPEN
+
+    clock.now += 10
+    assert breaker.call(lambda: "ok") == "ok"
+    snap = breaker.snapshot()
+    assert snap["state"] == CLOSED and snap["trips"] == 2 and snap["rejected"] == 2
+
+
+def test_http_client_fails_fast_once_breaker_opens():
+    calls = {"n": 0}
+
+    def failing_get(url, **kwargs):
+        calls["n"] += 1
+        raise RequestException("connection refused")
+
+    sleeps = []
+    client = HttpClient(retries=1, session_factory=lambda: types.SimpleNamespace(get=failing_get),
+                        sleep=sleeps.append)
+    configure_breakers({"flaky": {"failure_threshold": 2, "cooldown": 60}})
+
+    for _ in range(2):
+        with pytest.raises(RequestException):
+            client.get("http://flaky.test/x", breaker="flaky")
+    assert calls["n"] == 4
+
+    with pytest.raises(CircuitOpenError):
+        client.get("http://flaky.test/x", breaker="flaky")
+    assert calls["n"] == 4
+    assert len(sleeps) == 2
+
+    snap = breaker_snapshot()["flaky"]
+    assert snap["state"] == OPEN
+    assert snap["last_error"] == "connection refused"
+
+
+def test_server_errors_count_but_client_errors_do_not():
+    responses = iter([types.SimpleNamespace(status_code=404), types.SimpleNamespace(status_code=503)])
+    client = HttpClient(retries=0, session_factory=lambda: types.SimpleNamespace(get=lambda url, **k: next(responses)))
+    configure_breakers({"api": {"failure_threshold": 1}})
+
+    client.get("http://api.test/a", breaker="api")
+    assert get_breaker("api").state == CLOSED
+    client.get("http://api.test/b", breaker="api")
+    assert get_breaker("api").state == OPEN
+
+
+def test_smtp_transport_skips_send_while_open():
+    from xcom.smtp_transport import SMTPTransport
+
+    configure_breakers({"smtp": {"failure_threshold": 1, "cooldown": 60}})
+    transport = SMTPTransport("127.0.0.1", 1, timeout=0.2)
+    assert transport.send_many(["msg"]) == 0
+    assert get_breaker("smtp").state == OPEN
+    transport._connect = lambda: pytest.fail("should not connect while open")
+    assert transport.send_many(["msg"]) == 0
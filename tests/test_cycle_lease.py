@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core.cancellation import check_cancelled
+from cyclone.cyclone_engine import CYCLE_LEASE_NAME, SKIP, Cyclone
+from data.data_locker import DataLocker
+from data.database import DatabaseManager
+from data.dl_cycle_lease import DLCycleLeaseManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _manager(path, clock):
+    return DLCycleLeaseManager(DatabaseManager(str(path)), clock=clock)
+
+
+def test_lease_is_exclusive_across_connections(tmp_path, clock):
+    app, monitor = _manager(tmp_path / "l.db", clock), _manager(tmp_path / "l.db", clock)
+
+    lease = app.acquire("cycle", "sonic_app", ttl=30)
+    assert lease.token == 1
+    assert monitor.acquire("cycle", "sonic_monitor", ttl=30) is None
+
+    assert app.release(lease, {"market_updates": {"status": "ok"}})
+    assert monitor.acquire("cycle", "sonic_monitor", ttl=30).token == 2
+
+
+def test_expired_lease_is_fenced_off(tmp_path, clock):
+    app, monitor = _manager(tmp_path / "l.db", clock), _manager(tmp_path / "l.db", clock)
+    stale = app.acquire("cycle", "sonic_app", ttl=30)
+
+    clock.now += 10
+    stale = app.renew(stale, ttl=30)
+    clock.now += 25
+    assert monitor.acquire("cycle", "sonic_monitor", ttl=30) is None  # renewal moved the expiry
+
+    clock.now += 6
+    fresh = monitor.acquire("cycle", "sonic_monitor", ttl=30)
+    assert fresh.token == stale.token + 1
+    assert not app.holds(stale) and monitor.holds(fresh)
+    assert app.renew(stale, ttl=30) is None
+    assert not app.release(stale, {"late": True})
+    assert monitor.current("cycle")["holder"] == fresh.holder
+
+
+def test_waiter_receives_holders_result(tmp_path, clock):
+    leases = _manager(tmp_path / "l.db", clock)
+    lease = leases.acquire("cycle", "sonic_monitor", ttl=30)
+    threading.Timer(0.05, leases.release, args=(lease, {"evaluate_alerts": {"status": "ok"}})).start()
+
+    assert leases.wait_for_release("cycle", lease.token, timeout=2, poll=0.01) == (
+        True, {"evaluate_alerts": {"status": "ok"}}
+    )
+
+
+@pytest.fixture
+def cyclone(tmp_path):
+    engine = Cyclone(poll_interval=1, step_policies={})
+    engine.data_locker = DataLocker(str(tmp_path / "cyclone.db"))
+    return engine
+
+
+def test_busy_cycle_is_skipped_or_joined(cyclone, monkeypatch):
+    ran = []
+    monkeypatch.setattr(cyclone, "run_cleanse_ids", lambda: asyncio.sleep(0, ran.append("cleanse")))
+    leases = cyclone.data_locker.leases
+    other = leases.acquire(CYCLE_LEASE_NAME, "sonic_monitor@host:1", ttl=30)
+
+    assert asyncio.run(cyclone.run_exclusive_cycle(["cleanse_ids"], owner="sonic_app", on_busy=SKIP)) is None
+    assert cyclone.data_locker.ledger.get_last_entry("cyclone")["status"] == "Skipped"
+
+    threading.Timer(0.05, leases.release, args=(other, {"cleanse_ids": {"status": "ok"}})).start()
+    result = asyncio.run(cyclone.run_exclusive_cycle(["cleanse_ids"], owner="sonic_app"))
+    assert result == {"cleanse_ids": {"status": "ok"}}
+    assert ran == []  # the other process's cycle served both callers
+
+    outcomes = asyncio.run(cyclone.run_exclusive_cycle(["cleanse_ids"], owner="sonic_app"))
+    assert outcomes["cleanse_ids"]["status"] == "ok" and ran == ["cleanse"]
+    assert leases.current(CYCLE_LEASE_NAME)["holder"] is None
+
+
+def test_taken_over_holder_stops_at_next_step(cyclone, monkeypatch):
+    ran = []
+    leases = cyclone.data_locker.leases
+
+    async def take_over():
+        # Our lease "expires" and another process takes the cycle over.
+        row = leases.current(CYCLE_LEASE_NAME)
+        cursor = cyclone.data_locker.db.get_cursor()
+        cursor.execute("UPDATE cycle_leases SET holder = 'other', token = ? WHERE name = ?",
+                       (row["token"] + 1, CYCLE_LEASE_NAME))
+        cyclone.data_locker.db.commit()
+        ran.append("market")
+
+    monkeypatch.setattr(cyclone, "run_market_updates", take_over)
+    monkeypatch.setattr(cyclone, "run_cleanse_ids", lambda: asyncio.sleep(0, ran.append("cleanse")))
+
+    outcomes = asyncio.run(cyclone.run_exclusive_cycle(["market_updates", "cleanse_ids"], owner="sonic_app"))
+    assert outcomes["cleanse_ids"]["status"] == "fenced"
+    assert ran == ["market"]
+    assert leases.current(CYCLE_LEASE_NAME)["holder"] == "other"
+
+
+def test_takeover_during_step_cancels_it(cyclone, monkeypatch):
+    ran, wrote = [], []
+    leases = cyclone.data_locker.leases
+
+    def reconcile():
+        for _ in range(200):
+            check_cancelled()  # a writer's cancellation point before each write
+            wrote.append(1)
+            time.sleep(0.01)
+
+    async def long_step():
+        row = leases.current(CYCLE_LEASE_NAME)
+        cursor = cyclone.data_locker.db.get_cursor()
+        cursor.execute("UPDATE cycle_leases SET holder = 'other', token = ? WHERE name = ?",
+                       (row["token"] + 1, CYCLE_LEASE_NAME))
+        cyclone.data_locker.db.commit()
+        await asyncio.to_thread(reconcile)
+
+    monkeypatch.setattr(cyclone, "run_check_jupiter_for_updates", long_step)
+    monkeypatch.setattr(cyclone, "run_cleanse_ids", lambda: asyncio.sleep(0, ran.append("cleanse")))
+
+    started = time.monotonic()
+    outcomes = asyncio.run(cyclone.run_exclusive_cycle(
+        ["check_jupiter_for_updates", "cleanse_ids"], owner="sonic_app", ttl=0.3))
+
+    assert time.monotonic() - started < 1
+    assert outcomes == {"check_jupiter_for_updates": {"status": "fenced", "token": 1}}
+    assert 0 < len(wrote) < 200 and ran == []
+
+
+def test_lease_writes_do_not_commit_the_lockers_transaction(tmp_path):
+    dl = DataLocker(str(tmp_path / "cyclone.db"))
+    cursor = dl.db.get_cursor()
+    cursor.execute("CREATE TABLE reconcile_probe (v INTEGER)")
+    dl.db.commit()
+    assert dl.leases.db is not dl.db
+
+    cursor.execute("INSERT INTO reconcile_probe VALUES (1)")  # a step mid-transaction
+    acquired = []
+    renewer = threading.Thread(target=lambda: acquired.append(
+        dl.leases.acquire(CYCLE_LEASE_NAME, "sonic_app", ttl=30)))
+    renewer.start()
+    time.sleep(0.1)
+    dl.db.conn.rollback()  # the step fails and rolls back
+    renewer.join(5)
+
+    assert acquired[0] is not None
+    assert cursor.execute("SELECT COUNT(*) FROM reconcile_probe").fetchone()[0] == 0
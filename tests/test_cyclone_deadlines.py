@@ -0,0 +1,106 @@
+import asyncio
+import json
+import threading
+import time
+import types
+
+import pytest
+
+from core.cancellation import CancelToken, StepCancelled, cancel_scope, check_cancelled
+from core.http_client import HttpClient
+from cyclone.cyclone_engine import ABORT, SKIP_DEPENDENTS, Cyclone
+from data.data_locker import DataLocker
+
+
+def _policies(**steps):
+    return {name: {"deadline_seconds": 5, **policy} for name, policy in steps.items()}
+
+
+@pytest.fixture
+def cyclone(tmp_path):
+    engine = Cyclone(poll_interval=1, step_policies={})
+    engine.data_locker = DataLocker(str(tmp_path / "cyclone.db"))
+    return engine
+
+
+def _hung_step(stopped: threading.Event):
+    """A step whose thread spins until its cancel token fires."""
+    def work():
+        try:
+            while True:
+                check_cancelled()
+                time.sleep(0.01)
+        except StepCancelled:
+            stopped.set()
+
+    async def step():
+        await asyncio.to_thread(work)
+    return step
+
+
+def test_token_crosses_to_thread_boundary():
+    token = CancelToken("step")
+
+    async def main():
+        with cancel_scope(token):
+            token.cancel()
+            await asyncio.to_thread(check_cancelled)
+
+    with pytest.raises(StepCancelled):
+        asyncio.run(main())
+    check_cancelled()  # no token outside the scope
+
+
+def test_http_client_stops_retrying_for_cancelled_step():
+    calls = []
+    client = HttpClient(retries=3, sleep=lambda s: None,
+                        session_factory=lambda: types.SimpleNamespace(get=lambda url, **kw: calls.append(kw)))
+    token = CancelToken("market_updates", deadline=time.monotonic() + 5)
+    with cancel_scope(token):
+        client.get("https://api.example/price")
+        assert calls[0]["timeout"][1] <= 5
+        token.cancel()
+        with pytest.raises(StepCancelled):
+            client.get("https://api.example/price")
+    assert len(calls) == 1
+
+
+def test_hung_step_times_out_and_cycle_continues(cyclone, monkeypatch):
+    stopped = threading.Event()
+    ran = []
+    monkeypatch.setattr(cyclone, "run_market_updates", _hung_step(stopped))
+    monkeypatch.setattr(cyclone, "run_cleanse_ids", lambda: asyncio.sleep(0, ran.append("cleanse")))
+    cyclone.step_policies = _policies(market_updates={"deadline_seconds": 0.2})
+
+    started = time.monotonic()
+    outcomes = asyncio.run(cyclone.run_cycle(["market_updates", "cleanse_ids"]))
+
+    assert time.monotonic() - started < 2
+    assert outcomes["market_updates"]["status"] == "timeout"
+    assert outcomes["cleanse_ids"]["status"] == "ok" and ran == ["cleanse"]
+    assert stopped.wait(1)  # the worker thread noticed and stopped
+
+    entry = cyclone.data_locker.ledger.get_last_entry("cyclone")
+    assert entry["status"] == "Timeout"
+    assert json.loads(entry["metadata"])["step"] == "market_updates"
+
+
+def test_timeout_policy_skips_dependents_or_aborts(cyclone, monkeypatch):
+    ran = []
+    for name in ("run_update_evaluated_value", "run_alert_evaluation", "run_cleanse_ids"):
+        monkeypatch.setattr(cyclone, name, lambda name=name: asyncio.sleep(0, ran.append(name)))
+    monkeypatch.setattr(cyclone, "run_alert_enrichment", lambda: asyncio.sleep(5))
+    steps = ["enrich_alerts", "update_evaluated_value", "evaluate_alerts", "cleanse_ids"]
+
+    cyclone.step_policies = _policies(enrich_alerts={
+        "deadline_seconds": 0.05, "on_timeout": SKIP_DEPENDENTS,
+        "dependents": ["update_evaluated_value", "evaluate_alerts"],
+    })
+    outcomes = asyncio.run(cyclone.run_cycle(steps))
+    assert outcomes["update_evaluated_value"] == {"status": "skipped", "after": "enrich_alerts"}
+    assert ran == ["run_cleanse_ids"]
+
+    ran.clear()
+    cyclone.step_policies = _policies(enrich_alerts={"deadline_seconds": 0.05, "on_timeout": ABORT})
+    outcomes = asyncio.run(cyclone.run_cycle(steps))
+    assert list(outcomes) == ["enrich_alerts"] and ran == []
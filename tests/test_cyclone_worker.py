@@ -0,0 +1,64 @@
+import asyncio
+import threading
+
+import pytest
+
+from cyclone.cyclone_worker import DONE, FAILED, CycloneWorker
+
+
+@pytest.fixture
+def worker():
+    w = CycloneWorker().start()
+    yield w
+    w.stop()
+
+
+def test_jobs_run_one_at_a_time_on_one_loop(worker):
+    seen = []
+    active = []
+
+    async def cycle(n):
+        active.append(n)
+        assert len(active) == 1
+        await asyncio.sleep(0.01)
+        seen.append((n, id(asyncio.get_running_loop()), threading.current_thread().name))
+        active.remove(n)
+        return n
+
+    jobs = [worker.submit(f"cycle-{n}", lambda n=n: cycle(n)) for n in range(3)]
+    results = [worker.wait(job.id, timeout=2) for job in jobs]
+
+    assert [r["result"] for r in results] == [0, 1, 2]
+    assert {loop for _, loop, _ in seen} == {seen[0][1]}
+    assert {name for _, _, name in seen} == {"cyclone-worker"}
+
+
+def test_identical_queued_jobs_are_coalesced(worker):
+    gate = threading.Event()
+    runs = []
+    worker.submit("blocker", gate.wait)
+
+    first = worker.submit("FullCycle", lambda: runs.append("cycle"))
+    second = worker.submit("FullCycle", lambda: runs.append("cycle"))
+    assert second is first and first.coalesced == 1
+
+    gate.set()
+    assert worker.wait(first.id, timeout=2)["status"] == DONE
+    assert runs == ["cycle"]
+
+    # Once the job has started, a new request queues a fresh run.
+    assert worker.submit("FullCycle", lambda: runs.append("cycle")).id != first.id
+
+
+def test_failed_job_reports_error_and_worker_keeps_going(worker):
+    async def boom():
+        raise RuntimeError("jupiter down")
+
+    failed = worker.submit("MarketUpdate", boom)
+    ok = worker.submit("ClearAlerts", lambda: {"cleared": 3})
+
+    assert worker.wait(failed.id, timeout=2)["error"] == "jupiter down"
+    assert worker.get(failed.id)["status"] == FAILED
+    assert worker.wait(ok.id, timeout=2)["result"] == {"cleared": 3}
+    assert [job["id"] for job in worker.jobs()] == [ok.id, failed.id]
+    assert worker.get("missing") is None
@@ -5,8 +5,9 @@ from alert_core.alert_enrichment_service import AlertEnrichmentService
 from data.alert import Alert, AlertType, Condition
 
 
-def test_enrich_portfolio_sets_default_value():
+def test_enrich_portfolio_reads_cached_totals():
     locker = MagicMock()
+    locker.positions.get_portfolio_totals.return_value = {"total_value": 1234.5}
     service = AlertEnrichmentService(locker)
     alert = Alert(
         id="port1",
@@ -22,6 +23,6 @@ def test_enrich_portfolio_sets_default_value():
 
     enriched = asyncio.run(service._enrich_portfolio(alert))
 
-    assert enriched.evaluated_value == 0.0
-    original["evaluated_value"] = 0.0
+    assert enriched.evaluated_value == 1234.5
+    original["evaluated_value"] = 1234.5
     assert enriched.dict() == original
@@ -0,0 +1,89 @@
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from test_core.fake_services import FakeServiceSuite
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url, timeout=5) as resp:
+            return resp.status, dict(resp.headers), json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), json.loads(e.read())
+
+
+def _rpc(url, method, params=None):
+    req = urllib.request.Request(
+        url, data=json.dumps({"jsonrpc": "2.0", "id": 7, "method": method, "params": params or []}).encode(),
+        headers={"Content-Type": "application/json"}, method="POST",
+    )
+    with urllib.request.urlopen(req, timeout=5) as resp:
+        return json.loads(resp.read())
+
+
+def test_serves_recorded_and_synthetic_payloads():
+    with FakeServiceSuite(wallets=3, positions_per_wallet=4, seed=1) as fake:
+        status, _, body = _get(f"{fake.jupiter_base}/v1/positions?walletAddress=unknown")
+        assert status == 200
+        assert body["dataList"][0]["positionPubkey"].startswith("5ZpN3")
+
+        wallet = fake.wallets[1]
+        _, _, body = _get(f"{fake.jupiter_base}/v1/positions?walletAddress={wallet['public_address']}")
+        assert len(body["dataList"]) == 4
+        assert {p["owner"] for p in body["dataList"]} == {wallet["public_address"]}
+
+        _, _, prices = _get(f"{fake.coingecko_base}/simple/price?ids=bitcoin,solana&vs_currencies=usd")
+        assert set(prices) == {"bitcoin", "solana"}
+
+        reply = _rpc(fake.solana_rpc_url, "getBalance", [wallet["public_address"]])
+        assert reply["id"] == 7
+        assert reply["result"]["value"] == fake.balances[wallet["public_address"]]
+        assert "error" in _rpc(fake.solana_rpc_url, "sendTransaction")
+        assert fake.hits == {"jupiter": 2, "coingecko": 1, "solana": 2}
+
+
+def test_injects_latency_errors_and_rate_limits():
+    with FakeServiceSuite(seed=2) as fake:
+        fake.set_faults("coingecko", latency=0.15)
+        start = time.perf_counter()
+        _get(f"{fake.coingecko_base}/ping")
+        assert time.perf_counter() - start >= 0.15
+
+        fake.set_faults("jupiter", rate_limit_rate=1.0, retry_after=3)
+        status, headers, _ = _get(f"{fake.jupiter_base}/v1/positions?walletAddress=x")
+        assert status == 429
+        assert headers["Retry-After"] == "3"
+
+        fake.set_faults("jupiter", rate_limit_rate=0.0, error_rate=1.0, error_status=503)
+        status, _, _ = _get(f"{fake.jupiter_base}/v1/positions?walletAddress=x")
+        assert status == 503
+        assert fake.injected == {"errors": 1, "rate_limited": 1}
+
+        with pytest.raises(ValueError):
+            fake.set_faults(bogus=1)
+
+
+def test_position_sync_runs_against_fake_jupiter(tmp_path, monkeypatch):
+    from core import http_client
+    if http_client.requests is None:
+        pytest.skip("requests is not installed")
+    from data.data_locker import DataLocker
+    import positions.position_sync_service as svc
+
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    monkeypatch.setattr(svc.PositionEnrichmentService, "enrich", lambda self, p: p)
+
+    with FakeServiceSuite(wallets=5, positions_per_wallet=3, seed=3) as fake:
+        dl = DataLocker(str(tmp_path / "fake.db"))
+        for wallet in fake.wallets:
+            dl.create_wallet(wallet)
+        result = svc.PositionSyncService(dl, api_base=fake.jupiter_base).update_jupiter_positions()
+        assert result["imported"] == 15
+        assert result["failed_wallets"] == {}
+        dl.db.close()
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import pytest
+
+from core.http_client import HttpClient, RequestException
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        item = self.responses.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+def _resp(status=200, headers=None):
+    return SimpleNamespace(status_code=status, headers=headers or {})
+
+
+def _client(sessions, sleeps):
+    made = iter(sessions)
+    return HttpClient(session_factory=lambda: next(made), sleep=sleeps.append,
+                      backoff_base=0.5, backoff_max=4.0)
+
+
+def test_one_session_per_host_is_reused():
+    a, b = FakeSession([_resp()] * 3), FakeSession([_resp()])
+    client = _client([a, b], [])
+    client.get("https://api.example.com/v1/x")
+    client.get("https://api.example.com/v1/y")
+    client.get("https://api.example.com/v1/z")
+    client.get("https://other.example.com/ping")
+    assert len(a.calls) == 3 and len(b.calls) == 1
+    assert a.calls[0][1]["timeout"] == client.timeout
+
+
+def test_retries_with_jittered_backoff_and_retry_after():
+    session = FakeSession([RequestException("reset"), _resp(503), _resp(429, {"Retry-After": "2"}), _resp(200)])
+    sleeps = []
+    client = _client([session], sleeps)
+
+    res = client.get("https://api.example.com/data", retries=3, endpoint="data")
+
+    assert res.status_code == 200
+    assert len(sleeps) == 3
+    assert 0 <= sleeps[0] <= 0.5 and 0 <= sleeps[1] <= 1.0
+    assert sleeps[2] == 2.0
+    stats = client.metrics()["data"]
+    assert stats["count"] == 4 and stats["errors"] == 3
+
+
+def test_final_transport_error_is_raised():
+    session = FakeSession([RequestException("down"), RequestException("down")])
+    client = _client([session], [])
+    with pytest.raises(RequestException):
+        client.get("https://api.example.com/data", retries=1)
+    assert client.metrics()["GET api.example.com/data"]["errors"] == 2
+
+
+def test_non_retryable_status_returned_immediately():
+    session = FakeSession([_resp(404)])
+    sleeps = []
+    client = _client([session], sleeps)
+    assert client.get("https://api.example.com/missing").status_code == 404
+    assert sleeps == []
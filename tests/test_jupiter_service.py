@@ -1,8 +1,8 @@
-import sys
-import importlib
 from types import SimpleNamespace
 import pytest
 
+from core.http_client import HttpClient
+
 
 class DummyResponse:
     def __init__(self, data=None, status=200):
@@ -18,10 +18,9 @@ class DummyResponse:
 
 
 def load_service(monkeypatch, mock_post):
-    requests_stub = SimpleNamespace(post=mock_post)
-    monkeypatch.setitem(sys.modules, 'requests', requests_stub)
     import wallets.jupiter_service as js
-    importlib.reload(js)
+    client = HttpClient(session_factory=lambda: SimpleNamespace(post=mock_post))
+    monkeypatch.setattr(js, "get_http_client", lambda: client)
     return js, js.JupiterService
 
 
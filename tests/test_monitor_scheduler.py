@@ -0,0 +1,139 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from monitor.monitor_core import MonitorCore
+from monitor.monitor_registry import MonitorRegistry
+from monitor.monitor_scheduler import COALESCE, MonitorScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class MemoryTimerConfig:
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+class FakeMonitor:
+    def __init__(self, gate=None):
+        self.gate = gate
+        self.runs = 0
+
+    def run_cycle(self):
+        self.runs += 1
+        if self.gate is not None:
+            self.gate.wait(2)
+
+
+def _scheduler(schedules, monitors, timer_config=None, rng=lambda: 0.0):
+    registry = MonitorRegistry()
+    for name, monitor in monitors.items():
+        registry.register(name, monitor)
+    clock = FakeClock()
+    scheduler = MonitorScheduler(MonitorCore(registry), schedules=schedules, max_workers=4,
+                                 timer_config=timer_config or MemoryTimerConfig(), clock=clock, rng=rng)
+    return scheduler, clock
+
+
+def _settle(scheduler, timeout=2.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if not any(job.running for job in scheduler.jobs.values()):
+            return
+        time.sleep(0.01)
+    raise AssertionError("jobs still running")
+
+
+def test_slots_stay_on_the_grid_and_jitter_does_not_accumulate():
+    scheduler, clock = _scheduler({"a": {"interval_seconds": 10, "jitter_seconds": 4}},
+                                  {"a": FakeMonitor()}, rng=lambda: 0.5)
+    job = scheduler.jobs["a"]
+    assert job.due == 2.0  # slot 0 + half the jitter
+
+    clock.now = 2.0
+    assert scheduler.run_pending() == ["a"]
+    _settle(scheduler)
+    clock.now = 13.7  # late start
+    assert scheduler.run_pending() == ["a"]
+    _settle(scheduler)
+    assert (job.slot, job.due) == (20.0, 22.0)
+    assert scheduler.timer_config.get("a_last_run")
+    scheduler.stop()
+
+
+def test_overrun_is_skipped_and_slow_monitor_does_not_block_others():
+    gate = threading.Event()
+    slow, fast = FakeMonitor(gate), FakeMonitor()
+    scheduler, clock = _scheduler({"slow": {"interval_seconds": 10}, "fast": {"interval_seconds": 10}},
+                                  {"slow": slow, "fast": fast})
+
+    assert sorted(scheduler.run_pending()) == ["fast", "slow"]
+    for t in (10.0, 20.0):
+        clock.now = t
+        time.sleep(0.05)
+        assert scheduler.run_pending() == ["fast"]
+    gate.set()
+    _settle(scheduler)
+
+    stats = scheduler.snapshot()
+    assert slow.runs == 1 and stats["slow"]["skipped"] == 2
+    assert fast.runs == 3
+    assert scheduler.jobs["slow"].slot == 30.0
+    scheduler.stop()
+
+
+def test_coalesce_runs_once_after_overrun():
+    gate = threading.Event()
+    monitor = FakeMonitor(gate)
+    scheduler, clock = _scheduler({"pos": {"interval_seconds": 10, "on_overrun": COALESCE}}, {"pos": monitor})
+
+    scheduler.run_pending()
+    for t in (10.0, 20.0):
+        clock.now = t
+        assert scheduler.run_pending() == []
+    clock.now = 25.0
+    gate.set()
+    _settle(scheduler)
+
+    assert scheduler.jobs["pos"].due <= 25.0
+    assert scheduler.run_pending() == ["pos"]  # one catch-up for two missed slots
+    _settle(scheduler)
+    assert monitor.runs == 2
+    assert scheduler.snapshot()["pos"]["coalesced"] == 2
+    assert scheduler.jobs["pos"].slot == 30.0
+    scheduler.stop()
+
+
+def test_schedule_resumes_from_last_recorded_run():
+    last = (datetime.now(timezone.utc) - timedelta(seconds=50)).isoformat()
+    scheduler, _ = _scheduler({"a": {"interval_seconds": 60}, "ghost": 30}, {"a": FakeMonitor()},
+                              timer_config=MemoryTimerConfig({"a_last_run": last}))
+    assert 9.0 < scheduler.jobs["a"].due <= 10.5
+    assert "ghost" not in scheduler.jobs  # not registered
+
+
+def test_run_by_name_never_overlaps_the_same_monitor():
+    gate = threading.Event()
+    registry = MonitorRegistry()
+    registry.register("m", FakeMonitor(gate))
+    core = MonitorCore(registry)
+
+    worker = threading.Thread(target=core.run_by_name, args=("m",))
+    worker.start()
+    time.sleep(0.05)
+    assert core.run_by_name("m", blocking=False) is False
+    gate.set()
+    worker.join(2)
+    assert core.run_by_name("m", blocking=False) is True
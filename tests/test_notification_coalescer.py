@@ -0,0 +1,104 @@
+from xcom.notification_coalescer import NotificationCoalescer, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _coalescer(policy, clock):
+    sent = []
+
+    def submit(channel, level, subject, body, recipient, initiator):
+        sent.append({"channel": channel, "level": level, "subject": subject,
+                     "body": body, "recipient": recipient})
+        return f"msg-{len(sent)}"
+
+    return NotificationCoalescer(submit, lambda: policy, clock=clock), sent
+
+
+def test_burst_of_alerts_becomes_one_digest_per_recipient_and_channel():
+    clock = FakeClock()
+    coalescer, sent = _coalescer({"window_seconds": 60}, clock)
+    for i in range(8):
+        coalescer.add("sms", "MEDIUM", f"Alert {i}", f"pos{i} travel", "555", "AlertCore")
+    coalescer.add("sms", "HIGH", "Alert X", "portfolio heat", "555", "AlertCore")
+    coalescer.add("sms", "LOW", "Other", "other recipient", "777", "AlertCore")
+
+    assert coalescer.pending() == {("sms", "555"): 9, ("sms", "777"): 1}
+    coalescer.flush_all()
+
+    assert len(sent) == 2
+    digest = next(m for m in sent if m["recipient"] == "555")
+    assert digest["level"] == "HIGH"
+    assert digest["subject"].startswith("9 alerts")
+    assert digest["body"].count("\n") == 8
+    single = next(m for m in sent if m["recipient"] == "777")
+    assert single["body"] == "other recipient"
+
+
+def test_rate_limit_holds_batch_until_token_available():
+    clock = FakeClock()
+    policy = {
+        "window_seconds": 60,
+        "rate_limits": {
+            "channels": {"voice": {"per_minute": 60, "burst": 1}},
+            "providers": {"twilio": {"per_minute": 120, "burst": 5}},
+        },
+    }
+    coalescer, sent = _coalescer(policy, clock)
+
+    coalescer.add("voice", "HIGH", "a", "first", "555")
+    coalescer.flush(("voice", "555"))
+    coalescer.add("voice", "HIGH", "b", "second", "555")
+    assert coalescer.flush(("voice", "555")) is None  # bucket empty
+    assert len(sent) == 1
+
+    coalescer.add("voice", "HIGH", "c", "third", "555")
+    clock.now += 1.0
+    assert coalescer.flush(("voice", "555")) == "msg-2"
+    assert "second" in sent[1]["body"] and "third" in sent[1]["body"]
+    coalescer.flush_all(force=True)
+
+
+def test_provider_bucket_is_shared_across_channels():
+    clock = FakeClock()
+    policy = {
+        "window_seconds": 60,
+        "rate_limits": {"providers": {"smtp": {"per_minute": 1, "burst": 1}}},
+    }
+    coalescer, sent = _coalescer(policy, clock)
+    coalescer.add("sms", "MEDIUM", "s", "b", "555")
+    coalescer.add("email", "LOW", "s", "b", "me@example.com")
+    coalescer.flush_all()
+    assert [m["channel"] for m in sent] == ["sms"]
+    assert coalescer.pending() == {("email", "me@example.com"): 1}
+    coalescer.flush_all(force=True)
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    bucket = TokenBucket(per_minute=30, burst=2, clock=clock)
+    bucket.consume()
+    bucket.consume()
+    assert bucket.wait_time() == 2.0
+    clock.now += 2.0
+    assert bucket.wait_time() == 0.0
+
+
+def test_batch_is_dropped_when_bucket_never_refills():
+    clock = FakeClock()
+    policy = {"window_seconds": 60, "rate_limits": {"channels": {"sound": {"per_minute": 0, "burst": 1}}}}
+    coalescer, sent = _coalescer(policy, clock)
+
+    coalescer.add("sound", "HIGH", "a", "first")
+    assert coalescer.flush(("sound", "")) == "msg-1"
+    coalescer.add("sound", "HIGH", "b", "second")
+    clock.now += 3600
+    assert coalescer.flush(("sound", "")) is None
+
+    assert coalescer.pending() == {} and len(sent) == 1
+    assert coalescer.flush_all(force=True) == []
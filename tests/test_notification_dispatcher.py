@@ -0,0 +1,159 @@
+import time
+
+from data.database import DatabaseManager
+from data.dl_xcom_outbox import DLXComOutboxManager
+from xcom.notification_dispatcher import NotificationDispatcher
+
+
+def _outbox(tmp_path):
+    return DLXComOutboxManager(DatabaseManager(str(tmp_path / "xcom.db")))
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_messages_are_delivered_in_background(tmp_path):
+    outbox = _outbox(tmp_path)
+    sent = []
+    dispatcher = NotificationDispatcher(
+        outbox, {"sms": lambda msg: sent.append(msg["body"]) or True}
+    ).start()
+    try:
+        ids = [dispatcher.submit("sms", "MEDIUM", "subj", f"body {i}", "555") for i in range(5)]
+        assert dispatcher.wait_idle(timeout=5)
+    finally:
+        dispatcher.stop()
+
+    assert sorted(sent) == [f"body {i}" for i in range(5)]
+    assert all(outbox.get_message(i)["status"] == "sent" for i in ids)
+    assert outbox.get_delivery_log(ids[0])[0]["status"] == "sent"
+
+
+def test_failures_retry_with_backoff_then_dead_letter(tmp_path):
+    outbox = _outbox(tmp_path)
+    calls = {"flaky": 0}
+    dead = []
+
+    def flaky(msg):
+        calls["flaky"] += 1
+        if calls["flaky"] < 3:
+            raise RuntimeError("provider timeout")
+        return True
+
+    dispatcher = NotificationDispatcher(
+        outbox,
+        {"voice": flaky, "email": lambda msg: False},
+        max_attempts=3, base_delay=0.01, max_delay=0.05, poll_interval=0.02,
+        on_dead=lambda msg, err: dead.append(msg["id"]),
+    ).start()
+    try:
+        flaky_id = dispatcher.submit("voice", "HIGH", "s", "b")
+        dead_id = dispatcher.submit("email", "LOW", "s", "b")
+        assert _wait_for(lambda: outbox.get_message(flaky_id)["status"] == "sent")
+        assert _wait_for(lambda: outbox.get_message(dead_id)["status"] == "dead")
+    finally:
+        dispatcher.stop()
+
+    assert [r["status"] for r in outbox.get_delivery_log(flaky_id)] == ["retry", "retry", "sent"]
+    assert [r["attempt"] for r in outbox.get_delivery_log(dead_id)] == [1, 2, 3]
+    assert dead == [dead_id]
+
+
+def test_queued_burst_is_delivered_as_one_batch(tmp_path):
+    outbox = _outbox(tmp_path)
+    batches = []
+
+    def send_many(msgs):
+        batches.append([m["body"] for m in msgs])
+        return [m["body"] != "body 1" for m in msgs]
+
+    dispatcher = NotificationDispatcher(
+        outbox, {"email": lambda msg: True}, workers={"email": 1}, base_delay=60,
+        batch_handlers={"email": send_many},
+    )
+    ids = [dispatcher.submit("email", "LOW", "s", f"body {i}", "me@example.com") for i in range(3)]
+    dispatcher.start()
+    try:
+        assert dispatcher.wait_idle(timeout=5)
+    finally:
+        dispatcher.stop()
+
+    assert batches == [["body 0", "body 1", "body 2"]]
+    assert [outbox.get_message(i)["status"] for i in ids] == ["sent", "pending", "sent"]
+    assert outbox.get_delivery_log(ids[1])[0]["status"] == "retry"
+
+
+def test_in_flight_rows_recovered_on_start(tmp_path):
+    outbox = _outbox(tmp_path)
+    msg_id = outbox.enqueue("sms", "MEDIUM", "s", "b")
+    assert outbox.claim(msg_id) is not None  # simulate crash mid-delivery
+
+    delivered = []
+    dispatcher = NotificationDispatcher(
+        outbox, {"sms": lambda msg: delivered.append(msg["id"]) or True}
+    ).start()
+    try:
+        assert _wait_for(lambda: outbox.get_message(msg_id)["status"] == "sent")
+    finally:
+        dispatcher.stop()
+    assert delivered == [msg_id]
+
+
+def test_send_notification_uses_outbox_on_its_own_connection(tmp_path, monkeypatch):
+    import xcom.xcom_core as xcom_core
+    from data.data_locker import DataLocker
+
+    monkeypatch.setattr(xcom_core, "_DISPATCHERS", {})
+    monkeypatch.setattr(xcom_core, "_COALESCERS", {})
+    sent = []
+    monkeypatch.setattr(xcom_core.XComCore, "channel_handlers",
+                        lambda self: {"sms": lambda msg: sent.append(msg["body"]) or True})
+    dl = DataLocker(str(tmp_path / "xcom.db"))
+    core = xcom_core.XComCore(dl.system)
+    assert core.outbox.db is not dl.db
+    assert core.outbox.db.db_path == dl.db.db_path
+
+    try:
+        results = core.send_notification("MEDIUM", "Liquidation warning", "BTC near liq", recipient="555")
+        assert results["sms"] == "queued"
+        [msg_id] = core.coalescer.flush_all(force=True)
+        assert core.dispatcher.wait_idle(timeout=5)
+    finally:
+        core.dispatcher.stop()
+
+    # A rollback on the DataLocker connection cannot touch the outbox's commits.
+    dl.db.get_cursor().execute("DELETE FROM xcom_outbox")
+    dl.db.conn.rollback()
+    assert core.outbox.get_message(msg_id)["status"] == "sent"
+    assert any("BTC near liq" in body for body in sent)
+    assert dl.ledger.get_last_entry("xcom_monitor")["status"] == "Success"
+
+
+def test_high_notifications_reach_the_outbox_without_waiting_for_a_digest(tmp_path, monkeypatch):
+    import xcom.xcom_core as xcom_core
+    from data.data_locker import DataLocker
+
+    monkeypatch.setattr(xcom_core, "_DISPATCHERS", {})
+    monkeypatch.setattr(xcom_core, "_COALESCERS", {})
+    sent = []
+    monkeypatch.setattr(xcom_core.XComCore, "channel_handlers", lambda self: {
+        channel: (lambda msg, channel=channel: sent.append(channel) or True)
+        for channel in ("sms", "voice", "sound", "email")
+    })
+    core = xcom_core.XComCore(DataLocker(str(tmp_path / "xcom.db")).system)
+
+    try:
+        results = core.send_notification("HIGH", "Liquidation", "BTC liquidated", recipient="555")
+        assert results["sms"] == results["voice"] == "queued"
+        assert core.coalescer.pending() == {}
+        assert sum(core.outbox.get_status_counts().values()) == 3  # persisted before any window closes
+        assert core.dispatcher.wait_idle(timeout=5)
+    finally:
+        core.dispatcher.stop()
+    assert sorted(sent) == ["sms", "sound", "voice"]
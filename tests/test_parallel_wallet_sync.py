@@ -0,0 +1,94 @@
+import threading
+import time
+import types
+
+from core.http_client import HttpClient, RequestException
+from data.data_locker import DataLocker
+import positions.position_sync_service as svc
+
+
+class DummyResponse:
+    status_code = 200
+    text = ""
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+def _item(pos_id):
+    return {
+        "positionPubkey": pos_id,
+        "marketMint": "So11111111111111111111111111111111111111112",
+        "side": "long", "entryPrice": 100, "liquidationPrice": 50, "collateral": 10,
+        "size": 1, "leverage": 2, "value": 20, "updatedTime": 1700000000,
+        "pnlAfterFeesUsd": 0, "pnlChangePctAfterFees": 0, "markPrice": 100,
+    }
+
+
+def _setup(tmp_path, monkeypatch, wallets, mock_get):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    monkeypatch.setattr(svc.PositionEnrichmentService, "enrich", lambda self, p: p)
+    client = HttpClient(session_factory=lambda: types.SimpleNamespace(get=mock_get),
+                        sleep=lambda *a: None)
+    monkeypatch.setattr(svc, "get_http_client", lambda: client)
+    dl = DataLocker(str(tmp_path / "parallel.db"))
+    for i in range(wallets):
+        dl.create_wallet({"name": f"W{i}", "public_address": f"ADDR{i}", "private_address": "p"})
+    return dl
+
+
+def test_wallets_fetch_concurrently_and_merge_into_one_batch(tmp_path, monkeypatch):
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def mock_get(url, headers=None, timeout=None):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.2)
+        with lock:
+            state["active"] -= 1
+        addr = url.split("walletAddress=")[1].split("&")[0]
+        return DummyResponse({"dataList": [_item(f"{addr}-pos")]})
+
+    dl = _setup(tmp_path, monkeypatch, 6, mock_get)
+    commits = []
+    real_commit = dl.db.commit
+    monkeypatch.setattr(dl.db, "commit", lambda: (commits.append(1), real_commit()))
+
+    service = svc.PositionSyncService(dl, max_concurrency=3)
+    start = time.perf_counter()
+    result = service.update_jupiter_positions()
+    elapsed = time.perf_counter() - start
+
+    assert result["imported"] == 6
+    assert result["wallets_synced"] == 6
+    assert state["peak"] == 3
+    assert elapsed < 0.2 * 6 * 0.75
+    assert len(commits) == 2  # one position batch + the sync watermarks
+    assert len(dl.positions.get_all_positions()) == 6
+    dl.db.close()
+
+
+def test_failed_wallet_is_reported_without_blocking_others(tmp_path, monkeypatch):
+    def mock_get(url, headers=None, timeout=None):
+        if "ADDR1" in url:
+            raise RequestException("jupiter unavailable")
+        addr = url.split("walletAddress=")[1].split("&")[0]
+        return DummyResponse({"dataList": [_item(f"{addr}-pos")]})
+
+    dl = _setup(tmp_path, monkeypatch, 3, mock_get)
+    result = svc.PositionSyncService(dl).update_jupiter_positions()
+
+    assert result["imported"] == 2
+    assert list(result["failed_wallets"]) == ["W1"]
+    assert "jupiter unavailable" in result["failed_wallets"]["W1"]
+    dl.db.close()
@@ -0,0 +1,81 @@
+import pytest
+from data.data_locker import DataLocker
+from calc_core.calc_services import CalcServices
+
+
+def _locker(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    return DataLocker(str(tmp_path / "totals.db"))
+
+
+def _pos(pos_id, size, value, collateral, leverage, travel, heat, status="ACTIVE"):
+    return {
+        "id": pos_id,
+        "asset_type": "BTC",
+        "position_type": "LONG",
+        "size": size,
+        "value": value,
+        "collateral": collateral,
+        "leverage": leverage,
+        "travel_percent": travel,
+        "heat_index": heat,
+        "status": status,
+    }
+
+
+def _assert_matches_full_recalc(dl):
+    expected = CalcServices().calculate_totals(dl.positions.get_active_positions())
+    totals = dl.positions.get_portfolio_totals()
+    for key, value in expected.items():
+        assert totals[key] == pytest.approx(value)
+
+
+def test_totals_track_inserts_updates_and_closes(tmp_path, monkeypatch):
+    dl = _locker(tmp_path, monkeypatch)
+    dl.positions.create_position(_pos("p1", 2.0, 200.0, 100.0, 2.0, -10.0, 20.0))
+    dl.positions.create_position(_pos("p2", 1.0, 50.0, 25.0, 4.0, 30.0, 40.0))
+    dl.positions.create_position(_pos("p3", 5.0, 500.0, 50.0, 10.0, 5.0, 0.0, status="CLOSED"))
+    _assert_matches_full_recalc(dl)
+
+    dl.positions.upsert_position(_pos("p2", 3.0, 90.0, 30.0, 3.0, -50.0, 60.0))
+    _assert_matches_full_recalc(dl)
+
+    dl.positions.close_position("p1")
+    _assert_matches_full_recalc(dl)
+    totals = dl.positions.get_portfolio_totals()
+    assert totals["position_count"] == 1
+    assert totals["value_to_collateral_ratio"] == pytest.approx(3.0)
+
+    dl.positions.delete_all_positions()
+    assert dl.positions.get_portfolio_totals()["total_value"] == 0.0
+    dl.db.close()
+
+
+def test_insert_position_updates_loaded_totals(tmp_path, monkeypatch):
+    dl = _locker(tmp_path, monkeypatch)
+    dl.positions.create_position(_pos("p1", 1.0, 100.0, 50.0, 2.0, 0.0, 10.0))
+    assert dl.positions.get_portfolio_totals()["position_count"] == 1
+
+    dl.positions.insert_position({
+        "id": "p2", "asset_type": "ETH", "entry_price": 3000.0, "liquidation_price": 2000.0,
+        "position_type": "SHORT", "wallet_name": "w", "current_heat_index": 30.0,
+        "pnl_after_fees_usd": 5.0, "travel_percent": -20.0, "liquidation_distance": 10.0,
+    })
+    assert dl.positions.get_portfolio_totals()["position_count"] == 2
+    _assert_matches_full_recalc(dl)
+    dl.db.close()
+
+
+def test_totals_rebuild_after_foreign_write(tmp_path, monkeypatch):
+    dl = _locker(tmp_path, monkeypatch)
+    dl.positions.create_position(_pos("p1", 1.0, 100.0, 50.0, 2.0, 0.0, 10.0))
+    assert dl.positions.get_portfolio_totals()["total_value"] == 100.0
+
+    other = DataLocker(str(tmp_path / "totals.db"))
+    other.positions.create_position(_pos("p2", 1.0, 40.0, 20.0, 2.0, 0.0, 10.0))
+    other.db.close()
+
+    assert dl.positions.get_portfolio_totals()["total_value"] == 140.0
+    dl.db.close()
@@ -0,0 +1,124 @@
+import types
+
+from core.http_client import HttpClient, RequestException
+from data.data_locker import DataLocker
+import positions.position_sync_service as svc
+
+
+class DummyResponse:
+    status_code = 200
+    text = ""
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+def _item(pos_id, size=1.0, updated=1700000000):
+    return {
+        "positionPubkey": pos_id,
+        "marketMint": "So11111111111111111111111111111111111111112",
+        "side": "long", "entryPrice": 100, "liquidationPrice": 50, "collateral": 10,
+        "size": size, "leverage": 2, "value": 20, "updatedTime": updated,
+        "pnlAfterFeesUsd": 0, "pnlChangePctAfterFees": 0, "markPrice": 100,
+    }
+
+
+def _setup(tmp_path, monkeypatch, payloads):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    monkeypatch.setattr(svc.PositionEnrichmentService, "enrich", lambda self, p: p)
+
+    def mock_get(url, headers=None, timeout=None):
+        addr = url.split("walletAddress=")[1].split("&")[0]
+        data = payloads[addr]
+        if isinstance(data, Exception):
+            raise data
+        return DummyResponse({"dataList": data})
+
+    client = HttpClient(session_factory=lambda: types.SimpleNamespace(get=mock_get),
+                        sleep=lambda *a: None)
+    monkeypatch.setattr(svc, "get_http_client", lambda: client)
+    dl = DataLocker(str(tmp_path / "reconcile.db"))
+    dl.create_wallet({"name": "W1", "public_address": "ADDR1", "private_address": "p"})
+    dl.create_wallet({"name": "W2", "public_address": "ADDR2", "private_address": "p"})
+    return dl
+
+
+def test_sync_updates_changed_closes_missing_and_spares_failed_wallets(tmp_path, monkeypatch):
+    payloads = {"ADDR1": [_item("a"), _item("b")], "ADDR2": [_item("z")]}
+    dl = _setup(tmp_path, monkeypatch, payloads)
+    service = svc.PositionSyncService(dl)
+
+    first = service.update_jupiter_positions()
+    assert first["imported"] == 3
+
+    payloads["ADDR1"] = [_item("a", size=3.5, updated=1700000100), _item("c")]
+    payloads["ADDR2"] = RequestException("jupiter down")
+    second = service.update_jupiter_positions()
+
+    assert second["imported"] == 1
+    assert second["updated"] == 1
+    assert second["closed"] == 1
+    assert list(second["failed_wallets"]) == ["W2"]
+
+    rows = {p["id"]: p for p in dl.positions.get_all_positions()}
+    assert rows["a"]["size"] == 3.5
+    assert rows["b"]["status"] == "CLOSED"
+    assert rows["c"]["status"] == "ACTIVE"
+    assert rows["z"]["status"] == "ACTIVE"
+
+    third = service.update_jupiter_positions()
+    assert third["imported"] == 0
+    assert third["updated"] == 0
+    assert third["skipped"] == 2
+    dl.db.close()
+
+
+def test_reconcile_preserves_links_and_reactivates_closed_ids(tmp_path, monkeypatch):
+    dl = _setup(tmp_path, monkeypatch, {})
+    positions = dl.positions
+    positions.reconcile_positions(
+        [{"id": "p1", "wallet_name": "W1", "size": 1.0, "hedge_buddy_id": None}], ["W1"]
+    )
+    cursor = dl.db.get_cursor()
+    cursor.execute("UPDATE positions SET hedge_buddy_id = 'h1' WHERE id = 'p1'")
+    dl.db.commit()
+
+    summary = positions.reconcile_positions(
+        [{"id": "p1", "wallet_name": "W1", "size": 2.0, "hedge_buddy_id": None}], ["W1"]
+    )
+    assert summary["updated"] == {"p1": ["size"]}
+    row = positions.get_position_by_id("p1")
+    assert row["hedge_buddy_id"] == "h1"
+
+    assert positions.reconcile_positions([], ["W1"])["closed"] == ["p1"]
+    assert positions.get_position_by_id("p1")["status"] == "CLOSED"
+
+    summary = positions.reconcile_positions([{"id": "p1", "wallet_name": "W1", "size": 2.0}], ["W1"])
+    assert summary["inserted"] == ["p1"]
+    row = positions.get_position_by_id("p1")
+    assert row["status"] == "ACTIVE"
+    assert row["hedge_buddy_id"] == "h1"
+    dl.db.close()
+
+
+def test_reconcile_rolls_back_on_failure(tmp_path, monkeypatch):
+    dl = _setup(tmp_path, monkeypatch, {})
+    positions = dl.positions
+    positions.reconcile_positions([{"id": "p1", "wallet_name": "W1", "size": 1.0}], ["W1"])
+
+    bad = {"id": "p2", "wallet_name": "W1", "size": object()}
+    try:
+        positions.reconcile_positions([{"id": "p1", "wallet_name": "W1", "size": 5.0}, bad], ["W1"])
+    except Exception:
+        pass
+    assert positions.get_position_by_id("p1")["size"] == 1.0
+    assert positions.get_position_by_id("p2") is None
+    dl.db.close()
@@ -1,8 +1,7 @@
-import sys
 import types
-import importlib
 import json
 
+from core.http_client import HttpClient, RequestException
 from data.data_locker import DataLocker
 
 
@@ -21,12 +20,12 @@ class DummyResponse:
 
 
 def load_service(monkeypatch, mock_get):
-    requests_stub = types.SimpleNamespace(
-        get=mock_get, RequestException=Exception, HTTPError=Exception
-    )
-    monkeypatch.setitem(sys.modules, "requests", requests_stub)
     import positions.position_sync_service as svc
-    importlib.reload(svc)
+    client = HttpClient(
+        session_factory=lambda: types.SimpleNamespace(get=mock_get),
+        sleep=lambda *a, **k: None,
+    )
+    monkeypatch.setattr(svc, "get_http_client", lambda: client)
     return svc
 
 
@@ -66,11 +65,10 @@ def test_update_jupiter_positions_inserts_and_retries(monkeypatch, tmp_path):
     def mock_get(url, headers=None, timeout=None):
         calls["n"] += 1
         if calls["n"] == 1:
-            raise Exception("fail")
+            raise RequestException("fail")
         return DummyResponse(dummy_data)
 
     svc_module = load_service(monkeypatch, mock_get)
-    monkeypatch.setattr(svc_module.time, "sleep", lambda *a, **k: None)
     monkeypatch.setattr(svc_module.PositionEnrichmentService, "enrich", lambda self, p: p)
 
     dl = setup_datalocker(tmp_path, monkeypatch)
@@ -0,0 +1,73 @@
+import time
+
+from prices.price_sources import PriceAggregator, PriceSource, build_sources, CoinGeckoSource
+
+
+class StaticSource(PriceSource):
+    def __init__(self, name, prices, delay=0.0, error=None, data_time=None):
+        super().__init__("http://unused")
+        self.name = name
+        self.prices = prices
+        self.delay = delay
+        self.error = error
+        self.data_time = data_time
+        self.calls = 0
+
+    def fetch(self, assets, deadline=None):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.error:
+            raise RuntimeError(self.error)
+        return {a: p for a, p in self.prices.items() if a in assets}, self.data_time
+
+
+def test_median_of_quorum_and_straggler_is_abandoned():
+    fast_a = StaticSource("a", {"BTC": 100.0, "SOL": 10.0})
+    fast_b = StaticSource("b", {"BTC": 104.0, "SOL": 12.0})
+    slow = StaticSource("slow", {"BTC": 999.0, "SOL": 99.0}, delay=1.0)
+    agg = PriceAggregator([slow, fast_a, fast_b], quorum=2, deadline=0.3)
+
+    start = time.perf_counter()
+    prices, report = agg.fetch(["BTC", "SOL"])
+
+    assert time.perf_counter() - start < 0.5
+    assert prices == {"BTC": 102.0, "SOL": 11.0}
+    assert report["degraded"] is False
+    assert report["abandoned"] == ["slow"]
+    assert report["sources"]["slow"]["used"] is False
+
+
+def test_deadline_returns_partial_result_as_degraded():
+    ok = StaticSource("ok", {"BTC": 100.0}, data_time=time.time() - 30)
+    broken = StaticSource("broken", {}, error="HTTP 429")
+    slow = StaticSource("slow", {"BTC": 200.0}, delay=1.0)
+    agg = PriceAggregator([ok, broken, slow], quorum=2, deadline=0.2)
+
+    prices, report = agg.fetch(["BTC"])
+
+    assert prices == {"BTC": 100.0}
+    assert report["degraded"] is True
+    assert report["sources"]["broken"]["error"] == "HTTP 429"
+    assert report["sources"]["ok"]["data_age_seconds"] >= 30
+    assert report["sources"]["ok"]["stale_seconds"] == 0
+
+
+def test_hedge_launches_only_when_primary_is_slow_or_fails():
+    primary = StaticSource("primary", {"BTC": 100.0})
+    hedge = StaticSource("hedge", {"BTC": 101.0})
+    agg = PriceAggregator([primary, hedge], quorum=1, deadline=1.0, hedge_delay=0.5)
+    assert agg.fetch(["BTC"])[0] == {"BTC": 100.0}
+    assert hedge.calls == 0
+
+    primary.error = "down"
+    assert agg.fetch(["BTC"])[0] == {"BTC": 101.0}
+    assert hedge.calls == 1
+    assert agg.source_status["primary"]["stale_seconds"] is not None
+
+
+def test_build_sources_accepts_names_and_instances():
+    custom = StaticSource("local", {})
+    sources = build_sources(["coingecko", "nope", custom], coingecko_base="http://cg.local/api/v3")
+    assert isinstance(sources[0], CoinGeckoSource)
+    assert sources[0].api_base == "http://cg.local/api/v3"
+    assert sources[1] is custom
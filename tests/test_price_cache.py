@@ -0,0 +1,153 @@
+import threading
+import time
+import types
+
+import pytest
+
+from core.http_client import HttpClient, RateLimited, set_http_client
+from core.request_budget import RequestBudget, configure_budget, get_budget
+from core.response_cache import ResponseCache, cache_ttl
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Upstream:
+    """Counts GETs and answers with a queued (status, headers, body) script."""
+
+    def __init__(self, *responses, delay=0.0):
+        self.responses = list(responses) or [(200, {}, {"bitcoin": {"usd": 1}})]
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.calls += 1
+            status, headers, body = self.responses[min(self.calls, len(self.responses)) - 1]
+        time.sleep(self.delay)
+
+        def raise_for_status():
+            if status >= 400:
+                raise RuntimeError(f"HTTP {status}")
+
+        return types.SimpleNamespace(status_code=status, headers=headers, json=lambda: body,
+                                     raise_for_status=raise_for_status)
+
+
+def _client(upstream, sleeps=None):
+    return HttpClient(session_factory=lambda: upstream, retries=0,
+                      sleep=(sleeps.append if sleeps is not None else (lambda s: None)))
+
+
+def test_cache_ttl_honours_cache_control():
+    assert cache_ttl({}, 10) == 10
+    assert cache_ttl({"Cache-Control": "public, max-age=30"}, 10) == 30
+    assert cache_ttl({"Cache-Control": "max-age=30", "Age": "25"}, 10) == 5
+    assert cache_ttl({"Cache-Control": "no-store"}, 10) == 0
+    assert cache_ttl({"Cache-Control": "no-cache, max-age=30"}, 10) == 0
+
+
+def test_concurrent_callers_share_one_request():
+    upstream = Upstream(delay=0.1)
+    client = _client(upstream)
+    cache = ResponseCache(default_ttl=10)
+    results = []
+
+    def call():
+        results.append(cache.get_json(client, "http://cg.test/simple/price", {"ids": "bitcoin"}))
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert upstream.calls == 1
+    assert results == [{"bitcoin": {"usd": 1}}] * 6
+    assert cache.snapshot()["coalesced"] == 5
+
+
+def test_entries_expire_after_max_age():
+    clock = FakeClock()
+    upstream = Upstream((200, {"Cache-Control": "max-age=5"}, {"v": 1}), (200, {}, {"v": 2}))
+    client = _client(upstream)
+    cache = ResponseCache(default_ttl=60, clock=clock)
+
+    assert cache.get_json(client, "http://cg.test/p", {"ids": "x"})["v"] == 1
+    clock.now += 4
+    assert cache.get_json(client, "http://cg.test/p", {"ids": "x"})["v"] == 1
+    clock.now += 2
+    assert cache.get_json(client, "http://cg.test/p", {"ids": "x"})["v"] == 2
+    assert upstream.calls == 2
+
+
+def test_retry_after_blocks_budget_and_serves_stale():
+    clock = FakeClock()
+    upstream = Upstream(
+        (200, {"Cache-Control": "max-age=1"}, {"v": 1}),
+        (429, {"Retry-After": "30"}, {}),
+    )
+    client = _client(upstream)
+    configure_budget("coingecko", limit=1000, window=1.0)
+    cache = ResponseCache(stale_ttl=120, clock=clock)
+
+    assert cache.get_json(client, "http://cg.test/p", budget="coingecko")["v"] == 1
+    clock.now += 2
+    # Expired; the upstream 429 falls back to the stale body and blocks the budget.
+    assert cache.get_json(client, "http://cg.test/p", budget="coingecko")["v"] == 1
+    assert get_budget("coingecko").blocked_for() > 25
+    # While blocked, callers are answered from cache without touching the provider.
+    assert cache.get_json(client, "http://cg.test/p", budget="coingecko")["v"] == 1
+    assert upstream.calls == 2
+    assert cache.snapshot()["stale"] == 2
+
+
+def test_budget_spreads_slots_across_the_window():
+    clock = FakeClock()
+    budget = RequestBudget("cg", limit=30, window=60, clock=clock)
+    assert [budget.reserve() for _ in range(3)] == [0.0, 2.0, 4.0]
+    assert budget.reserve(max_wait=1.0) is None
+    clock.now += 10
+    assert budget.reserve(max_wait=1.0) == 0.0
+
+    budget.block(30)
+    assert budget.reserve(max_wait=5) is None
+    assert budget.reserve() == pytest.approx(30.0)
+
+
+def test_http_client_waits_for_budget_and_respects_deadline():
+    configure_budget("coingecko", limit=2, window=2.0)
+    sleeps = []
+    client = _client(Upstream(), sleeps)
+
+    client.get("http://cg.test/p", budget="coingecko")
+    client.get("http://cg.test/p", budget="coingecko")
+    assert len(sleeps) == 1 and sleeps[0] == pytest.approx(1.0, abs=0.05)
+
+    with pytest.raises(RateLimited):
+        client.get("http://cg.test/p", budget="coingecko", deadline=time.monotonic() + 0.1)
+
+
+def test_latency_ping_skipped_when_budget_is_spent():
+    from monitor.latency_monitor import LatencyMonitor
+
+    upstream = Upstream()
+    previous = set_http_client(_client(upstream))
+    try:
+        configure_budget("coingecko", limit=1, window=60.0)
+        get_budget("coingecko").reserve()  # a price fetch just used the slot
+        monitor = LatencyMonitor(targets={"CoinGecko": "http://cg.test/ping", "Jupiter": "http://jup.test/ping"})
+        result = monitor._do_work()
+    finally:
+        set_http_client(previous)
+
+    assert result["CoinGecko"].startswith("SKIPPED")
+    assert isinstance(result["Jupiter"], float)
+    assert upstream.calls == 1
+    assert result["budgets"]["coingecko"]["denied"] == 1
@@ -0,0 +1,169 @@
+import socketserver
+import threading
+from email.mime.text import MIMEText
+
+import pytest
+
+from xcom.smtp_transport import SMTPTransport
+from xcom.email_service import EmailService
+import xcom.smtp_transport as smtp_transport
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP (EHLO/AUTH/MAIL/RCPT/DATA/QUIT) to accept messages."""
+
+    def _reply(self, line):
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self._reply("220 stand-in ready")
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            cmd = raw.decode().strip()
+            verb = cmd.split(" ")[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250-stand-in")
+                self._reply("250 AUTH PLAIN LOGIN")
+            elif verb == "AUTH":
+                server.logins += 1
+                self._reply("535 authentication failed" if server.fail_auth else "235 ok")
+            elif verb == "RCPT" and any(addr in cmd for addr in server.reject):
+                self._reply("550 no such user")
+            elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self._reply("250 ok")
+            elif verb == "DATA":
+                self._reply("354 go ahead")
+                lines = []
+                while True:
+                    line = self.rfile.readline().decode()
+                    if line in (".\r\n", ""):
+                        break
+                    lines.append(line)
+                server.messages.append("".join(lines))
+                self._reply("250 queued")
+                if server.drop_after_message:
+                    server.drop_after_message = False
+                    return  # simulate the server closing an idle session
+            elif verb == "QUIT":
+                self._reply("221 bye")
+                return
+            else:
+                self._reply("502 unsupported")
+
+
+@pytest.fixture
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SMTPHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.logins = 0
+    server.messages = []
+    server.drop_after_message = False
+    server.reject = set()
+    server.fail_auth = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _msg(i, to="me@example.com"):
+    msg = MIMEText(f"body {i}")
+    msg["Subject"], msg["From"], msg["To"] = f"alert {i}", "bot@example.com", to
+    return msg
+
+
+def _transport(server, **kw):
+    host, port = server.server_address
+    return SMTPTransport(host, port, "user", "pw", starttls=False, **kw)
+
+
+def test_burst_reuses_one_session(smtp_server):
+    transport = _transport(smtp_server)
+    assert transport.send_many([_msg(i) for i in range(5)]) == 5
+    assert transport.send(_msg(5))
+    transport.close()
+
+    assert len(smtp_server.messages) == 6
+    assert smtp_server.connections == 1
+    assert smtp_server.logins == 1
+
+
+def test_reconnects_after_server_disconnect(smtp_server):
+    transport = _transport(smtp_server)
+    smtp_server.drop_after_message = True
+    assert transport.send(_msg(1))
+    assert transport.send(_msg(2))
+    transport.close()
+
+    assert len(smtp_server.messages) == 2
+    assert transport.connects == 2
+
+
+def test_rejected_recipient_fails_only_that_message(smtp_server):
+    smtp_server.reject.add("bad@example.com")
+    transport = _transport(smtp_server)
+    sent = transport.send_many([_msg(1), _msg(2, to="bad@example.com"), _msg(3)])
+    transport.close()
+
+    assert sent == 2
+    assert len(smtp_server.messages) == 2
+    assert transport.connects == 1
+    breaker = smtp_transport.get_breaker("smtp").snapshot()
+    assert breaker["failures"] == 0 and breaker["last_error"] is None
+
+
+def test_login_failure_is_a_transport_failure(smtp_server):
+    smtp_server.fail_auth = True
+    transport = _transport(smtp_server)
+    assert transport.send_each([_msg(1), _msg(2), _msg(3)]) == [False, False, False]
+    transport.close()
+
+    assert smtp_server.connections == 1  # the batch stops instead of logging in per message
+    breaker = smtp_transport.get_breaker("smtp").snapshot()
+    assert breaker["failures"] == 1 and "authentication failed" in breaker["last_error"]
+
+
+def test_idle_timeout_opens_fresh_session(smtp_server):
+    transport = _transport(smtp_server, idle_timeout=0)
+    assert transport.send(_msg(1))
+    assert transport.send(_msg(2))
+    transport.close()
+    assert smtp_server.connections == 2
+
+
+def test_email_service_uses_shared_transport(smtp_server, monkeypatch):
+    monkeypatch.setattr(smtp_transport, "_TRANSPORTS", {})
+    host, port = smtp_server.server_address
+    cfg = {"enabled": True, "smtp": {
+        "server": host, "port": port, "username": "user", "password": "pw",
+        "default_recipient": "me@example.com", "starttls": False,
+    }}
+    for i in range(3):
+        assert EmailService(cfg).send(None, f"s{i}", f"b{i}")
+    for transport in smtp_transport._TRANSPORTS.values():
+        transport.close()
+    assert smtp_server.connections == 1
+    assert len(smtp_server.messages) == 3
+
+
+def test_email_service_sends_a_batch_on_one_session(smtp_server, monkeypatch):
+    monkeypatch.setattr(smtp_transport, "_TRANSPORTS", {})
+    smtp_server.reject.add("bad@example.com")
+    host, port = smtp_server.server_address
+    cfg = {"enabled": True, "smtp": {
+        "server": host, "port": port, "username": "user", "password": "pw", "starttls": False,
+    }}
+    results = EmailService(cfg).send_many([
+        ("a@example.com", "s1", "b1"), ("bad@example.com", "s2", "b2"), (None, "s3", "b3"),
+        ("c@example.com", "s4", "b4"),
+    ])
+    for transport in smtp_transport._TRANSPORTS.values():
+        transport.close()
+    assert results == [True, False, False, True]
+    assert smtp_server.connections == 1 and len(smtp_server.messages) == 2
@@ -0,0 +1,73 @@
+import threading
+
+from xcom.sound_service import SoundPlayer, SoundService
+
+
+def _clip(tmp_path, name="alert.mp3"):
+    path = tmp_path / name
+    path.write_bytes(b"ID3fake")
+    return str(path)
+
+
+def test_play_returns_immediately_and_plays_in_background(tmp_path):
+    release = threading.Event()
+    played = []
+
+    def backend(path):
+        release.wait(2)
+        played.append(path)
+
+    player = SoundPlayer(backend=backend)
+    svc = SoundService(player=player)
+    clip = _clip(tmp_path)
+
+    assert svc.play(clip) == "queued"
+    assert played == []  # caller did not wait for the clip
+    release.set()
+    assert player.wait_idle(timeout=2)
+    assert played == [clip]
+
+
+def test_repeated_alerts_merge_and_overflow_drops(tmp_path):
+    release = threading.Event()
+    started = threading.Event()
+    played = []
+
+    def backend(path):
+        started.set()
+        release.wait(2)
+        played.append(path)
+
+    player = SoundPlayer(backend=backend, max_pending=2)
+    svc = SoundService(player=player)
+    a, b, c, d = (_clip(tmp_path, f"{n}.mp3") for n in "abcd")
+
+    svc.play(a)
+    assert started.wait(2)           # worker is now busy with clip a
+    assert svc.play(a) == "merged"   # same clip just started
+    assert svc.play(b) == "queued"
+    assert svc.play(b) == "merged"
+    assert svc.play(c) == "queued"
+    assert svc.play(d) == "dropped"
+
+    release.set()
+    assert player.wait_idle(timeout=2)
+    assert played == [a, b, c]
+    assert player.stats == {"played": 3, "merged": 2, "dropped": 1}
+
+
+def test_missing_file_beeps(tmp_path):
+    svc = SoundService(player=SoundPlayer(backend=lambda p: None))
+    assert svc.play(str(tmp_path / "nope.mp3")) == "missing"
+
+
+def test_death_nail_waits_for_its_sound(tmp_path, monkeypatch):
+    from core.logging import log
+    from system import death_nail_service
+
+    calls = []
+    monkeypatch.setattr(death_nail_service.SoundService, "play",
+                        lambda self, path=None, block=False: calls.append(block))
+    service = death_nail_service.DeathNailService(log, log_path=str(tmp_path / "death_log.txt"))
+    service.trigger({"message": "💀 test"})
+    assert calls == [True]
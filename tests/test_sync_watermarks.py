@@ -0,0 +1,153 @@
+import types
+
+from core.http_client import HttpClient
+from data.data_locker import DataLocker
+import positions.position_sync_service as svc
+
+
+class DummyResponse:
+    status_code = 200
+    text = ""
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+def _item(pos_id, size=1.0, updated=1700000000, mark=100):
+    return {
+        "positionPubkey": pos_id,
+        "marketMint": "So11111111111111111111111111111111111111112",
+        "side": "long", "entryPrice": 100, "liquidationPrice": 50, "collateral": 10,
+        "size": size, "leverage": 2, "value": 20, "updatedTime": updated,
+        "pnlAfterFeesUsd": 0, "pnlChangePctAfterFees": 0, "markPrice": mark,
+    }
+
+
+def _setup(tmp_path, monkeypatch, payloads, enriched):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+
+    def enrich(self, p):
+        enriched.append(p["id"])
+        return p
+
+    monkeypatch.setattr(svc.PositionEnrichmentService, "enrich", enrich)
+
+    def mock_get(url, headers=None, timeout=None):
+        addr = url.split("walletAddress=")[1].split("&")[0]
+        return DummyResponse({"dataList": payloads[addr]})
+
+    client = HttpClient(session_factory=lambda: types.SimpleNamespace(get=mock_get),
+                        sleep=lambda *a: None)
+    monkeypatch.setattr(svc, "get_http_client", lambda: client)
+    dl = DataLocker(str(tmp_path / "watermarks.db"))
+    dl.create_wallet({"name": "W1", "public_address": "ADDR1", "private_address": "p"})
+    dl.create_wallet({"name": "W2", "public_address": "ADDR2", "private_address": "p"})
+    return dl
+
+
+def test_unchanged_wallet_skips_enrichment_and_db_work(tmp_path, monkeypatch):
+    payloads = {"ADDR1": [_item("a"), _item("b")], "ADDR2": [_item("z")]}
+    enriched = []
+    dl = _setup(tmp_path, monkeypatch, payloads, enriched)
+    service = svc.PositionSyncService(dl)
+
+    service.update_jupiter_positions()
+    assert sorted(enriched) == ["a", "b", "z"]
+
+    enriched.clear()
+    reconciled = []
+    real = dl.positions.reconcile_positions
+    monkeypatch.setattr(dl.positions, "reconcile_positions",
+                        lambda f, w, k=(): (reconciled.append(list(w)), real(f, w, k))[1])
+    result = service.update_jupiter_positions()
+
+    assert enriched == []
+    assert reconciled == [[]]
+    assert result["wallets_unchanged"] == 2
+    assert result["skipped"] == 3
+    dl.db.close()
+
+
+def test_position_stamp_skips_unchanged_rows_in_changed_wallet(tmp_path, monkeypatch):
+    payloads = {"ADDR1": [_item("a"), _item("b"), _item("c")], "ADDR2": [_item("z")]}
+    enriched = []
+    dl = _setup(tmp_path, monkeypatch, payloads, enriched)
+    service = svc.PositionSyncService(dl)
+    service.update_jupiter_positions()
+
+    enriched.clear()
+    payloads["ADDR1"] = [_item("a"), _item("b", size=2.0, updated=1700000500), _item("c")]
+    result = service.update_jupiter_positions()
+
+    assert enriched == ["b"]
+    assert result["updated"] == 1
+    assert result["closed"] == 0
+    assert dl.positions.get_position_by_id("b")["size"] == 2.0
+    assert dl.positions.get_position_by_id("a")["status"] == "ACTIVE"
+    dl.db.close()
+
+
+def test_mark_price_move_refreshes_position_with_same_updated_time(tmp_path, monkeypatch):
+    payloads = {"ADDR1": [_item("a"), _item("b")], "ADDR2": [_item("z")]}
+    enriched = []
+    dl = _setup(tmp_path, monkeypatch, payloads, enriched)
+    service = svc.PositionSyncService(dl)
+    service.update_jupiter_positions()
+
+    enriched.clear()
+    # Jupiter leaves updatedTime alone when only the mark price moves.
+    payloads["ADDR1"] = [_item("a", mark=105), _item("b")]
+    result = service.update_jupiter_positions()
+
+    assert enriched == ["a"]
+    assert result["updated"] == 1
+    assert dl.positions.get_position_by_id("a")["current_price"] == 105.0
+    dl.db.close()
+
+
+def test_watermark_ignored_when_rows_were_removed_locally(tmp_path, monkeypatch):
+    payloads = {"ADDR1": [_item("a")], "ADDR2": []}
+    enriched = []
+    dl = _setup(tmp_path, monkeypatch, payloads, enriched)
+    service = svc.PositionSyncService(dl)
+    service.update_jupiter_positions()
+
+    dl.positions.delete_all_positions()
+    enriched.clear()
+    result = service.update_jupiter_positions()
+
+    assert enriched == ["a"]
+    assert result["imported"] == 1
+    assert dl.positions.get_position_by_id("a") is not None
+    dl.db.close()
+
+
+def test_enrichment_failure_keeps_live_position_open(tmp_path, monkeypatch):
+    payloads = {"ADDR1": [_item("a"), _item("b")], "ADDR2": []}
+    enriched = []
+    dl = _setup(tmp_path, monkeypatch, payloads, enriched)
+    service = svc.PositionSyncService(dl)
+    service.update_jupiter_positions()
+
+    def flaky(self, p):
+        if p["id"] == "a":
+            raise ValueError("bad mark")
+        return p
+
+    monkeypatch.setattr(svc.PositionEnrichmentService, "enrich", flaky)
+    payloads["ADDR1"] = [_item("a", size=3.0, updated=1700000900), _item("b", size=2.0, updated=1700000900)]
+    result = service.update_jupiter_positions()
+
+    assert result["closed"] == 0
+    assert result["errors"] == 1
+    assert dl.positions.get_position_by_id("a")["status"] == "ACTIVE"
+    assert dl.positions.get_position_by_id("b")["size"] == 2.0
+    dl.db.close()
@@ -0,0 +1,51 @@
+from data.data_locker import DataLocker
+
+
+def _locker(path, monkeypatch):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    return DataLocker(str(path))
+
+
+def _count_var_reads(dl):
+    reads = []
+    dl.db.connect().set_trace_callback(
+        lambda sql: reads.append(sql) if "FROM global_config" in sql else None
+    )
+    return reads
+
+
+def test_get_var_served_from_cache_until_set_var(tmp_path, monkeypatch):
+    dl = _locker(tmp_path / "vars.db", monkeypatch)
+    dl.system.set_var("xcom_providers", {"sms": {"enabled": True}})
+    reads = _count_var_reads(dl)
+
+    first = dl.system.get_var("xcom_providers")
+    second = dl.system.get_var("xcom_providers")
+    assert first == second == {"sms": {"enabled": True}}
+    assert first is not second
+    assert len(reads) == 1
+
+    shared = dl.system.get_var("xcom_providers", readonly=True)
+    assert shared is dl.system.get_var("xcom_providers", readonly=True)
+    assert len(reads) == 1
+
+    dl.system.set_var("xcom_providers", {"sms": {"enabled": False}})
+    assert dl.system.get_var("xcom_providers") == {"sms": {"enabled": False}}
+    assert len(reads) == 2
+    dl.db.close()
+
+
+def test_get_var_sees_writes_from_other_connections(tmp_path, monkeypatch):
+    path = tmp_path / "shared.db"
+    reader = _locker(path, monkeypatch)
+    writer = _locker(path, monkeypatch)
+    writer.system.set_var("alert_limits", {"v": 1})
+
+    assert reader.system.get_var("alert_limits") == {"v": 1}
+    writer.system.set_var("alert_limits", {"v": 2})
+    assert reader.system.get_var("alert_limits") == {"v": 2}
+    assert reader.system.get_var("missing") == {}
+    reader.db.close()
+    writer.db.close()
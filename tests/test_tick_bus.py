@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+import types
+
+from alert_core.alert_core import _alert_asset
+from core.tick_bus import TickBus
+from cyclone.cyclone_engine import RISK_LEASE_NAME, Cyclone
+from data.data_locker import DataLocker
+from prices.price_ticker import PriceTicker
+
+
+def _collector(gate=None):
+    batches = []
+
+    def handler(batch):
+        if gate is not None:
+            gate.wait(2)
+        batches.append({a: (t.price, t.previous) for a, t in batch.items()})
+
+    return batches, handler
+
+
+def test_burst_is_coalesced_to_latest_price_per_asset():
+    bus = TickBus()
+    gate = threading.Event()
+    batches, handler = _collector(gate)
+    sub = bus.subscribe("slow", handler)
+
+    bus.publish_prices({"BTC": 100.0})
+    time.sleep(0.05)  # first batch is now in the (blocked) handler
+    for price in range(101, 111):
+        bus.publish_prices({"BTC": float(price), "ETH": float(price) / 10})
+    gate.set()
+    assert bus.wait_idle(2)
+
+    assert batches[0] == {"BTC": (100.0, None)}
+    assert batches[1] == {"BTC": (110.0, 100.0), "ETH": (11.0, None)}  # ETH had no earlier price
+    assert len(batches) == 2
+    assert sub.stats["coalesced"] == 18
+    bus.close()
+
+
+def test_min_change_is_measured_from_last_handled_price():
+    bus = TickBus()
+    batches, handler = _collector()
+    bus.subscribe("risk", handler, min_change_pct=1.0)
+
+    bus.publish_prices({"SOL": 100.0})
+    assert bus.wait_idle(2)
+    for price in (100.4, 100.8, 101.2):  # each step < 1%, the drift is not
+        bus.publish_prices({"SOL": price})
+        assert bus.wait_idle(2)
+
+    assert [b["SOL"][0] for b in batches] == [100.0, 101.2]
+    assert bus.stats()["subscribers"]["risk"]["filtered"] == 2
+    bus.close()
+
+
+def test_bounded_mailbox_drops_oldest_and_errors_do_not_stop_subscriber():
+    bus = TickBus()
+    gate = threading.Event()
+    seen = []
+
+    def handler(batch):
+        gate.wait(2)
+        seen.append(sorted(batch))
+        if len(seen) == 1:
+            raise RuntimeError("boom")
+
+    sub = bus.subscribe("bounded", handler, max_pending=2)
+    bus.publish_prices({"A": 1.0})
+    time.sleep(0.05)
+    bus.publish_prices({"B": 1.0, "C": 1.0, "D": 1.0})
+    gate.set()
+    assert bus.wait_idle(2)
+
+    assert seen == [["A"], ["C", "D"]]
+    assert sub.stats["dropped"] == 1
+    assert sub.stats["errors"] == 1 and sub.stats["batches"] == 2
+    bus.close()
+
+
+def test_min_interval_batches_ticks_between_runs():
+    bus = TickBus()
+    batches, handler = _collector()
+    bus.subscribe("hedges", handler, min_interval=0.2)
+
+    bus.publish_prices({"BTC": 1.0})
+    time.sleep(0.05)
+    bus.publish_prices({"BTC": 2.0})
+    bus.publish_prices({"ETH": 3.0})
+    assert bus.wait_idle(2)
+
+    assert batches == [{"BTC": (1.0, None)}, {"BTC": (2.0, 1.0), "ETH": (3.0, None)}]
+    bus.close()
+
+
+def test_ticker_stores_and_publishes_only_changes_with_subsecond_lag():
+    bus = TickBus()
+    stored = []
+    quotes = iter([{"BTC": 100.0, "ETH": 10.0}, {"BTC": 100.0, "ETH": 10.5}])
+    service = types.SimpleNamespace(fetch_prices=lambda: next(quotes))
+    dl = types.SimpleNamespace(insert_or_update_prices=lambda prices, source: stored.append(dict(prices)))
+    batches, handler = _collector()
+    sub = bus.subscribe("risk", handler)
+    ticker = PriceTicker(dl, service=service, bus=bus)
+
+    assert len(ticker.poll_once()) == 2
+    assert [t.asset for t in ticker.poll_once()] == ["ETH"]
+    assert bus.wait_idle(2)
+
+    assert stored == [{"BTC": 100.0, "ETH": 10.0}, {"ETH": 10.5}]
+    assert sub.stats["last_lag_ms"] < 1000
+    bus.close()
+
+
+def test_cyclone_tick_reaction_is_limited_to_moved_assets():
+    calls = []
+
+    async def enrich_positions(assets=None):
+        calls.append(("enrich", sorted(assets)))
+
+    async def process_alerts(assets=None):
+        calls.append(("alerts", sorted(assets)))
+
+    engine = types.SimpleNamespace(
+        position_core=types.SimpleNamespace(enrich_positions=enrich_positions),
+        alert_core=types.SimpleNamespace(process_alerts=process_alerts),
+    )
+    asyncio.run(Cyclone.run_tick_reaction(engine, {"SOL"}))
+    assert calls == [("enrich", ["SOL"]), ("alerts", ["SOL"])]
+
+
+def test_ticker_writes_through_its_own_connection(tmp_path):
+    dl = DataLocker(str(tmp_path / "ticks.db"))
+    ticker = PriceTicker(dl, service=types.SimpleNamespace(fetch_prices=dict), bus=TickBus())
+    assert ticker.dl.db.db_path == dl.db.db_path
+    assert ticker.dl.db.get_cursor().connection is not dl.db.get_cursor().connection
+
+
+def _risk_engine(tmp_path, monkeypatch, reactions):
+    engine = Cyclone(poll_interval=1, step_policies={})
+    engine.data_locker = DataLocker(str(tmp_path / "cyclone.db"))
+
+    async def reaction(assets, cores=None):
+        assert cores.data_locker.db.db_path == engine.data_locker.db.db_path
+        assert cores.data_locker.db.get_cursor().connection is not engine.data_locker.db.get_cursor().connection
+        reactions.append(sorted(assets))
+
+    monkeypatch.setattr(engine, "run_tick_reaction", reaction)
+    return engine
+
+
+def test_tick_batch_is_skipped_while_cycle_evaluates_alerts(tmp_path, monkeypatch):
+    reactions, during = [], []
+    engine = _risk_engine(tmp_path, monkeypatch, reactions)
+
+    async def evaluate():
+        during.append(await asyncio.to_thread(engine.react_to_ticks, {"SOL"}))
+
+    monkeypatch.setattr(engine, "run_alert_evaluation", evaluate)
+    outcomes = asyncio.run(engine.run_cycle(["evaluate_alerts"]))
+
+    assert outcomes["evaluate_alerts"]["status"] == "ok"
+    assert during == [False] and reactions == []
+    assert engine.react_to_ticks({"SOL"}) and reactions == [["SOL"]]
+
+
+def test_hedge_tick_is_skipped_while_cycle_updates_hedges(tmp_path, monkeypatch):
+    engine = _risk_engine(tmp_path, monkeypatch, [])
+    updates, during = [], []
+    monkeypatch.setattr(engine.tick_cores().hedge_core, "update_hedges", lambda: updates.append("tick"))
+
+    async def update_hedges():
+        during.append(await asyncio.to_thread(engine.react_to_hedge_ticks))
+
+    monkeypatch.setattr(engine, "run_update_hedges", update_hedges)
+    asyncio.run(engine.run_cycle(["update_hedges"]))
+
+    assert during == [False] and updates == []
+    assert engine.react_to_hedge_ticks() and updates == ["tick"]
+
+
+def test_cycle_alert_step_waits_for_running_tick_reaction(tmp_path, monkeypatch):
+    engine = _risk_engine(tmp_path, monkeypatch, [])
+    ran = []
+    monkeypatch.setattr(engine, "run_alert_evaluation", lambda: asyncio.sleep(0, ran.append("evaluate")))
+    leases = engine.data_locker.leases
+    reaction = leases.acquire(RISK_LEASE_NAME, "ticks@host:1", ttl=30)
+    threading.Timer(0.2, lambda: ran.append("reaction done") or leases.release(reaction)).start()
+
+    outcomes = asyncio.run(engine.run_cycle(["evaluate_alerts"]))
+
+    assert ran == ["reaction done", "evaluate"]
+    assert outcomes["evaluate_alerts"]["elapsed"] >= 0.2
+    assert leases.current(RISK_LEASE_NAME)["holder"] is None
+
+
+def test_alert_asset_falls_back_to_asset_type():
+    assert _alert_asset({"asset": "btc"}) == "BTC"
+    assert _alert_asset(types.SimpleNamespace(asset=None, asset_type="SOL")) == "SOL"
+    assert _alert_asset({"asset": None}) == ""
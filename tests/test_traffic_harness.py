@@ -0,0 +1,74 @@
+import json
+import time
+
+import pytest
+
+from core.http_client import get_http_client
+from core.request_budget import configure_budget
+from core.response_cache import get_response_cache
+from monitor.monitor_service import MonitorService
+from test_core.traffic_harness import ReplayMiss, ReplayResponse, TrafficHarness
+from wallets.blockchain_balance_service import BlockchainBalanceService
+
+
+class LiveSession:
+    """Stands in for the network while recording."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.calls += 1
+        time.sleep(0.02)
+        return ReplayResponse(200, {"Content-Type": "application/json", "X-Drop": "1"},
+                              json.dumps({"bitcoin": {"usd": 100000 + self.calls}}), url)
+
+    def post(self, url, json=None, **kwargs):
+        self.calls += 1
+        return ReplayResponse(200, {}, '{"jsonrpc": "2.0", "result": {"value": 3000000000}, "id": 1}', url)
+
+
+def _exercise():
+    get_response_cache().clear()  # every cycle goes to the wire
+    prices = MonitorService(api_base="http://cg.test/api/v3", sources=["coingecko"]).fetch_prices()
+    balance = BlockchainBalanceService(sol_rpc_url="http://rpc.test")._rpc_sol_balance("SoLAddr")
+    return prices, balance
+
+
+def test_record_then_replay_is_deterministic_and_scaled(tmp_path):
+    configure_budget("coingecko", limit=1000, window=1.0)  # recording paces live calls; keep it quick
+    live = LiveSession()
+    original = get_http_client()
+    with TrafficHarness(tmp_path, mode="record", session_factory=lambda: live) as harness:
+        first = _exercise()
+        second = _exercise()
+    assert get_http_client() is original
+    assert live.calls == 4
+    assert harness.stats()["entries"] == 4
+
+    lines = [json.loads(l) for l in (tmp_path / "traffic.jsonl").read_text().splitlines()]
+    assert lines[0]["elapsed_ms"] >= 20
+    assert "X-Drop" not in lines[0]["headers"]
+
+    sleeps = []
+    with TrafficHarness(tmp_path, mode="replay", speed=10, sleep=sleeps.append) as harness:
+        assert _exercise() == first
+        assert _exercise() == second
+        assert _exercise() == second  # recordings exhausted → last one repeats
+    assert live.calls == 4
+    assert first[0]["BTC"] == 100001 and first[1] == 3.0
+    assert sleeps[0] == pytest.approx(lines[0]["elapsed_ms"] / 1000 / 10)
+    assert harness.stats()["misses"] == 0
+
+
+def test_strict_replay_reports_misses(tmp_path):
+    with TrafficHarness(tmp_path, mode="record", session_factory=LiveSession):
+        MonitorService(api_base="http://cg.test/api/v3", sources=["coingecko"]).fetch_prices()
+
+    with TrafficHarness(tmp_path, mode="replay", speed=0, strict=True) as harness:
+        assert MonitorService(api_base="http://cg.test/api/v3", sources=["coingecko"]).fetch_prices()["BTC"] == 100001
+        get_response_cache().clear()
+        assert MonitorService(api_base="http://cg.test/api/v3", sources=["coingecko"]).fetch_prices() == {}
+        with pytest.raises(ReplayMiss):
+            get_http_client().get("http://elsewhere.test/x", retries=0)
+    assert harness.stats()["misses"] == 4  # 3 attempts for the CoinGecko source + 1
@@ -106,12 +106,12 @@ class StartUpService:
                 sounder.play("static/sounds/web_station_startup.mp3")
         except SystemExit:
             if play_sound:
-                sounder.play("static/sounds/death_spiral.mp3")
+                sounder.play("static/sounds/death_spiral.mp3", block=True)
             raise
         except Exception as exc:
             log.critical(f"❌ Startup failed: {exc}", source="StartUpService")
             if play_sound:
-                sounder.play("static/sounds/death_spiral.mp3")
+                sounder.play("static/sounds/death_spiral.mp3", block=True)
             raise
 
     @staticmethod
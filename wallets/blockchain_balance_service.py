@@ -24,6 +24,9 @@ except Exception:  # pragma: no cover - optional dependency
     Confirmed = None  # type: ignore
 
 from core.logging import log
+from core.http_client import get_http_client
+from core.circuit_breaker import get_breaker
+from core.constants import ETH_RPC_URL, SOLANA_RPC_URL
 
 LAMPORTS_PER_SOL = 1_000_000_000
 
@@ -32,8 +35,8 @@ class BlockchainBalanceService:
     """Retrieve balances for public addresses on supported chains."""
 
     def __init__(self, eth_rpc_url: str | None = None, sol_rpc_url: str | None = None) -> None:
-        self.eth_rpc_url = eth_rpc_url or "https://cloudflare-eth.com"
-        self.sol_rpc_url = sol_rpc_url or "https://api.mainnet-beta.solana.com"
+        self.eth_rpc_url = eth_rpc_url or ETH_RPC_URL
+        self.sol_rpc_url = sol_rpc_url or SOLANA_RPC_URL
         self._eth = Web3(Web3.HTTPProvider(self.eth_rpc_url)) if Web3 else None
         self._sol = Client(self.sol_rpc_url) if Client else None
         log.debug(
@@ -48,7 +51,7 @@ class BlockchainBalanceService:
                 log.error("web3 library unavailable", source="BlockchainBalanceService")
                 return None
             try:
-                wei = self._eth.eth.get_balance(address)
+                wei = get_breaker("eth_rpc").call(self._eth.eth.get_balance, address)
                 return float(self._eth.from_wei(wei, "ether"))
             except Exception as exc:  # pragma: no cover - network failures
                 log.error(
@@ -57,14 +60,13 @@ class BlockchainBalanceService:
                 )
                 return None
         if not self._sol:
-            log.error("solana library unavailable", source="BlockchainBalanceService")
-            return None
+            return self._rpc_sol_balance(address)
         try:
             key = PublicKey(address) if PublicKey else address
             kwargs = {}
             if Confirmed:
                 kwargs["commitment"] = Confirmed
-            resp = self._sol.get_balance(key, **kwargs)
+            resp = get_breaker("solana_rpc").call(self._sol.get_balance, key, **kwargs)
             lamports = resp.get("result", {}).get("value")
             if lamports is not None:
                 return lamports / LAMPORTS_PER_SOL
@@ -74,3 +76,27 @@ class BlockchainBalanceService:
                 source="BlockchainBalanceService",
             )
         return None
+
+    def _rpc_sol_balance(self, address: str) -> Optional[float]:
+        """Plain JSON-RPC ``getBalance`` over the shared HTTP client (no solana-py)."""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getBalance",
+            "params": [address, {"commitment": "confirmed"}],
+        }
+        try:
+            resp = get_http_client().post(
+                self.sol_rpc_url, json=payload, timeout=10, endpoint="solana.getBalance",
+                breaker="solana_rpc",
+            )
+            resp.raise_for_status()
+            lamports = (resp.json().get("result") or {}).get("value")
+            if lamports is not None:
+                return lamports / LAMPORTS_PER_SOL
+        except Exception as exc:  # pragma: no cover - network failures
+            log.error(
+                f"SOL balance fetch failed for {address}: {exc}",
+                source="BlockchainBalanceService",
+            )
+        return None
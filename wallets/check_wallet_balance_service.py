@@ -19,6 +19,7 @@ except Exception:  # pragma: no cover - optional dependency
     Confirmed = None  # type: ignore
 
 from core.logging import log
+from core.constants import ETH_RPC_URL, SOLANA_RPC_URL
 
 LAMPORTS_PER_SOL = 1_000_000_000
 
@@ -29,8 +30,8 @@ class CheckWalletBalanceService:
     def __init__(self,
                  eth_rpc_url: str | None = None,
                  sol_rpc_url: str | None = None) -> None:
-        self.eth_rpc_url = eth_rpc_url or "https://cloudflare-eth.com"
-        self.sol_rpc_url = sol_rpc_url or "https://api.mainnet-beta.solana.com"
+        self.eth_rpc_url = eth_rpc_url or ETH_RPC_URL
+        self.sol_rpc_url = sol_rpc_url or SOLANA_RPC_URL
         self._eth = Web3(Web3.HTTPProvider(self.eth_rpc_url)) if Web3 else None
         self._sol = Client(self.sol_rpc_url) if Client else None
         log.debug(
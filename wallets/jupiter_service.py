@@ -4,20 +4,17 @@ Utility wrapper for interacting with Jupiter Perpetuals API.
 """
 from __future__ import annotations
 
-try:
-    import requests
-except Exception:  # pragma: no cover - optional dependency
-    requests = None
-
 from core.logging import log
 from core.constants import JUPITER_API_BASE
+from core.http_client import HttpClient, get_http_client
 
 
 class JupiterService:
     """Simple HTTP client for Jupiter collateral endpoints."""
 
-    def __init__(self, api_base: str = JUPITER_API_BASE):
+    def __init__(self, api_base: str = JUPITER_API_BASE, http: HttpClient = None):
         self.api_base = api_base.rstrip("/")
+        self.http = http or get_http_client()
 
     def increase_position(self, wallet: str, market: str, collateral_delta: float) -> dict:
         """Call Jupiter's increasePosition endpoint."""
@@ -29,11 +26,13 @@ class JupiterService:
             "size_usd_delta": 0,
         }
         log.debug(f"POST {url} {payload}", source="JupiterService")
-        if not requests:
+        if not self.http.available:
             log.debug("HTTP client unavailable; skipping API call", source="JupiterService")
             return {}
         try:
-            res = requests.post(url, json=payload, timeout=10)
+            # Not idempotent: never retried automatically
+            res = self.http.post(url, json=payload, timeout=10, retries=0,
+                                 endpoint="jupiter.increase_position", breaker="jupiter_perps")
             res.raise_for_status()
             return res.json()
         except Exception as exc:  # pragma: no cover - network failures
@@ -50,11 +49,12 @@ class JupiterService:
             "size_usd_delta": 0,
         }
         log.debug(f"POST {url} {payload}", source="JupiterService")
-        if not requests:
+        if not self.http.available:
             log.debug("HTTP client unavailable; skipping API call", source="JupiterService")
             return {}
         try:
-            res = requests.post(url, json=payload, timeout=10)
+            res = self.http.post(url, json=payload, timeout=10, retries=0,
+                                 endpoint="jupiter.decrease_position", breaker="jupiter_perps")
             res.raise_for_status()
             return res.json()
         except Exception as exc:  # pragma: no cover - network failures
@@ -36,6 +36,7 @@ from wallets.jupiter_service import JupiterService
 from wallets.wallet_service import WalletService
 from wallets.wallet import Wallet
 from core.logging import log
+from core.constants import SOLANA_RPC_URL
 
 LAMPORTS_PER_SOL = 1_000_000_000
 
@@ -43,11 +44,12 @@ LAMPORTS_PER_SOL = 1_000_000_000
 class WalletCore:
     """Central access point for wallet + blockchain operations."""
 
-    def __init__(self, rpc_endpoint: str = "https://api.mainnet-beta.solana.com"):
+    def __init__(self, rpc_endpoint: str = None):
+        rpc_endpoint = rpc_endpoint or SOLANA_RPC_URL
         self.service = WalletService()
         self.rpc_endpoint = rpc_endpoint
         self.client = Client(rpc_endpoint) if Client else None
-        self.balance_service = BlockchainBalanceService() if Client else None
+        self.balance_service = BlockchainBalanceService(sol_rpc_url=rpc_endpoint)
         self.jupiter = JupiterService() if Client else None
         log.debug(
             f"WalletCore initialized with RPC {rpc_endpoint}" + (" (stubbed)" if Client is None else ""),
@@ -70,6 +72,7 @@ class WalletCore:
     def set_rpc_endpoint(self, endpoint: str) -> None:
         """Switch to a different Solana RPC endpoint."""
         self.rpc_endpoint = endpoint
+        self.balance_service = BlockchainBalanceService(sol_rpc_url=endpoint)
         if Client:
             self.client = Client(endpoint)
         log.debug(f"RPC endpoint switched to {endpoint}", source="WalletCore")
@@ -80,8 +83,7 @@ class WalletCore:
     def fetch_balance(self, wallet: Wallet) -> Optional[float]:
         """Fetch the SOL balance for ``wallet`` using the active client."""
         if not Client or not self.client:
-            log.debug("fetch_balance skipped; solana client unavailable", source="WalletCore")
-            return None
+            return self.balance_service.get_balance(wallet.public_address)
         try:
             resp = self.client.get_balance(PublicKey(wallet.public_address), commitment=Confirmed)
             lamports = resp.get("result", {}).get("value")
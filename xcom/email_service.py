@@ -2,8 +2,8 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import smtplib, ssl
 from email.mime.text import MIMEText
+from xcom.smtp_transport import get_smtp_transport
 from core.logging import log
 
 class EmailService:
@@ -11,28 +11,39 @@ class EmailService:
         self.config = config
 
     def send(self, to: str, subject: str, body: str) -> bool:
+        return self.send_many([(to, subject, body)]) == [True]
+
+    def send_many(self, emails) -> list:
+        """Send ``(to, subject, body)`` tuples over one SMTP session; returns one bool per email."""
+        emails = list(emails)
         if not self.config.get("enabled"):
             log.warning("Email provider disabled", source="EmailService")
-            return False
+            return [False] * len(emails)
 
         smtp_cfg = self.config.get("smtp", {})
         server, port, username, password = map(smtp_cfg.get, ["server", "port", "username", "password"])
-        to = to or smtp_cfg.get("default_recipient")
-
-        if not all([server, port, username, password, to]):
+        if not all([server, port, username, password]):
             log.error("Missing email configuration", source="EmailService")
-            return False
+            return [False] * len(emails)
 
-        try:
+        results = [False] * len(emails)
+        batch = []
+        for i, (to, subject, body) in enumerate(emails):
+            to = to or smtp_cfg.get("default_recipient")
+            if not to:
+                log.error("Missing email recipient", source="EmailService")
+                continue
             msg = MIMEText(body, "plain")
             msg["Subject"], msg["From"], msg["To"] = subject, username, to
-            ctx = ssl.create_default_context()
-            with smtplib.SMTP(server, port) as smtp:
-                smtp.starttls(context=ctx)
-                smtp.login(username, password)
-                smtp.send_message(msg)
-            log.success("Email sent", source="EmailService", payload={"to": to})
-            return True
+            batch.append((i, msg))
+
+        try:
+            sent = get_smtp_transport(smtp_cfg).send_each([msg for _, msg in batch]) if batch else []
         except Exception as e:
             log.error(f"Email send failed: {e}", source="EmailService")
-            return False
+            return results
+        for (i, msg), ok in zip(batch, sent):
+            results[i] = ok
+            if ok:
+                log.success("Email sent", source="EmailService", payload={"to": msg["To"]})
+        return results
@@ -0,0 +1,247 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import threading
+import time
+
+from core.logging import log
+
+
+DEFAULT_POLICY = {
+    "window_seconds": 15,
+    # Limits are per minute with a burst allowance. Channel buckets cap each
+    # delivery method; provider buckets cap shared upstream accounts (SMS
+    # rides the SMTP account, voice uses Twilio).
+    "rate_limits": {
+        "channels": {
+            "sms": {"per_minute": 6, "burst": 3},
+            "voice": {"per_minute": 2, "burst": 1},
+            "email": {"per_minute": 20, "burst": 10},
+            "sound": {"per_minute": 6, "burst": 2},
+        },
+        "providers": {
+            "smtp": {"per_minute": 30, "burst": 10},
+            "twilio": {"per_minute": 2, "burst": 1},
+        },
+    },
+}
+
+CHANNEL_PROVIDER = {"sms": "smtp", "email": "smtp", "voice": "twilio"}
+
+LEVEL_RANK = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+
+
+class TokenBucket:
+    """Classic token bucket: ``per_minute`` refill rate, ``burst`` capacity."""
+
+    def __init__(self, per_minute: float, burst: float, clock=time.monotonic):
+        self.clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.configure(per_minute, burst)
+
+    def configure(self, per_minute: float, burst: float):
+        self.rate = max(float(per_minute), 0.0) / 60.0
+        self.capacity = max(float(burst), 1.0)
+        self.tokens = min(self.tokens, self.capacity)
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """Seconds until one token is available (0 when available now)."""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return (1 - self.tokens) / self.rate
+
+    def consume(self):
+        self._refill()
+        self.tokens -= 1
+
+
+class NotificationCoalescer:
+    """
+    Gathers notifications for the same (channel, recipient) over a window and
+    hands the dispatcher a single digest, subject to token-bucket limits per
+    channel and per provider.
+
+    ``submit`` is the downstream callable (usually
+    :meth:`NotificationDispatcher.submit`). ``policy_loader`` returns a dict
+    shaped like :data:`DEFAULT_POLICY`; it is re-read whenever a new batch
+    opens so config changes apply without a restart.
+    """
+
+    def __init__(self, submit, policy_loader=None, clock=time.monotonic):
+        self.submit = submit
+        self.policy_loader = policy_loader or (lambda: DEFAULT_POLICY)
+        self.clock = clock
+        self._lock = threading.RLock()
+        self._batches = {}
+        self._timers = {}
+        self._channel_buckets = {}
+        self._provider_buckets = {}
+        self.policy = DEFAULT_POLICY
+        self.reload_policy()
+
+    # --------------------------------------------------------------
+    def reload_policy(self):
+        try:
+            loaded = self.policy_loader() or {}
+        except Exception as e:
+            log.error(f"❌ Failed to load notification policy: {e}", source="NotificationCoalescer")
+            loaded = {}
+        limits = loaded.get("rate_limits") or {}
+        default_limits = DEFAULT_POLICY["rate_limits"]
+        self.policy = {
+            "window_seconds": float(loaded.get("window_seconds", DEFAULT_POLICY["window_seconds"])),
+            "rate_limits": {
+                "channels": {**default_limits["channels"], **(limits.get("channels") or {})},
+                "providers": {**default_limits["providers"], **(limits.get("providers") or {})},
+            },
+        }
+        with self._lock:
+            for name, bucket in self._channel_buckets.items():
+                cfg = self.policy["rate_limits"]["channels"].get(name)
+                if cfg:
+                    bucket.configure(cfg.get("per_minute", 60), cfg.get("burst", 1))
+            for name, bucket in self._provider_buckets.items():
+                cfg = self.policy["rate_limits"]["providers"].get(name)
+                if cfg:
+                    bucket.configure(cfg.get("per_minute", 60), cfg.get("burst", 1))
+        return self.policy
+
+    def _bucket(self, store: dict, section: str, name: str):
+        if name is None:
+            return None
+        bucket = store.get(name)
+        if bucket is None:
+            cfg = self.policy["rate_limits"][section].get(name)
+            if not cfg:
+                return None
+            bucket = TokenBucket(cfg.get("per_minute", 60), cfg.get("burst", 1), clock=self.clock)
+            store[name] = bucket
+        return bucket
+
+    # --------------------------------------------------------------
+    def add(self, channel: str, level: str = None, subject: str = None, body: str = None,
+            recipient: str = None, initiator: str = None) -> tuple:
+        """Buffer a notification; returns the (channel, recipient) batch key."""
+        key = (channel, recipient or "")
+        with self._lock:
+            batch = self._batches.get(key)
+            if batch is None:
+                self.reload_policy()
+                batch = {"items": [], "opened": self.clock()}
+                self._batches[key] = batch
+                self._arm(key, self.policy["window_seconds"])
+            batch["items"].append({
+                "level": level, "subject": subject, "body": body, "initiator": initiator,
+            })
+        return key
+
+    def pending(self) -> dict:
+        with self._lock:
+            return {key: len(batch["items"]) for key, batch in self._batches.items()}
+
+    def flush(self, key) -> str:
+        """
+        Send the batch for ``key`` if rate limits allow; otherwise re-arm.
+        A batch whose bucket cannot refill is dropped and logged.
+        """
+        with self._lock:
+            self._timers.pop(key, None)
+            batch = self._batches.get(key)
+            if not batch or not batch["items"]:
+                self._batches.pop(key, None)
+                return None
+
+            channel, recipient = key
+            ch_bucket = self._bucket(self._channel_buckets, "channels", channel)
+            pv_bucket = self._bucket(self._provider_buckets, "providers", CHANNEL_PROVIDER.get(channel))
+            buckets = [b for b in (ch_bucket, pv_bucket) if b]
+            wait = max((b.wait_time() for b in buckets), default=0.0)
+            if wait == float("inf"):
+                # A bucket with per_minute 0 never refills; no timer could send this.
+                self._batches.pop(key, None)
+                log.error(
+                    f"🚫 {channel} has no refill rate (per_minute 0); dropped {len(batch['items'])} notifications",
+                    source="NotificationCoalescer",
+                    payload={"channel": channel, "recipient": recipient, "count": len(batch["items"])},
+                )
+                return None
+            if wait > 0:
+                log.warning(
+                    f"⏳ {channel} rate limited; holding {len(batch['items'])} notifications {wait:.1f}s",
+                    source="NotificationCoalescer",
+                )
+                self._arm(key, wait)
+                return None
+
+            for b in buckets:
+                b.consume()
+            self._batches.pop(key, None)
+            digest = self.build_digest(batch["items"])
+
+        return self.submit(channel, digest["level"], digest["subject"], digest["body"],
+                           recipient, digest["initiator"])
+
+    def flush_all(self, force: bool = False) -> list:
+        """Flush every open batch. ``force`` bypasses rate limits (shutdown)."""
+        with self._lock:
+            keys = list(self._batches)
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+        sent = []
+        for key in keys:
+            if force:
+                with self._lock:
+                    batch = self._batches.pop(key, None)
+                if batch and batch["items"]:
+                    digest = self.build_digest(batch["items"])
+                    sent.append(self.submit(key[0], digest["level"], digest["subject"],
+                                            digest["body"], key[1], digest["initiator"]))
+            else:
+                result = self.flush(key)
+                if result is not None:
+                    sent.append(result)
+        return sent
+
+    def _arm(self, key, delay: float):
+        if delay <= 0:
+            delay = 0.0
+        timer = threading.Timer(delay, self._safe_flush, args=(key,))
+        timer.daemon = True
+        self._timers[key] = timer
+        timer.start()
+
+    def _safe_flush(self, key):
+        try:
+            self.flush(key)
+        except Exception as e:
+            log.error(f"❌ Notification flush failed for {key}: {e}", source="NotificationCoalescer")
+
+    @staticmethod
+    def build_digest(items: list) -> dict:
+        """Merge buffered notifications; a single item passes through unchanged."""
+        top = max(items, key=lambda i: LEVEL_RANK.get(str(i.get("level")).upper(), 0))
+        if len(items) == 1:
+            return dict(top)
+
+        lines = []
+        for item in items:
+            text = item.get("body") or item.get("subject") or ""
+            lines.append(f"• [{item.get('level') or '-'}] {text}")
+        initiators = sorted({i.get("initiator") for i in items if i.get("initiator")})
+        return {
+            "level": top.get("level"),
+            "subject": f"{len(items)} alerts: {top.get('subject') or ''}".strip(),
+            "body": "\n".join(lines),
+            "initiator": ",".join(initiators) or None,
+        }
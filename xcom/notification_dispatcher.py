@@ -0,0 +1,224 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import queue
+import random
+import threading
+import time
+
+from core.logging import log
+
+
+class NotificationDispatcher:
+    """
+    Background delivery for XCom notifications.
+
+    Messages are persisted to the ``xcom_outbox`` table first, then handed to a
+    small pool of worker threads per channel (``sms``, ``voice``, ``email``,
+    ``sound``...). A handler returning ``False`` or raising is retried with
+    exponential backoff until ``max_attempts`` is reached, after which the row
+    is marked dead. Every attempt lands in ``xcom_delivery_log``.
+
+    ``handlers`` maps a channel name to ``callable(message: dict) -> bool``.
+    ``batch_handlers`` optionally maps a channel to
+    ``callable(messages: list) -> list[bool]``; its workers then take up to
+    ``batch_size`` queued messages at once, so e.g. an email burst goes out
+    over one SMTP session. Each message is still settled on its own.
+    """
+
+    DEFAULT_WORKERS = {"sms": 2, "voice": 1, "email": 2, "sound": 1}
+
+    def __init__(self, outbox, handlers: dict, workers: dict = None, max_attempts: int = 5,
+                 base_delay: float = 2.0, max_delay: float = 300.0, poll_interval: float = 1.0,
+                 on_dead=None, batch_handlers: dict = None, batch_size: int = 20):
+        self.outbox = outbox
+        self.handlers = dict(handlers)
+        self.batch_handlers = dict(batch_handlers or {})
+        self.batch_size = max(1, int(batch_size))
+        self.workers = dict(self.DEFAULT_WORKERS)
+        self.workers.update(workers or {})
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.on_dead = on_dead
+
+        self._queues = {channel: queue.Queue() for channel in self.handlers}
+        self._queued = set()
+        self._queued_lock = threading.Lock()
+        self._threads = []
+        self._stop = threading.Event()
+        self._idle = threading.Condition()
+        self._active = 0
+
+    # --------------------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return bool(self._threads) and not self._stop.is_set()
+
+    def start(self):
+        if self.running:
+            return self
+        self._stop.clear()
+        self.outbox.requeue_in_flight()
+
+        for channel in self.handlers:
+            for i in range(max(1, int(self.workers.get(channel, 1)))):
+                t = threading.Thread(
+                    target=self._worker, args=(channel,), name=f"xcom-{channel}-{i}", daemon=True
+                )
+                t.start()
+                self._threads.append(t)
+
+        poller = threading.Thread(target=self._poll_due, name="xcom-retry", daemon=True)
+        poller.start()
+        self._threads.append(poller)
+        log.info(f"📡 Notification dispatcher started ({len(self._threads)} threads)",
+                 source="NotificationDispatcher")
+        self._enqueue_due()
+        return self
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+        log.info("🛑 Notification dispatcher stopped", source="NotificationDispatcher")
+
+    def submit(self, channel: str, level: str = None, subject: str = None, body: str = None,
+               recipient: str = None, initiator: str = None, metadata: dict = None) -> str:
+        """Persist a message and schedule it for delivery; returns the outbox id."""
+        if channel not in self.handlers:
+            raise ValueError(f"No handler registered for channel '{channel}'")
+        msg_id = self.outbox.enqueue(channel, level, subject, body, recipient, initiator, metadata)
+        self._schedule(msg_id, channel)
+        return msg_id
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        """Block until no message is queued or being delivered (retries excluded)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._active:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining if remaining is not None else 0.1)
+        return True
+
+    def backoff(self, attempts: int) -> float:
+        """Delay before the next attempt, jittered to avoid synchronized retries."""
+        delay = min(self.max_delay, self.base_delay * (2 ** max(0, attempts - 1)))
+        return delay * random.uniform(0.8, 1.2)
+
+    # --------------------------------------------------------------
+    def _schedule(self, msg_id: str, channel: str):
+        q = self._queues.get(channel)
+        if q is None:
+            return
+        with self._queued_lock:
+            if msg_id in self._queued:
+                return
+            self._queued.add(msg_id)
+        with self._idle:
+            self._active += 1
+            q.put(msg_id)
+
+    def _enqueue_due(self):
+        try:
+            for row in self.outbox.get_due():
+                self._schedule(row["id"], row["channel"])
+        except Exception as e:
+            log.error(f"❌ Failed to scan outbox: {e}", source="NotificationDispatcher")
+
+    def _poll_due(self):
+        while not self._stop.wait(self.poll_interval):
+            self._enqueue_due()
+
+    def _worker(self, channel: str):
+        q = self._queues[channel]
+        while not self._stop.is_set():
+            try:
+                msg_ids = [q.get(timeout=0.2)]
+            except queue.Empty:
+                continue
+            if channel in self.batch_handlers:
+                while len(msg_ids) < self.batch_size:
+                    try:
+                        msg_ids.append(q.get_nowait())
+                    except queue.Empty:
+                        break
+            try:
+                if len(msg_ids) > 1:
+                    self._deliver_batch(channel, msg_ids)
+                else:
+                    self._deliver(channel, msg_ids[0])
+            except Exception as e:
+                log.error(f"❌ Dispatcher worker error: {e}", source="NotificationDispatcher")
+            finally:
+                # Only now may an outbox scan queue these ids again; earlier it
+                # could re-queue a message that failed and is waiting to retry.
+                with self._queued_lock:
+                    self._queued.difference_update(msg_ids)
+                with self._idle:
+                    self._active -= len(msg_ids)
+                    self._idle.notify_all()
+
+    def _deliver(self, channel: str, msg_id: str):
+        message = self.outbox.claim(msg_id)
+        if not message:
+            return  # already claimed, delivered or not yet due
+
+        start = time.perf_counter()
+        error = None
+        try:
+            ok = self.handlers[channel](message)
+            if ok is False:
+                error = "provider returned failure"
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        self._settle(channel, message, error, (time.perf_counter() - start) * 1000)
+
+    def _deliver_batch(self, channel: str, msg_ids: list):
+        messages = [m for m in (self.outbox.claim(msg_id) for msg_id in msg_ids) if m]
+        if not messages:
+            return
+        start = time.perf_counter()
+        try:
+            results = list(self.batch_handlers[channel](messages))
+            errors = [None if ok is not False else "provider returned failure" for ok in results]
+        except Exception as e:
+            errors = [str(e) or e.__class__.__name__] * len(messages)
+        errors += ["provider returned no result"] * (len(messages) - len(errors))
+        duration_ms = (time.perf_counter() - start) * 1000 / len(messages)
+        for message, error in zip(messages, errors):
+            self._settle(channel, message, error, duration_ms)
+
+    def _settle(self, channel: str, message: dict, error, duration_ms: float):
+        """Record one delivery attempt: sent, scheduled for retry, or dead."""
+        msg_id = message["id"]
+        attempt = message["attempts"]
+        if error is None:
+            self.outbox.mark_sent(msg_id)
+            self.outbox.record_attempt(msg_id, channel, attempt, "sent", None, duration_ms)
+            log.success(f"✅ {channel} notification delivered", source="NotificationDispatcher",
+                        payload={"id": msg_id, "attempt": attempt})
+            return
+
+        if attempt >= self.max_attempts:
+            self.outbox.mark_failed(msg_id, error, retry_at=None)
+            self.outbox.record_attempt(msg_id, channel, attempt, "dead", error, duration_ms)
+            log.error(f"💀 {channel} notification gave up after {attempt} attempts: {error}",
+                      source="NotificationDispatcher")
+            if self.on_dead:
+                try:
+                    self.on_dead(message, error)
+                except Exception as e:
+                    log.error(f"❌ on_dead hook failed: {e}", source="NotificationDispatcher")
+            return
+
+        delay = self.backoff(attempt)
+        self.outbox.mark_failed(msg_id, error, retry_at=time.time() + delay)
+        self.outbox.record_attempt(msg_id, channel, attempt, "retry", error, duration_ms)
+        log.warning(f"🔁 {channel} notification failed (attempt {attempt}); retry in {delay:.1f}s",
+                    source="NotificationDispatcher", payload={"id": msg_id, "error": error})
@@ -11,15 +11,26 @@ class SMSService:
         self.email_service = EmailService(config)  # reuse email transport
 
     def send(self, to: str, body: str) -> bool:
+        return self.send_many([(to, body)]) == [True]
+
+    def send_many(self, texts) -> list:
+        """Send ``(to, body)`` tuples through the carrier gateway on one SMTP session."""
+        texts = list(texts)
         if not self.config.get("enabled"):
             log.warning("SMS provider disabled", source="SMSService")
-            return False
+            return [False] * len(texts)
 
         gateway = self.config.get("carrier_gateway")
-        to = to or self.config.get("default_recipient")
-        if not (gateway and to):
-            log.error("Missing SMS config", source="SMSService")
-            return False
+        emails, slots = [], []
+        for i, (to, body) in enumerate(texts):
+            to = to or self.config.get("default_recipient")
+            if not (gateway and to):
+                log.error("Missing SMS config", source="SMSService")
+                continue
+            emails.append((f"{to}@{gateway}", "", body))
+            slots.append(i)
 
-        sms_email = f"{to}@{gateway}"
-        return self.email_service.send(sms_email, "", body)
+        results = [False] * len(texts)
+        for i, ok in zip(slots, self.email_service.send_many(emails) if emails else []):
+            results[i] = ok
+        return results
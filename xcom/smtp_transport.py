@@ -0,0 +1,180 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import smtplib
+import ssl
+import threading
+import time
+
+from core.logging import log
+from core.circuit_breaker import get_breaker
+
+
+class SMTPTransport:
+    """
+    Keeps one authenticated SMTP session open and reuses it across messages.
+
+    The session is dropped proactively after ``idle_timeout`` seconds without
+    traffic (most servers disconnect idle clients anyway) and re-established
+    transparently when the server has closed it, so a burst of alerts pays
+    for a single connect + STARTTLS + login.
+    """
+
+
+    def __init__(self, server: str, port: int, username: str = None, password: str = None,
+                 starttls: bool = True, timeout: float = 30.0, idle_timeout: float = 60.0):
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._smtp = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+        self.connects = 0
+
+    # --------------------------------------------------------------
+    def _connect(self):
+        smtp = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.starttls:
+                smtp.starttls(context=ssl.create_default_context())
+                smtp.ehlo()
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        self._smtp = smtp
+        self.connects += 1
+        log.debug(f"📬 SMTP session opened to {self.server}:{self.port}", source="SMTPTransport")
+
+    def _drop(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except Exception:
+                try:
+                    self._smtp.close()
+                except Exception:
+                    pass
+        self._smtp = None
+
+    @staticmethod
+    def _rejected(error: OSError) -> bool:
+        """
+        True for a server reply refusing one message. ``SMTPException``
+        subclasses ``OSError``, so socket failures and replies arrive in
+        the same ``except``; only a disconnect or a socket error means the
+        session is gone.
+        """
+        return isinstance(error, smtplib.SMTPException) and not isinstance(error, smtplib.SMTPServerDisconnected)
+
+    def _discard(self):
+        """Close a session that just failed without trying a polite QUIT."""
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+        self._smtp = None
+
+    def _session(self):
+        if self._smtp is not None and time.monotonic() - self._last_used > self.idle_timeout:
+            log.debug("SMTP session idle too long; reconnecting", source="SMTPTransport")
+            self._drop()
+        if self._smtp is None:
+            self._connect()
+        return self._smtp
+
+    # --------------------------------------------------------------
+    def send(self, message) -> bool:
+        """Send one ``email.message.Message`` over the shared session."""
+        return self.send_each([message]) == [True]
+
+    def send_many(self, messages) -> int:
+        """Send several messages on one session; returns how many were accepted."""
+        return sum(self.send_each(messages))
+
+    def send_each(self, messages) -> list:
+        """
+        Send ``messages`` on one session and return one bool per message.
+
+        A server reply refusing a message fails only that message. Failing
+        to connect or log in, or losing the session twice in a row, is a
+        transport failure: it feeds the shared ``smtp`` circuit breaker and
+        the rest of the batch is not attempted. While the breaker is open
+        nothing is attempted.
+        """
+        messages = list(messages)
+        results = [False] * len(messages)
+        breaker = get_breaker("smtp")
+        if not breaker.allow():
+            log.warning(f"⛔ SMTP circuit open; retry in {breaker.retry_in():.0f}s", source="SMTPTransport")
+            return results
+        transport_error = None
+        with self._lock:
+            for i, message in enumerate(messages):
+                for attempt in (1, 2):
+                    try:
+                        session = self._session()
+                    except OSError as e:
+                        self._discard()
+                        transport_error = str(e) or e.__class__.__name__
+                        log.error(f"SMTP connect/login failed: {e}", source="SMTPTransport")
+                        break
+                    try:
+                        session.send_message(message)
+                        self._last_used = time.monotonic()
+                        results[i] = True
+                        break
+                    except OSError as e:
+                        if self._rejected(e):
+                            # The server answered (e.g. 550 for one recipient):
+                            # only this message failed and the session is fine.
+                            self._last_used = time.monotonic()
+                            log.error(f"SMTP send rejected: {e}", source="SMTPTransport")
+                            break
+                        self._discard()
+                        if attempt == 2:
+                            transport_error = str(e) or e.__class__.__name__
+                            log.error(f"SMTP send failed after reconnect: {e}", source="SMTPTransport")
+                if transport_error:
+                    break
+        if transport_error:
+            breaker.record_failure(transport_error)
+        else:
+            breaker.record_success()
+        return results
+
+    def close(self):
+        with self._lock:
+            self._drop()
+
+
+_TRANSPORTS = {}
+_TRANSPORTS_LOCK = threading.Lock()
+
+
+def get_smtp_transport(smtp_cfg: dict) -> SMTPTransport:
+    """Shared transport per (server, port, username); settings come from the provider config."""
+    key = (smtp_cfg.get("server"), smtp_cfg.get("port"), smtp_cfg.get("username"))
+    with _TRANSPORTS_LOCK:
+        transport = _TRANSPORTS.get(key)
+        if transport is None or transport.password != smtp_cfg.get("password"):
+            if transport is not None:
+                transport.close()
+            transport = SMTPTransport(
+                smtp_cfg.get("server"),
+                smtp_cfg.get("port"),
+                smtp_cfg.get("username"),
+                smtp_cfg.get("password"),
+                starttls=smtp_cfg.get("starttls", True),
+                idle_timeout=float(smtp_cfg.get("idle_timeout", 60)),
+            )
+            _TRANSPORTS[key] = transport
+        return transport
@@ -1,38 +1,168 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from playsound import playsound
+
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    from playsound import playsound
+except ImportError:  # pragma: no cover - optional dependency
+    playsound = None
 from core.logging import log
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-class SoundService:
-    def __init__(self, sound_file="static/sounds/death_spiral.mp3"):
-        # Always anchor to project root
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.sound_file = os.path.join(base_dir, sound_file)
 
-    def play(self, file_path: str = None):
-        """
-        Plays an MP3 file using `playsound`. Defaults to death_spiral.mp3.
-        """
-        # Respect override or default to init path
-        path = os.path.abspath(file_path) if file_path else self.sound_file
+def _fallback_beep():
+    try:
+        print("\a")  # ASCII bell
+        log.info("Fallback beep emitted", source="SoundService")
+    except Exception as e:
+        log.error(f"Fallback beep failed: {e}", source="SoundService")
 
-        try:
-            if not os.path.isfile(path):
-                raise FileNotFoundError(f"Sound file not found: {path}")
 
+class SoundPlayer:
+    """
+    Single background worker that owns audio playback.
+
+    Requests are queued by clip path. A clip that is already waiting, or that
+    started playing less than ``merge_window`` seconds ago, is merged instead
+    of queued again, and once ``max_pending`` distinct clips are waiting new
+    requests are dropped. A burst of identical alerts therefore plays once.
+    """
+
+    def __init__(self, backend=None, max_pending: int = 4, merge_window: float = 2.0):
+        self.backend = backend or playsound
+        self.max_pending = max_pending
+        self.merge_window = merge_window
+        self._pending = OrderedDict()
+        self._cond = threading.Condition()
+        self._current = None
+        self._current_started = 0.0
+        self._busy = False
+        self._thread = None
+        self.stats = {"played": 0, "merged": 0, "dropped": 0}
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="sound-player", daemon=True)
+            self._thread.start()
+        return self
+
+    def enqueue(self, path: str) -> str:
+        """Queue ``path`` for playback; returns ``queued``, ``merged`` or ``dropped``."""
+        with self._cond:
+            recently_started = (
+                self._current == path
+                and time.monotonic() - self._current_started < self.merge_window
+            )
+            if path in self._pending or recently_started:
+                if path in self._pending:
+                    self._pending[path] += 1
+                self.stats["merged"] += 1
+                return "merged"
+            if len(self._pending) >= self.max_pending:
+                self.stats["dropped"] += 1
+                log.warning(f"🔇 Sound queue full; dropped {os.path.basename(path)}", source="SoundService")
+                return "dropped"
+            self._pending[path] = 1
+            self._cond.notify()
+        self.start()
+        return "queued"
+
+    def wait_idle(self, timeout: float = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                path, _count = self._pending.popitem(last=False)
+                self._current = path
+                self._current_started = time.monotonic()
+                self._busy = True
+            try:
+                self.play_now(path)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def play_now(self, path: str):
+        """Blocking playback on the calling thread."""
+        try:
+            if self.backend is None:
+                raise RuntimeError("playsound is not installed")
             log.info(f"🔊 Playing sound: {path}", source="SoundService")
-            playsound(path)
+            self.backend(path)
+            with self._cond:
+                self.stats["played"] += 1
             log.success("✅ System sound played", source="SoundService")
-
         except Exception as e:
             log.error(f"❌ Playback failed: {e}", source="SoundService")
-            self._fallback_beep()
+            _fallback_beep()
+
+
+_PLAYER = None
+_PLAYER_LOCK = threading.Lock()
+
+
+def get_player() -> SoundPlayer:
+    """Process-wide player shared by every SoundService."""
+    global _PLAYER
+    with _PLAYER_LOCK:
+        if _PLAYER is None:
+            _PLAYER = SoundPlayer()
+        return _PLAYER
+
+
+class SoundService:
+    def __init__(self, sound_file="static/sounds/death_spiral.mp3", player: SoundPlayer = None):
+        # Always anchor to project root
+        self.sound_file = os.path.join(BASE_DIR, sound_file)
+        self.player = player
+
+    def _resolve(self, file_path: str = None) -> str:
+        if not file_path:
+            return self.sound_file
+        path = os.path.abspath(file_path)
+        if not os.path.isfile(path) and not os.path.isabs(file_path):
+            anchored = os.path.join(BASE_DIR, file_path)
+            if os.path.isfile(anchored):
+                return anchored
+        return path
+
+    def play(self, file_path: str = None, block: bool = False):
+        """
+        Plays an MP3 file. Defaults to death_spiral.mp3.
+
+        Playback is handed to the shared background player and this call
+        returns immediately with ``queued``/``merged``/``dropped``. Use
+        ``block=True`` where the process may exit right after (e.g. a fatal
+        startup error) and the sound must finish first.
+        """
+        path = self._resolve(file_path)
+        player = self.player or get_player()
+
+        if not os.path.isfile(path):
+            log.error(f"❌ Playback failed: Sound file not found: {path}", source="SoundService")
+            _fallback_beep()
+            return "missing"
+
+        if block:
+            player.play_now(path)
+            return "played"
+        return player.enqueue(path)
 
     def _fallback_beep(self):
-        try:
-            print("\a")  # ASCII bell
-            log.info("Fallback beep emitted", source="SoundService")
-        except Exception as e:
-            log.error(f"Fallback beep failed: {e}", source="SoundService")
+        _fallback_beep()
@@ -9,6 +9,7 @@ from twilio.rest import Client
 from twilio.twiml.voice_response import VoiceResponse
 
 from core.logging import log
+from core.circuit_breaker import CircuitOpenError, get_breaker
 from flask import current_app
 
 
@@ -33,7 +34,9 @@ class VoiceService:
             vr = VoiceResponse()
             vr.say(message or "Hello from XCom.", voice="alice")
 
-            call = client.calls.create(twiml=str(vr), to=to_phone, from_=from_phone)
+            call = get_breaker("twilio").call(
+                client.calls.create, twiml=str(vr), to=to_phone, from_=from_phone
+            )
 
             log.info(
                 "🔍 Twilio Voice request debug",
@@ -43,6 +46,9 @@ class VoiceService:
 
             return True
 
+        except CircuitOpenError as e:
+            log.warning(f"Voice call skipped: {e}", source="VoiceService")
+            return False
         except Exception as e:
             log.error(f"Voice call failed: {e}", source="VoiceService")
             if hasattr(current_app, "system_core"):
@@ -14,28 +14,59 @@ def _resolve_env(value, env_key):
         return os.getenv(value[2:-1])
     return value
 
+
+def _copy_provider(provider: dict) -> dict:
+    """Copy a cached provider one level deep so callers can't mutate the cache."""
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in provider.items()}
+
+
 class XComConfigService:
     def __init__(self, dl_sys):
         # dl_sys may be either a DataLocker or its DLSystemDataManager.
         # It is stored for use when a Flask ``current_app`` context is not
         # available.
         self.dl_sys = dl_sys
+        # name -> (system var stamp, resolved provider config)
+        self._provider_cache = {}
+
+    def _system_mgr(self):
+        locker = getattr(current_app, "data_locker", None)
+        # Fallback to the object passed into ``__init__`` when Flask
+        # context is unavailable. ``self.dl_sys`` can be either a
+        # DataLocker instance or already the DLSystemDataManager.
+        if not locker or not hasattr(locker, "system"):
+            if hasattr(self.dl_sys, "get_var"):
+                return self.dl_sys
+            if hasattr(self.dl_sys, "system") and hasattr(self.dl_sys.system, "get_var"):
+                return self.dl_sys.system
+            raise Exception("data_locker.system not available")
+        return locker.system
+
+    def get_notification_policy(self) -> dict:
+        """
+        Coalescing window and rate limits stored under
+        ``xcom_providers["notification_policy"]``::
+
+            {"window_seconds": 15,
+             "rate_limits": {"channels": {"sms": {"per_minute": 6, "burst": 3}},
+                             "providers": {"twilio": {"per_minute": 2, "burst": 1}}}}
+
+        Missing keys fall back to the coalescer defaults.
+        """
+        try:
+            config = self._system_mgr().get_var("xcom_providers") or {}
+            return config.get("notification_policy") or {}
+        except Exception as e:
+            log.error(f"Failed to load notification policy: {e}", source="XComConfigService")
+            return {}
 
     def get_provider(self, name: str) -> dict:
         try:
-            locker = getattr(current_app, "data_locker", None)
-            # Fallback to the object passed into ``__init__`` when Flask
-            # context is unavailable. ``self.dl_sys`` can be either a
-            # DataLocker instance or already the DLSystemDataManager.
-            if not locker or not hasattr(locker, "system"):
-                if hasattr(self.dl_sys, "get_var"):
-                    system_mgr = self.dl_sys
-                elif hasattr(self.dl_sys, "system") and hasattr(self.dl_sys.system, "get_var"):
-                    system_mgr = self.dl_sys.system
-                else:
-                    raise Exception("data_locker.system not available")
-            else:
-                system_mgr = locker.system
+            system_mgr = self._system_mgr()
+            stamp = system_mgr.var_stamp() if hasattr(system_mgr, "var_stamp") else None
+            cached = self._provider_cache.get(name)
+            if stamp is not None and cached and cached[0] == stamp:
+                return _copy_provider(cached[1])
 
             config = system_mgr.get_var("xcom_providers") or {}
             provider = config.get(name, {})
@@ -81,6 +112,9 @@ class XComConfigService:
                 provider["default_to_phone"] = _resolve_env(provider.get("default_to_phone"), "TWILIO_TO_PHONE")
                 provider["default_from_phone"] = _resolve_env(provider.get("default_from_phone"), "TWILIO_FROM_PHONE")
 
+            if stamp is not None:
+                self._provider_cache[name] = (stamp, provider)
+                return _copy_provider(provider)
             return provider
         except Exception as e:
             log.error(f"Failed to load provider config for '{name}': {e}", source="XComConfigService")
@@ -1,7 +1,9 @@
 # xcom/xcom_core.py
 import sys
 import os
+import atexit
 import json
+import threading
 from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from xcom.xcom_config_service import XComConfigService
@@ -9,40 +11,200 @@ from xcom.email_service import EmailService
 from xcom.sms_service import SMSService
 from xcom.voice_service import VoiceService
 from xcom.sound_service import SoundService
+from xcom.notification_dispatcher import NotificationDispatcher
+from xcom.notification_coalescer import NotificationCoalescer
 from data.data_locker import DataLocker
+from data.database import DatabaseManager
+from data.dl_monitor_ledger import DLMonitorLedgerManager
+from data.dl_xcom_outbox import DLXComOutboxManager
 from core.logging import log
 
+# One dispatcher (and coalescer) per database file so every XComCore in the
+# process shares the same outbox workers, digest windows and rate limits.
+_DISPATCHERS = {}
+_COALESCERS = {}
+_DISPATCHERS_LOCK = threading.Lock()
+
+LEVEL_CHANNELS = {
+    "HIGH": ("sms", "voice", "sound"),
+    "MEDIUM": ("sms",),
+}
+PROVIDER_FOR_CHANNEL = {"sms": "sms", "voice": "twilio", "email": "email"}
+
+# Levels written straight to the outbox: a digest window held in memory
+# would lose them if the process dies right after (e.g. a death nail).
+URGENT_LEVELS = ("HIGH",)
+
+
+def _flush_on_exit(coalescer):
+    """Hand any open digests to the outbox before the interpreter exits."""
+    try:
+        coalescer.flush_all(force=True)
+    except Exception as e:
+        log.error(f"❌ Failed to flush notifications at exit: {e}", source="XComCore")
+
+
 class XComCore:
-    def __init__(self, dl_sys_data_manager):
+    def __init__(self, dl_sys_data_manager, dispatcher: NotificationDispatcher = None):
         self.config_service = XComConfigService(dl_sys_data_manager)
         self.log = []
+        # Accept either a DataLocker or its DLSystemDataManager; both expose ``db``.
+        self.db = getattr(dl_sys_data_manager, "db", None)
+        self.ledger = None
+        self.outbox = None
+        self.outbox_ledger = None
+        if self.db is not None:
+            try:
+                self.ledger = DLMonitorLedgerManager(self.db)
+                # Dispatcher workers, the retry poller and coalescer timers use
+                # the outbox from their own threads, so it gets its own
+                # connection: commits there never touch a transaction the
+                # caller has open on the DataLocker's connection.
+                self.outbox = DLXComOutboxManager(self._own_connection(self.db))
+                self.outbox_ledger = DLMonitorLedgerManager(self.outbox.db)
+            except Exception as e:
+                log.error(f"⚠️ XCom ledger/outbox unavailable: {e}", source="XComCore")
+        if dispatcher is not None:
+            self.dispatcher = dispatcher
+            self.coalescer = NotificationCoalescer(
+                dispatcher.submit, self.config_service.get_notification_policy
+            )
+        else:
+            self.dispatcher = self._shared_dispatcher()
+            self.coalescer = self._shared_coalescer() if self.dispatcher is not None else None
+
+    @staticmethod
+    def _own_connection(db):
+        path = getattr(db, "db_path", None)
+        if not path or path == ":memory:":
+            return db
+        return DatabaseManager(path)
+
+    # ------------------------------------------------------------------
+    def _shared_dispatcher(self):
+        if self.outbox is None:
+            return None
+        key = getattr(self.db, "db_path", id(self.db))
+        with _DISPATCHERS_LOCK:
+            dispatcher = _DISPATCHERS.get(key)
+            if dispatcher is None:
+                dispatcher = NotificationDispatcher(
+                    self.outbox, self.channel_handlers(), on_dead=self._record_dead_letter,
+                    batch_handlers=self.batch_handlers(),
+                ).start()
+                _DISPATCHERS[key] = dispatcher
+            return dispatcher
+
+    def _shared_coalescer(self):
+        key = getattr(self.db, "db_path", id(self.db))
+        with _DISPATCHERS_LOCK:
+            coalescer = _COALESCERS.get(key)
+            if coalescer is None:
+                coalescer = NotificationCoalescer(
+                    self.dispatcher.submit, self.config_service.get_notification_policy
+                )
+                _COALESCERS[key] = coalescer
+                atexit.register(_flush_on_exit, coalescer)
+            return coalescer
 
+    def channel_handlers(self) -> dict:
+        """Delivery callables used by the dispatcher, one per channel."""
+        return {
+            "sms": lambda msg: SMSService(self.config_service.get_provider("sms") or {}).send(
+                msg.get("recipient"), msg.get("body")
+            ),
+            "voice": lambda msg: VoiceService(self.config_service.get_provider("twilio") or {}).call(
+                msg.get("recipient"), msg.get("body")
+            ),
+            "email": lambda msg: EmailService(self.config_service.get_provider("email") or {}).send(
+                msg.get("recipient"), msg.get("subject"), msg.get("body")
+            ),
+            "sound": self._play_sound,
+        }
+
+    def batch_handlers(self) -> dict:
+        """Handlers for channels that can deliver a burst over one SMTP session."""
+        return {
+            "sms": lambda msgs: SMSService(self.config_service.get_provider("sms") or {}).send_many(
+                [(m.get("recipient"), m.get("body")) for m in msgs]
+            ),
+            "email": lambda msgs: EmailService(self.config_service.get_provider("email") or {}).send_many(
+                [(m.get("recipient"), m.get("subject"), m.get("body")) for m in msgs]
+            ),
+        }
+
+    @staticmethod
+    def _play_sound(msg) -> bool:
+        SoundService().play()
+        return True
+
+    def _record_dead_letter(self, message: dict, error: str):
+        # Runs on a dispatcher worker: write through the outbox's connection.
+        self._write_ledger("Error", ledger=self.outbox_ledger, metadata={
+            "level": message.get("level"),
+            "subject": message.get("subject"),
+            "initiator": message.get("initiator"),
+            "recipient": message.get("recipient"),
+            "results": {message.get("channel"): False, "error": error},
+            "outbox_id": message.get("id"),
+        })
+
+    def _write_ledger(self, status: str, metadata: dict, ledger=None):
+        try:
+            ledger = ledger or self.ledger
+            if ledger is None:
+                from core.constants import DB_PATH
+                ledger = DLMonitorLedgerManager(DataLocker(DB_PATH).db)
+            ledger.insert_ledger_entry("xcom_monitor", status, metadata)
+        except Exception as e:
+            log.error(f"🧨 Failed to write xcom_monitor ledger: {e}", source="XComCore")
+
+    def _channel_enabled(self, channel: str) -> bool:
+        provider = PROVIDER_FOR_CHANNEL.get(channel)
+        if provider is None:
+            return True
+        cfg = self.config_service.get_provider(provider) or {}
+        return cfg.get("enabled", True) is not False
+
+    # ------------------------------------------------------------------
     def send_notification(
             self, level: str, subject: str, body: str, recipient: str = "",
-            initiator: str = "system"
+            initiator: str = "system", blocking: bool = False
     ):
         """
         Dispatches a notification (SMS, email, voice, etc) and writes all info to the monitor ledger,
         always including an explicit 'initiator' field in the metadata.
-        """
-        email_cfg = self.config_service.get_provider("email") or {}
-        sms_cfg = self.config_service.get_provider("sms") or {}
-        voice_cfg = self.config_service.get_provider("twilio") or {}
 
+        By default each channel is handed to the coalescer, which merges
+        notifications for the same recipient within the configured window into
+        one digest and releases it to the background dispatcher under the
+        per-channel/provider rate limits; results hold ``"queued"`` per
+        channel. ``HIGH`` notifications skip the coalescer and are written to
+        the durable outbox at once. Pass ``blocking=True`` (or run without a
+        database) to deliver inline.
+        """
+        channels = LEVEL_CHANNELS.get(level, ("email",))
         results = {"email": False, "sms": False, "voice": False, "sound": None}
         error_msg = None
 
         try:
-            if level == "HIGH":
-                results["sms"] = SMSService(sms_cfg).send(recipient, body)
-                results["voice"] = VoiceService(voice_cfg).call(recipient, body)
-                results["sound"] = SoundService().play()
-            elif level == "MEDIUM":
-                results["sms"] = SMSService(sms_cfg).send(recipient, body)
+            if self.coalescer is not None and not blocking:
+                for channel in channels:
+                    if not self._channel_enabled(channel):
+                        log.warning(f"{channel} provider disabled; not queued", source="XComCore")
+                        continue
+                    if str(level).upper() in URGENT_LEVELS:
+                        self.dispatcher.submit(channel, level, subject, body, recipient, initiator)
+                    else:
+                        self.coalescer.add(channel, level, subject, body, recipient, initiator)
+                    results[channel] = "queued"
+                log.success(f"📮 Notification queued [{level}]", source="XComCore", payload=results)
             else:
-                results["email"] = EmailService(email_cfg).send(recipient, subject, body)
-
-            log.success(f"✅ Notification dispatched [{level}]", source="XComCore", payload=results)
+                handlers = self.channel_handlers()
+                message = {"level": level, "subject": subject, "body": body, "recipient": recipient}
+                for channel in channels:
+                    results[channel] = handlers[channel](message)
+                log.success(f"✅ Notification dispatched [{level}]", source="XComCore", payload=results)
 
         except Exception as e:
             error_msg = str(e)
@@ -60,26 +222,14 @@ class XComCore:
         })
 
         # 🧾 Write to monitor ledger with initiator
-        try:
-            from data.data_locker import DataLocker
-            from core.constants import DB_PATH
-            from data.dl_monitor_ledger import DLMonitorLedgerManager
-
-            dl = DataLocker(DB_PATH)
-            ledger = DLMonitorLedgerManager(dl.db)
-            status = "Success" if any(v is True for v in results.values()) else "Error"
-
-            metadata = {
-                "level": level,
-                "subject": subject,
-                "initiator": initiator,
-                "recipient": recipient,
-                "results": results
-            }
-            ledger.insert_ledger_entry("xcom_monitor", status, metadata)
-
-        except Exception as e:
-            log.error(f"🧨 Failed to write xcom_monitor ledger: {e}", source="XComCore")
+        delivered = any(v is True or v == "queued" for v in results.values())
+        self._write_ledger("Success" if delivered else "Error", {
+            "level": level,
+            "subject": subject,
+            "initiator": initiator,
+            "recipient": recipient,
+            "results": results
+        })
 
         return results
 